@@ -1,7 +1,13 @@
 #!/bin/bash
 
+echo Math func tests
+python agrow/math/func/func_tests.py
+
+echo Math linalg tests
+python agrow/math/linalg/linalg_tests.py
+
 echo Tokenizers tests
-python tecode/tokenizers/tokenizers_tests.py
+python agrow/text/tokenizers/tokenizers_tests.py
 
 echo Vectorizers tests
-python tecode/vectorizers/vectorizers_tests.py
+python -m agrow.text.vectorizers.vectorizers_tests
@@ -15,7 +15,38 @@ from .math import (
     atan,
     sin,
     cos,
-    tan
+    tan,
+    sincos,
+    vfabs,
+    vceil,
+    vfloor,
+    vfmod,
+    vsqrt,
+    vexp,
+    vlog,
+    vpow,
+    vasin,
+    vacos,
+    vatan,
+    vsin,
+    vcos,
+    vtan,
+    vsincos,
+    PRECISIONS,
+    get_precision,
+    set_precision,
+    precision,
+    Vector,
+    Matrix,
+    asvector,
+    asmatrix,
+    dot,
+    axpy,
+    gemv,
+    gemm,
+    CSR_DTYPES,
+    CSRMatrix,
+    ascsr
 )
 
 
@@ -35,5 +66,36 @@ __all__ = [
     "atan",
     "sin",
     "cos",
-    "tan"
+    "tan",
+    "sincos",
+    "vfabs",
+    "vceil",
+    "vfloor",
+    "vfmod",
+    "vsqrt",
+    "vexp",
+    "vlog",
+    "vpow",
+    "vasin",
+    "vacos",
+    "vatan",
+    "vsin",
+    "vcos",
+    "vtan",
+    "vsincos",
+    "PRECISIONS",
+    "get_precision",
+    "set_precision",
+    "precision",
+    "Vector",
+    "Matrix",
+    "asvector",
+    "asmatrix",
+    "dot",
+    "axpy",
+    "gemv",
+    "gemm",
+    "CSR_DTYPES",
+    "CSRMatrix",
+    "ascsr"
 ]
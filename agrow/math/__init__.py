@@ -14,7 +14,40 @@ from .func import (
     atan,
     sin,
     cos,
-    tan
+    tan,
+    sincos,
+    vfabs,
+    vceil,
+    vfloor,
+    vfmod,
+    vsqrt,
+    vexp,
+    vlog,
+    vpow,
+    vasin,
+    vacos,
+    vatan,
+    vsin,
+    vcos,
+    vtan,
+    vsincos,
+    PRECISIONS,
+    get_precision,
+    set_precision,
+    precision
+)
+from .linalg import (
+    Vector,
+    Matrix,
+    asvector,
+    asmatrix,
+    dot,
+    axpy,
+    gemv,
+    gemm,
+    CSR_DTYPES,
+    CSRMatrix,
+    ascsr
 )
 
 __all__ = [
@@ -33,5 +66,36 @@ __all__ = [
     "atan",
     "sin",
     "cos",
-    "tan"
+    "tan",
+    "sincos",
+    "vfabs",
+    "vceil",
+    "vfloor",
+    "vfmod",
+    "vsqrt",
+    "vexp",
+    "vlog",
+    "vpow",
+    "vasin",
+    "vacos",
+    "vatan",
+    "vsin",
+    "vcos",
+    "vtan",
+    "vsincos",
+    "PRECISIONS",
+    "get_precision",
+    "set_precision",
+    "precision",
+    "Vector",
+    "Matrix",
+    "asvector",
+    "asmatrix",
+    "dot",
+    "axpy",
+    "gemv",
+    "gemm",
+    "CSR_DTYPES",
+    "CSRMatrix",
+    "ascsr"
 ]
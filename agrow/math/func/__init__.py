@@ -14,7 +14,27 @@ from .func import (
     atan,
     sin,
     cos,
-    tan
+    tan,
+    sincos,
+    vfabs,
+    vceil,
+    vfloor,
+    vfmod,
+    vsqrt,
+    vexp,
+    vlog,
+    vpow,
+    vasin,
+    vacos,
+    vatan,
+    vsin,
+    vcos,
+    vtan,
+    vsincos,
+    PRECISIONS,
+    get_precision,
+    set_precision,
+    precision
 )
 
 __all__ = [
@@ -33,5 +53,25 @@ __all__ = [
     "atan",
     "sin",
     "cos",
-    "tan"
+    "tan",
+    "sincos",
+    "vfabs",
+    "vceil",
+    "vfloor",
+    "vfmod",
+    "vsqrt",
+    "vexp",
+    "vlog",
+    "vpow",
+    "vasin",
+    "vacos",
+    "vatan",
+    "vsin",
+    "vcos",
+    "vtan",
+    "vsincos",
+    "PRECISIONS",
+    "get_precision",
+    "set_precision",
+    "precision"
 ]
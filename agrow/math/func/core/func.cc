@@ -1,45 +1,541 @@
 #include "func.h"
 
-long double ag_asin(double source) {
-    long double result = source;
-
-    if (source > AG_ADOMAIN || source < -AG_ADOMAIN)
-        result = AG_NAN;
-    else if (source == AG_ADOMAIN)
-        result = AG_PI / 2;
-    else if (source == -AG_ADOMAIN)
-        result = -(AG_PI / 2);
-    else {
-        long int n = 1;
-        long double term = source;
-
-        while (!(ag_is_zero(term))) {
-            term *= ((source * source) * (2 * n - 1) * (2 * n - 1)) /
-                    ((2 * n) * (2 * n + 1));
-            result += term;
-            n++;
+#include <string.h>
+
+/*
+    Coefficients of the minimax polynomials used by ag_exp and ag_log
+    (taken from fdlibm e_exp.c and e_log.c). Both kernels stay within 1 ULP
+    of error over the whole double domain.
+*/
+static const double AG_EXP_P[] = {
+    1.66666666666666019037e-01, -2.77777777770155933842e-03,
+    6.61375632143793436117e-05, -1.65339022054652515390e-06,
+    4.13813679705723846039e-08,
+};
+
+static const double AG_LOG_LG[] = {
+    6.666666666666735130e-01, 3.999999999940941908e-01,
+    2.857142874366239149e-01, 2.222219843214978396e-01,
+    1.818357216161805012e-01, 1.531383769920937332e-01,
+    1.479819860511658591e-01,
+};
+
+/*
+    Series coefficients of the extended precision kernels: 1 / n! for exp and
+    1 / (2n + 1) for log (2 * atanh(s) series)
+*/
+static const long double AG_EXPL_C[] = {
+    1.000000000000000000000e+0L,
+    1.000000000000000000000e+0L,
+    5.000000000000000000000e-1L,
+    1.666666666666666666667e-1L,
+    4.166666666666666666667e-2L,
+    8.333333333333333333333e-3L,
+    1.388888888888888888889e-3L,
+    1.984126984126984126984e-4L,
+    2.480158730158730158730e-5L,
+    2.755731922398589065256e-6L,
+    2.755731922398589065256e-7L,
+    2.505210838544171877505e-8L,
+    2.087675698786809897921e-9L,
+    1.605904383682161459939e-10L,
+    1.147074559772972471385e-11L,
+    7.647163731819816475901e-13L,
+    4.779477332387385297438e-14L,
+};
+
+static const long double AG_LOGL_C[] = {
+    1.000000000000000000000e+0L,
+    3.333333333333333333333e-1L,
+    2.000000000000000000000e-1L,
+    1.428571428571428571429e-1L,
+    1.111111111111111111111e-1L,
+    9.090909090909090909091e-2L,
+    7.692307692307692307692e-2L,
+    6.666666666666666666667e-2L,
+    5.882352941176470588235e-2L,
+    5.263157894736842105263e-2L,
+    4.761904761904761904762e-2L,
+    4.347826086956521739130e-2L,
+    4.000000000000000000000e-2L,
+};
+
+/*
+    Coefficients of the minimax polynomials used by trigonometry kernels on
+    [-pi/4, pi/4] (taken from fdlibm k_sin.c, k_cos.c and s_atan.c). Kernels
+    stay within 1 ULP.
+*/
+static const double AG_SIN_S[] = {
+    -1.66666666666666324348e-01, 8.33333333332248946124e-03,
+    -1.98412698298579493134e-04, 2.75573137070700676789e-06,
+    -2.50507602534068634195e-08, 1.58969099521155010221e-10,
+};
+
+static const double AG_COS_C[] = {
+    4.16666666666666019037e-02, -1.38888888888741095749e-03,
+    2.48015872894767294178e-05, -2.75573143513906633035e-07,
+    2.08757232129817482790e-09, -1.13596475577881948265e-11,
+};
+
+// atan(0.5), atan(1), atan(1.5), atan(inf) split into high and low parts
+static const double AG_ATAN_HI[] = {
+    4.63647609000806093515e-01, 7.85398163397448278999e-01,
+    9.82793723247329054082e-01, 1.57079632679489655800e+00,
+};
+
+static const double AG_ATAN_LO[] = {
+    2.26987774529616870924e-17, 3.06161699786838301793e-17,
+    1.39033110312309984516e-17, 6.12323399573676603587e-17,
+};
+
+static const double AG_ATAN_T[] = {
+    3.33333333333329318027e-01, -1.99999999998764832476e-01,
+    1.42857142725034663711e-01, -1.11111104054623557880e-01,
+    9.09088713343650656196e-02, -7.69187620504482999495e-02,
+    6.66107313738753120669e-02, -5.83357013379057348645e-02,
+    4.97687799461593236017e-02, -3.65315727442169155270e-02,
+    1.62858201153657823623e-02,
+};
+
+/*
+    Binary digits of 4 / pi, i.e. 4 / pi = sum(AG_4_PI[i] * 2^(-64 * i)). Used
+    by Payne-Hanek reduction of huge trigonometry arguments.
+*/
+static const uint64_t AG_4_PI[] = {
+    0x0000000000000001ULL, 0x45f306dc9c882a53ULL,
+    0xf84eafa3ea69bb81ULL, 0xb6c52b3278872083ULL,
+    0xfca2c757bd778ac3ULL, 0x6e48dc74849ba5c0ULL,
+    0x0c925dd413a32439ULL, 0xfc3bd63962534e7dULL,
+    0xd1046bea5d768909ULL, 0xd338e04d68befc82ULL,
+    0x7323ac7306a673e9ULL, 0x3908bf177bf25076ULL,
+    0x3ff12fffbc0b301fULL, 0xde5e2316b414da3eULL,
+    0xda6cfd9e4f96136eULL, 0x9e8c7ecd3cbfd45aULL,
+    0xea4f758fd7cbe2f6ULL, 0x7a0e73ef14a525d4ULL,
+    0xd7f6bf623f1aba10ULL, 0xac06608df8f6d757ULL,
+};
+
+/*
+    Coefficients of the "fast" precision tier kernels (near-minimax fits made
+    for float32-level accuracy): exp(r) on [-ln(2)/2, ln(2)/2], sin(x) / x and
+    cos(x) in x^2 on [-pi/4, pi/4] and atanh(s) / s in s^2 for log
+*/
+static const double AG_EXP_FAST_P[] = {
+    1.0000000716543664, 0.9999996919773688, 0.4999889485335001,
+    0.16667574776848942, 0.04191538181330595, 0.008297651843655532,
+};
+
+static const double AG_SIN_FAST_S[] = {
+    0.9999999967617963, -0.16666650224232374, 0.008332016452755874,
+    -0.0001950182198046933,
+};
+
+static const double AG_COS_FAST_C[] = {
+    0.999999967386256, -0.4999984243413192, 0.041654419558410004,
+    -0.0013579404044480544,
+};
+
+static const double AG_LOG_FAST_C[] = {
+    0.9999999993106659, 0.33333407975282975, 0.19987397475718682,
+    0.1496282505440413,
+};
+
+/*
+    Taylor series coefficients of the "exact" precision tier sin and cos
+    kernels: (-1)^k / (2k + 1)! and (-1)^k / (2k)!
+*/
+static const long double AG_SINL_C[] = {
+    1.000000000000000000000e+0L,
+    -1.666666666666666666667e-1L,
+    8.333333333333333333333e-3L,
+    -1.984126984126984126984e-4L,
+    2.755731922398589065256e-6L,
+    -2.505210838544171877505e-8L,
+    1.605904383682161459939e-10L,
+    -7.647163731819816475901e-13L,
+    2.811457254345520763199e-15L,
+    -8.220635246624329716956e-18L,
+    1.957294106339126123085e-20L,
+};
+
+static const long double AG_COSL_C[] = {
+    1.000000000000000000000e+0L,
+    -5.000000000000000000000e-1L,
+    4.166666666666666666667e-2L,
+    -1.388888888888888888889e-3L,
+    2.480158730158730158730e-5L,
+    -2.755731922398589065256e-7L,
+    2.087675698786809897921e-9L,
+    -1.147074559772972471385e-11L,
+    4.779477332387385297438e-14L,
+    -1.561920696858622646222e-16L,
+    4.110317623312164858478e-19L,
+};
+
+static inline uint64_t ag_bits(double source) {
+    uint64_t bits;
+    memcpy(&bits, &source, sizeof(bits));
+    return bits;
+}
+
+static inline double ag_from_bits(uint64_t bits) {
+    double result;
+    memcpy(&result, &bits, sizeof(result));
+    return result;
+}
+
+/*
+    Returns 2^k for -1022 <= k <= 1023 (normal doubles only)
+*/
+static inline double ag_pow2(int k) {
+    return ag_from_bits((uint64_t)(k + 1023) << 52);
+}
+
+/*
+    Returns source * 2^k for any k which may be produced by the exp range
+    reduction (result could be subnormal or overflow)
+*/
+static inline double ag_ldexp(double source, int k) {
+    if (k > 1023) return source * 2.0 * ag_pow2(k - 1);
+    if (k < -1021) return source * ag_pow2(k + 1000) * ag_pow2(-1000);
+    return source * ag_pow2(k);
+}
+
+// rounds to the nearest integer without branches, |source| should be < 2^51
+static inline int ag_round(double source) {
+    return (int)((source + AG_ROUND_MAGIC) - AG_ROUND_MAGIC);
+}
+
+// sin(n * pi / 2 + x) given s = sin(x) and c = cos(x) (branchless quadrant select)
+static inline double ag_quadrant_sin(int n, double s, double c) {
+    const double values[] = {s, c};
+    return values[n & 1] * (1 - (n & 2));
+}
+
+/*
+    Splits finite positive source into 2^k * m where m is in [sqrt(2)/2, sqrt(2))
+    and returns m - 1
+*/
+static inline double ag_log_reduce(double source, int* k) {
+    uint64_t bits = ag_bits(source);
+    *k = 0;
+
+    // subnormal numbers are normalized first
+    if (bits < AG_MIN_NORMAL_BITS) {
+        bits = ag_bits(source * AG_TWO54);
+        *k = -54;
+    }
+
+    *k += (int)(bits >> 52) - 1023;
+    bits &= AG_MANTISSA_MASK;
+
+    // if mantissa is above sqrt(2) it's halved, i.e. exponent incremented
+    uint64_t carry = (bits + 0x00095f6400000000ULL) & 0x0010000000000000ULL;
+    *k += (int)(carry >> 52);
+
+    return ag_from_bits(bits | (carry ^ 0x3ff0000000000000ULL)) - 1.0;
+}
+
+/*
+    Extended precision (long double) log with a fixed number of terms. Used
+    by ag_pow where an error of log(base) is amplified by exp.
+*/
+static long double ag_logl(double source) {
+    int k;
+    long double f = ag_log_reduce(source, &k);
+    long double s = f / (2.0L + f), z = s * s;
+    // 2 * atanh(s) series, |s| < 0.1716 so 13 terms are below 2^-64
+    long double series = AG_LOGL_C[12];
+
+    for (int n = 11; n >= 0; n--) series = series * z + AG_LOGL_C[n];
+
+    return k * AG_LN2L + 2.0L * s * series;
+}
+
+/*
+    Extended precision (long double) exp with a fixed number of terms. Source
+    should be within [AG_EXP_UNDERFLOW, AG_EXP_OVERFLOW].
+*/
+static double ag_expl(long double source) {
+    int k = ag_round((double)(source * AG_INV_LN2));
+    long double r = (source - k * AG_LN2_HI) - k * AG_LN2L_LO;
+    // |r| < ln(2) / 2 so 17 terms are below 2^-64
+    long double result = AG_EXPL_C[16];
+
+    for (int n = 15; n >= 0; n--) result = result * r + AG_EXPL_C[n];
+
+    // scaling is done in long double, so result rounds to double only once
+    return (double)(result * ag_pow2(k / 2) * ag_pow2(k - k / 2));
+}
+
+// branchless absolute value for internal use
+static inline double ag_dabs(double source) {
+    return ag_from_bits(ag_bits(source) & ~(1ULL << 63));
+}
+
+static inline int ag_exponent(double source) {
+    return (int)((ag_bits(source) >> 52) & 0x7ff);
+}
+
+// (hi << shift) | (lo >> (64 - shift)) which is defined for shift == 0 too
+static inline uint64_t ag_shift_in(uint64_t hi, uint64_t lo, unsigned shift) {
+    return shift ? (hi << shift) | (lo >> (64 - shift)) : hi;
+}
+
+/*
+    Payne-Hanek reduction of positive source >= AG_PIO2_MEDIUM. Multiplies
+    mantissa by the needed 192 bits of 4 / pi, so source = (j + z) * pi / 4,
+    and returns reduced argument in [-pi/4, pi/4] with a quadrant in n
+*/
+static long double ag_rem_pio2_large(double source, int* n) {
+    uint64_t mantissa = (ag_bits(source) & AG_MANTISSA_MASK) | (1ULL << 52);
+    int exp = ag_exponent(source) - 1023 - 52;
+
+    // take digits so leading digit of the product has exponent -61
+    unsigned digit = (exp + 61) / 64, shift = (exp + 61) % 64;
+    uint64_t z0 = ag_shift_in(AG_4_PI[digit], AG_4_PI[digit + 1], shift);
+    uint64_t z1 = ag_shift_in(AG_4_PI[digit + 1], AG_4_PI[digit + 2], shift);
+    uint64_t z2 = ag_shift_in(AG_4_PI[digit + 2], AG_4_PI[digit + 3], shift);
+
+    unsigned __int128 p1 = (unsigned __int128)z1 * mantissa;
+    uint64_t z2hi = (uint64_t)(((unsigned __int128)z2 * mantissa) >> 64);
+    uint64_t lo = (uint64_t)p1 + z2hi;
+    uint64_t hi = z0 * mantissa + (uint64_t)(p1 >> 64) + (lo < z2hi);
+
+    // top 3 bits are the octant, the rest is a fraction
+    uint64_t octant = hi >> 61;
+    hi = ag_shift_in(hi, lo, 3);
+    lo <<= 3;
+
+    // odd octants are mapped to the origin of the next one, i.e. fraction
+    // becomes 1 - fraction (computed in integers to avoid cancellation)
+    bool negative = octant & 1;
+    if (negative) {
+        octant++;
+        hi = ~hi;
+        lo = ~lo + 1;
+        hi += (lo == 0);
+    }
+
+    // normalized 64 top bits of the fraction are exact in long double, so
+    // the reduced argument keeps precision beyond double
+    long double z = 0.0L;
+    if (hi | lo) {
+        unsigned lz = hi ? __builtin_clzll(hi) : 64 + __builtin_clzll(lo);
+        uint64_t frac = (lz < 64) ? ag_shift_in(hi, lo, lz) : lo << (lz - 64);
+        z = (long double)frac * ag_pow2(-64 - (int)lz);
+    }
+
+    *n = (int)((octant >> 1) & 3);
+    return (negative ? -z : z) * AG_PIO4L;
+}
+
+/*
+    Reduces source modulo pi / 2, i.e. source = n * pi / 2 + (y0 + y1), where
+    |y0 + y1| <= pi / 4 and y1 is the tail of y0. Returns n
+*/
+static int ag_rem_pio2(double source, double* y0, double* y1) {
+    double abs = ag_dabs(source);
+
+    if (abs <= AG_PI / 4) {
+        *y0 = source;
+        *y1 = 0.0;
+        return 0;
+    }
+
+    if (abs >= AG_PIO2_MEDIUM) {
+        int n;
+        long double y = ag_rem_pio2_large(abs, &n);
+        y = (source < 0) ? -y : y;
+        *y0 = (double)y;
+        *y1 = (double)(y - *y0);
+        return (source < 0) ? -n : n;
+    }
+
+    // Cody-Waite reduction by pi / 2 split in 33 bit parts. One step is
+    // enough unless there is a cancellation
+    int n = ag_round(source * AG_INV_PIO2);
+    double fn = n;
+    double r = source - fn * AG_PIO2_1;
+    double w = fn * AG_PIO2_1T;
+    int exp = ag_exponent(source);
+
+    *y0 = r - w;
+    if (exp - ag_exponent(*y0) > 16) {
+        double t = r;
+        w = fn * AG_PIO2_2;
+        r = t - w;
+        w = fn * AG_PIO2_2T - ((t - r) - w);
+        *y0 = r - w;
+
+        if (exp - ag_exponent(*y0) > 49) {
+            t = r;
+            w = fn * AG_PIO2_3;
+            r = t - w;
+            w = fn * AG_PIO2_3T - ((t - r) - w);
+            *y0 = r - w;
         }
     }
+    *y1 = (r - *y0) - w;
 
-    return result;
+    return n;
 }
 
-long double ag_acos(double source) {
-    double result = (AG_PI / 2) - ag_asin(source);
-    return result;
+// sin(x + y) for |x + y| <= pi / 4
+static inline double ag_kernel_sin(double x, double y) {
+    double z = x * x;
+    double v = z * x;
+    double r = AG_SIN_S[1] +
+               z * (AG_SIN_S[2] +
+                    z * (AG_SIN_S[3] + z * (AG_SIN_S[4] + z * AG_SIN_S[5])));
+
+    return x - ((z * (0.5 * y - v * r) - y) - v * AG_SIN_S[0]);
+}
+
+// cos(x + y) for |x + y| <= pi / 4
+static inline double ag_kernel_cos(double x, double y) {
+    double z = x * x;
+    double w = z * z;
+    double r = z * (AG_COS_C[0] + z * (AG_COS_C[1] + z * AG_COS_C[2])) +
+               w * w * (AG_COS_C[3] + z * (AG_COS_C[4] + z * AG_COS_C[5]));
+    double hz = 0.5 * z;
+    w = 1.0 - hz;
+
+    return w + (((1.0 - w) - hz) + (z * r - x * y));
+}
+
+/*
+    Cheaper reduction for the "fast" tier: a single Cody-Waite step (good to
+    about 85 bits unless there is a cancellation), the full reduction is
+    used for huge arguments only
+*/
+static inline int ag_rem_pio2_fast(double source, double* y) {
+    if (ag_dabs(source) >= AG_PIO2_MEDIUM) {
+        double tail;
+        int n = ag_rem_pio2(source, y, &tail);
+        *y += tail;
+        return n;
+    }
+
+    int n = ag_round(source * AG_INV_PIO2);
+    *y = (source - n * AG_PIO2_1) - n * AG_PIO2_1T;
+    return n;
+}
+
+static inline double ag_kernel_sin_fast(double x) {
+    double z = x * x;
+    return x * (AG_SIN_FAST_S[0] +
+                z * (AG_SIN_FAST_S[1] + z * (AG_SIN_FAST_S[2] + z * AG_SIN_FAST_S[3])));
+}
+
+static inline double ag_kernel_cos_fast(double x) {
+    double z = x * x;
+    return AG_COS_FAST_C[0] +
+           z * (AG_COS_FAST_C[1] + z * (AG_COS_FAST_C[2] + z * AG_COS_FAST_C[3]));
+}
+
+// sin(x) and cos(x) in extended precision for x = y0 + y1, |x| <= pi / 4
+static inline void ag_kernel_sincosl(double y0, double y1, long double* sin,
+                                     long double* cos) {
+    long double x = (long double)y0 + y1, z = x * x;
+    long double s = AG_SINL_C[10], c = AG_COSL_C[10];
+
+    for (int k = 9; k >= 0; k--) {
+        s = s * z + AG_SINL_C[k];
+        c = c * z + AG_COSL_C[k];
+    }
+
+    *sin = x * s;
+    *cos = c;
+}
+
+/*
+    Handles special cases of pow(base, exp). Returns true if result is known
+    already, otherwise makes base positive and stores a sign of the result
+*/
+static inline bool ag_pow_special(double* base, double exp, double* result,
+                                  double* sign) {
+    if (exp == 0 || *base == 1) {
+        *result = 1.0;
+        return true;
+    }
+    if (*base != *base || exp != exp) {
+        *result = AG_NAN;
+        return true;
+    }
+
+    // every double above 2^53 is an even integer
+    bool is_int = ag_dabs(exp) >= AG_TWO53 || exp == (double)(int64_t)exp;
+    bool is_odd = is_int && ag_dabs(exp) < AG_TWO53 && ((int64_t)exp & 1);
+    *sign = 1.0;
+
+    if (*base < 0) {
+        if (!is_int) {
+            *result = AG_NAN;
+            return true;
+        }
+        *base = -*base;
+        *sign = is_odd ? -1.0 : 1.0;
+    }
+
+    if (*base == 0) {
+        *result = *sign * ((exp < 0) ? AG_INF : 0.0);
+        return true;
+    }
+
+    return false;
 }
 
-long double ag_atan(double source) {
-    long double atan = ag_acos(1 / ag_sqrt(1 + source * source));
-    if (source <= AG_EPS) atan = AG_EPS;
-    return atan;
+static inline double ag_datan(double source) {
+    if (source != source) return source;
+
+    double x = ag_dabs(source);
+    int id;
+
+    if (x >= AG_ATAN_MAX) {
+        x = AG_ATAN_HI[3] + AG_ATAN_LO[3];
+        return (source < 0) ? -x : x;
+    }
+
+    // reduce x to [-7/16, 7/16] using atan(x) = atan(c) + atan((x - c) / (1 + xc))
+    if (x < 0.4375) {
+        id = -1;
+        x = source;
+    } else if (x < 0.6875) {
+        id = 0;
+        x = (2.0 * x - 1.0) / (2.0 + x);
+    } else if (x < 1.1875) {
+        id = 1;
+        x = (x - 1.0) / (x + 1.0);
+    } else if (x < 2.4375) {
+        id = 2;
+        x = (x - 1.5) / (1.0 + 1.5 * x);
+    } else {
+        id = 3;
+        x = -1.0 / x;
+    }
+
+    double z = x * x;
+    double w = z * z;
+    double s1 = z * (AG_ATAN_T[0] +
+                     w * (AG_ATAN_T[2] +
+                          w * (AG_ATAN_T[4] +
+                               w * (AG_ATAN_T[6] +
+                                    w * (AG_ATAN_T[8] + w * AG_ATAN_T[10])))));
+    double s2 = w * (AG_ATAN_T[1] +
+                     w * (AG_ATAN_T[3] +
+                          w * (AG_ATAN_T[5] + w * (AG_ATAN_T[7] + w * AG_ATAN_T[9]))));
+
+    if (id < 0) return x - x * (s1 + s2);
+
+    z = AG_ATAN_HI[id] - ((x * (s1 + s2) - AG_ATAN_LO[id]) - x);
+    return (source < 0) ? -z : z;
 }
 
 bool ag_is_zero(double source) {
-    return ag_fabs(source) < AG_EPS * AG_EPS;
+    return ag_dabs(source) < AG_EPS * AG_EPS;
 }
 
-long double ag_fabs(double source) {
+static inline double ag_dfabs(double source) {
     return (source > 0) ? source : (-source);
 }
 
@@ -47,124 +543,352 @@ long int ag_abs(long int source) {
     return (source > 0) ? source : (-source);
 }
 
-long double ag_sqrt(double source) {
-    double result = 1;
-    double new_root = AG_MAX_DOUBLE;
+static inline double ag_dsqrt(double source) {
+    if (source < 0) return AG_NAN;
 
-    do {
-        new_root = (result + source / result) / 2;
-        if (ag_fabs(result - new_root) < AG_EPS) break;
-        else result = new_root;
-    } while (!(ag_fabs(result - new_root) > AG_EPS));
+    // hardware square root (a single, correctly rounded instruction), negative
+    // numbers are handled above, so a libm call to set errno is never made
+    return __builtin_sqrt(source);
+}
 
-    return result;
+static inline double ag_dasin(double source) {
+    if (!(ag_dabs(source) <= AG_ADOMAIN)) return AG_NAN;
+
+    // asin(x) = atan(x / sqrt(1 - x^2)), (1 - x) * (1 + x) has no cancellation
+    return ag_datan(source / ag_dsqrt((1.0 - source) * (1.0 + source)));
 }
 
-long double ag_sin(double source) {
-    long int n = 1;
-    double result = source, term = source;
+static inline double ag_dacos(double source) {
+    if (!(ag_dabs(source) <= AG_ADOMAIN)) return AG_NAN;
 
-    while (!ag_is_zero(term / n)) {
-        term *= (-1) * (source * source) / ((2 * n + 1) * (2 * n));
-        result += term;
-        n++;
+    // acos(x) = 2 * atan(sqrt((1 - x) / (1 + x))), valid on the whole [-1, 1]
+    return 2.0 * ag_datan(ag_dsqrt((1.0 - source) / (1.0 + source)));
+}
+
+static inline void ag_dsincos(double source, double* sin, double* cos) {
+    if (source != source || ag_dabs(source) == AG_INF) {
+        *sin = *cos = AG_NAN;
+        return;
     }
 
-    return result;
+    double y0, y1;
+    int n = ag_rem_pio2(source, &y0, &y1);
+    double s = ag_kernel_sin(y0, y1), c = ag_kernel_cos(y0, y1);
+
+    *sin = ag_quadrant_sin(n, s, c);
+    *cos = ag_quadrant_sin(n + 1, s, c);
 }
 
-long double ag_cos(double source) {
-    return ag_sin(AG_PI / 2.0 - source);
+static inline double ag_dsin(double source) {
+    if (source != source || ag_dabs(source) == AG_INF) return AG_NAN;
+
+    double y0, y1;
+    int n = ag_rem_pio2(source, &y0, &y1);
+
+    return ag_quadrant_sin(n, ag_kernel_sin(y0, y1), ag_kernel_cos(y0, y1));
+}
+
+static inline double ag_dcos(double source) {
+    if (source != source || ag_dabs(source) == AG_INF) return AG_NAN;
+
+    double y0, y1;
+    int n = ag_rem_pio2(source, &y0, &y1);
+
+    return ag_quadrant_sin(n + 1, ag_kernel_sin(y0, y1), ag_kernel_cos(y0, y1));
 }
 
-long double ag_tan(double source) {
-    return ag_sin(source) / ag_cos(source);
+static inline double ag_dtan(double source) {
+    double sin, cos;
+    ag_dsincos(source, &sin, &cos);
+    return sin / cos;
 }
 
-long double ag_ceil(double source) {
+static inline double ag_dceil(double source) {
     int floored = source;
     if (source - floored && source > 0.) return (long double)(floored + 1);
     return (long double)floored;
 }
 
-long double ag_floor(double source) {
+static inline double ag_dfloor(double source) {
     int floored = source;
     if (source - floored && source < 0.) return (long double)(floored - 1);
     return (long double)floored;
 }
 
-long double ag_fmod(double x, double y) {
+static inline double ag_dfmod(double x, double y) {
     long double div = (long double)(x) / y;
     return (double)(div - ((int)div)) * y;
 }
 
-long double ag_exp(double x) {
-    int flag = 0;
-    if (x < 0) {
-        x = -x;
-        flag = 1;
-    }
+static inline double ag_dexp(double x) {
+    if (x != x) return x;
+    if (x > AG_EXP_OVERFLOW) return AG_INF;
+    if (x < AG_EXP_UNDERFLOW) return 0.0;
+
+    // x = k * ln(2) + r, where |r| <= ln(2) / 2
+    int k = ag_round(x * AG_INV_LN2);
+    double hi = x - k * AG_LN2_HI;
+    double lo = k * AG_LN2_LO;
+    double r = hi - lo;
+
+    // exp(r) = 1 + r + r * c / (2 - c), where c is a minimax polynomial
+    double t = r * r;
+    double c = r - t * (AG_EXP_P[0] +
+                        t * (AG_EXP_P[1] +
+                             t * (AG_EXP_P[2] +
+                                  t * (AG_EXP_P[3] + t * AG_EXP_P[4]))));
+    double result = 1.0 - ((lo - (r * c) / (2.0 - c)) - hi);
+
+    return ag_ldexp(result, k);
+}
+
+static inline double ag_dlog(double x) {
+    if (x != x || x == AG_INF) return x;
+    if (x < 0) return AG_NAN;
+    if (x == 0) return -AG_INF;
+
+    // x = 2^k * (1 + f), where sqrt(2) / 2 <= 1 + f < sqrt(2)
+    int k;
+    double f = ag_log_reduce(x, &k);
+
+    // log(1 + f) = 2s + s * R(s^2), where s = f / (2 + f)
+    double s = f / (2.0 + f);
+    double z = s * s;
+    double w = z * z;
+    double t1 = w * (AG_LOG_LG[1] + w * (AG_LOG_LG[3] + w * AG_LOG_LG[5]));
+    double t2 = z * (AG_LOG_LG[0] +
+                     w * (AG_LOG_LG[2] + w * (AG_LOG_LG[4] + w * AG_LOG_LG[6])));
+    double hfsq = 0.5 * f * f;
+
+    return k * AG_LN2_HI - ((hfsq - (s * (hfsq + t1 + t2) + k * AG_LN2_LO)) - f);
+}
 
-    long double res = 1.0;
-    int n = 1;
-    long double el = x;
+static inline double ag_dpow(double base, double exp) {
+    double result, sign;
+    if (ag_pow_special(&base, exp, &result, &sign)) return result;
 
-    while (el > AG_EPS) {
-        if (el == AG_INF) break;
-        res += el;
-        el *= (x / ++n);
+    // y * log(x) is evaluated in extended precision, so the error of the result
+    // doesn't grow with magnitude of y * log(x)
+    long double t = exp * ag_logl(base);
+
+    if (t > AG_EXP_OVERFLOW) return sign * AG_INF;
+    if (t < AG_EXP_UNDERFLOW) return sign * 0.0;
+
+    return sign * ag_expl(t);
+}
+
+// the default kernel is already a single instruction
+static inline double ag_dsqrt_fast(double source) { return ag_dsqrt(source); }
+
+static inline double ag_dexp_fast(double x) {
+    if (x != x) return x;
+    if (x > AG_EXP_OVERFLOW) return AG_INF;
+    if (x < AG_EXP_UNDERFLOW) return 0.0;
+
+    int k = ag_round(x * AG_INV_LN2);
+    double r = x - k * AG_LN2;
+    double p = AG_EXP_FAST_P[0] +
+               r * (AG_EXP_FAST_P[1] +
+                    r * (AG_EXP_FAST_P[2] +
+                         r * (AG_EXP_FAST_P[3] +
+                              r * (AG_EXP_FAST_P[4] + r * AG_EXP_FAST_P[5]))));
+
+    return ag_ldexp(p, k);
+}
+
+static inline double ag_dlog_fast(double x) {
+    if (x != x || x == AG_INF) return x;
+    if (x < 0) return AG_NAN;
+    if (x == 0) return -AG_INF;
+
+    int k;
+    double f = ag_log_reduce(x, &k);
+    double s = f / (2.0 + f);
+    double z = s * s;
+
+    return k * AG_LN2 +
+           2.0 * s *
+               (AG_LOG_FAST_C[0] +
+                z * (AG_LOG_FAST_C[1] + z * (AG_LOG_FAST_C[2] + z * AG_LOG_FAST_C[3])));
+}
+
+static inline double ag_dpow_fast(double base, double exp) {
+    double result, sign;
+    if (ag_pow_special(&base, exp, &result, &sign)) return result;
+
+    double t = exp * ag_dlog_fast(base);
+
+    if (t > AG_EXP_OVERFLOW) return sign * AG_INF;
+    if (t < AG_EXP_UNDERFLOW) return sign * 0.0;
+
+    return sign * ag_dexp_fast(t);
+}
+
+static inline void ag_dsincos_fast(double source, double* sin, double* cos) {
+    if (source != source || ag_dabs(source) == AG_INF) {
+        *sin = *cos = AG_NAN;
+        return;
     }
 
-    res = (double)res;
+    double y;
+    int n = ag_rem_pio2_fast(source, &y);
+    double s = ag_kernel_sin_fast(y), c = ag_kernel_cos_fast(y);
 
-    return flag ? 1 / (long double)res : (long double)res;
+    *sin = ag_quadrant_sin(n, s, c);
+    *cos = ag_quadrant_sin(n + 1, s, c);
 }
 
-long double ag_log(double x) {
-    long double ans = 0.0;
+static inline double ag_dsin_fast(double source) {
+    if (source != source || ag_dabs(source) == AG_INF) return AG_NAN;
 
-    if (x < 0) {
-        ans = AG_NAN;
-    } else if (x < 1) {
-        long double alpha = (x - 1) / (x + 1);
-        ans = alpha;
-        long double save = ans * alpha * alpha;
+    double y;
+    int n = ag_rem_pio2_fast(source, &y);
 
-        for (int i = 2; i <= INT16_MAX; i++) {
-            ans += (1.0 / (2 * i - 1)) * save;
-            save = save * alpha * alpha;
-        }
+    return ag_quadrant_sin(n, ag_kernel_sin_fast(y), ag_kernel_cos_fast(y));
+}
 
-        ans = (double)ans;
+static inline double ag_dcos_fast(double source) {
+    if (source != source || ag_dabs(source) == AG_INF) return AG_NAN;
 
-        ans = (x > 0) ? (long double)(2.0 * ans) : -AG_INF;
-    } else if (x >= 1) {
-        int cnt = 0;
-        while (x > AG_EXP) {
-            x /= AG_EXP;
-            cnt++;
-        }
+    double y;
+    int n = ag_rem_pio2_fast(source, &y);
+
+    return ag_quadrant_sin(n + 1, ag_kernel_sin_fast(y), ag_kernel_cos_fast(y));
+}
+
+static inline double ag_dtan_fast(double source) {
+    double sin, cos;
+    ag_dsincos_fast(source, &sin, &cos);
+    return sin / cos;
+}
 
-        long double prev = x - 1.0;
-        ans = prev;
+// the default kernel is already correctly rounded
+static inline double ag_dsqrt_exact(double source) { return ag_dsqrt(source); }
 
-        do {
-            prev = ans;
-            long double exp_val = ag_exp(prev);
-            ans = prev + 2 * ((x - exp_val) / (x + exp_val));
-        } while (prev - ans > AG_EPS);
+static inline double ag_dexp_exact(double x) {
+    if (x != x) return x;
+    if (x > AG_EXP_OVERFLOW) return AG_INF;
+    if (x < AG_EXP_UNDERFLOW) return 0.0;
 
-        ans = (double)ans;
+    return ag_expl(x);
+}
+
+static inline double ag_dlog_exact(double x) {
+    if (x != x || x == AG_INF) return x;
+    if (x < 0) return AG_NAN;
+    if (x == 0) return -AG_INF;
+    if (x == 1) return 0.0;
 
-        ans = (long double)ans + cnt;
+    return ag_logl(x);
+}
+
+static inline void ag_sincos_exactl(double source, long double* sin,
+                                    long double* cos) {
+    if (source != source || ag_dabs(source) == AG_INF) {
+        *sin = *cos = AG_NAN;
+        return;
     }
 
-    return ans;
+    double y0, y1;
+    long double s, c;
+    int n = ag_rem_pio2(source, &y0, &y1);
+    ag_kernel_sincosl(y0, y1, &s, &c);
+
+    long double r = (n & 1) ? c : s;
+    *sin = (n & 2) ? -r : r;
+    r = (n & 1) ? s : c;
+    *cos = ((n + 1) & 2) ? -r : r;
 }
 
-long double ag_pow(double base, double exp) {
-    base = (exp < 0) ? (1.0 / base) : base;
-    exp = (exp < 0) ? -exp : exp;
+static inline double ag_dsin_exact(double source) {
+    long double sin, cos;
+    ag_sincos_exactl(source, &sin, &cos);
+    return sin;
+}
+
+static inline double ag_dcos_exact(double source) {
+    long double sin, cos;
+    ag_sincos_exactl(source, &sin, &cos);
+    return cos;
+}
 
-    return (base < 0 && !isdigit(exp)) ? AG_NAN : ag_exp(exp * ag_log(base));
+static inline double ag_dtan_exact(double source) {
+    long double sin, cos;
+    ag_sincos_exactl(source, &sin, &cos);
+    return sin / cos;
 }
+
+static inline void ag_dsincos_exact(double source, double* sin, double* cos) {
+    long double s, c;
+    ag_sincos_exactl(source, &s, &c);
+    *sin = s;
+    *cos = c;
+}
+
+/*
+    Public scalar functions and array loops. Scalar functions keep the
+    long double return type, array loops call the double kernels above
+    directly, so those are inlined into the loop body instead of an indirect
+    call (and x87 return) per element.
+*/
+#define AG_UNARY(name)                                                           \
+    long double ag_##name(double source) { return ag_d##name(source); }          \
+    void ag_v##name(const double* source, double* result, size_t size) {         \
+        for (size_t i = 0; i < size; i++) result[i] = ag_d##name(source[i]);     \
+    }
+
+#define AG_BINARY(name)                                                          \
+    long double ag_##name(double x, double y) { return ag_d##name(x, y); }       \
+    void ag_v##name(const double* x, size_t xstep, const double* y,              \
+                    size_t ystep, double* result, size_t size) {                 \
+        for (size_t i = 0; i < size; i++)                                        \
+            result[i] = ag_d##name(x[i * xstep], y[i * ystep]);                  \
+    }
+
+#define AG_SINCOS(name)                                                          \
+    void ag_##name(double source, long double* sin, long double* cos) {          \
+        double s, c;                                                             \
+        ag_d##name(source, &s, &c);                                              \
+        *sin = s;                                                                \
+        *cos = c;                                                                \
+    }                                                                            \
+    void ag_v##name(const double* source, double* sin, double* cos,              \
+                    size_t size) {                                               \
+        for (size_t i = 0; i < size; i++)                                        \
+            ag_d##name(source[i], sin + i, cos + i);                             \
+    }
+
+AG_UNARY(fabs)
+AG_UNARY(ceil)
+AG_UNARY(floor)
+AG_BINARY(fmod)
+
+AG_UNARY(sqrt)
+AG_UNARY(exp)
+AG_UNARY(log)
+AG_BINARY(pow)
+
+AG_UNARY(asin)
+AG_UNARY(acos)
+AG_UNARY(atan)
+AG_UNARY(sin)
+AG_UNARY(cos)
+AG_UNARY(tan)
+AG_SINCOS(sincos)
+
+AG_UNARY(sqrt_fast)
+AG_UNARY(exp_fast)
+AG_UNARY(log_fast)
+AG_BINARY(pow_fast)
+AG_UNARY(sin_fast)
+AG_UNARY(cos_fast)
+AG_UNARY(tan_fast)
+AG_SINCOS(sincos_fast)
+
+AG_UNARY(sqrt_exact)
+AG_UNARY(exp_exact)
+AG_UNARY(log_exact)
+AG_UNARY(sin_exact)
+AG_UNARY(cos_exact)
+AG_UNARY(tan_exact)
+AG_SINCOS(sincos_exact)
@@ -0,0 +1,126 @@
+"""
+Per-call cost of agrow.math.func kernels over different parts of their
+domains. Runs array entry points, so Python call overhead is amortized and
+numbers are (mostly) kernel cost. Every row of a function should be roughly
+the same - the cost must not depend on the argument.
+
+With --numpy the array entry points are compared against the matching NumPy
+ufuncs instead (same inputs, preallocated outputs).
+
+Run from this directory after building extensions:
+    python func_benchmarks.py [--size N] [--repeat R] [--precision MODE] [--numpy]
+"""
+
+import argparse
+import array
+import random
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from func import (
+    PRECISIONS,
+    precision,
+    vatan,
+    vcos,
+    vexp,
+    vlog,
+    vpow,
+    vsin,
+    vsincos,
+    vsqrt,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Domain = Tuple[float, float]
+
+DOMAINS: Dict[str, Tuple[Callable, List[Domain]]] = {
+    "log": (
+        vlog,
+        [
+            (1e-300, 1e-100),
+            (1e-10, 1e-5),
+            (1e-3, 0.5),
+            (0.5, 1.0),
+            (1.0, 2.0),
+            (1e3, 1e300),
+        ],
+    ),
+    "exp": (
+        vexp,
+        [(-700.0, -100.0), (-10.0, -1.0), (-1e-3, 1e-3), (1.0, 10.0), (100.0, 700.0)],
+    ),
+    "pow": (
+        lambda source, out=None: vpow(source, 2.5, out=out),
+        [(1e-100, 1e-10), (1e-3, 1.0), (1.0, 10.0), (1e10, 1e100)],
+    ),
+    "sqrt": (vsqrt, [(1e-300, 1e-100), (1e-3, 1.0), (1.0, 1e3), (1e100, 1e300)]),
+    "sin": (vsin, [(-0.78, 0.78), (-10.0, 10.0), (1e3, 1e6), (1e10, 1e300)]),
+    "cos": (vcos, [(-0.78, 0.78), (-10.0, 10.0), (1e3, 1e6), (1e10, 1e300)]),
+    "sincos": (
+        lambda source, out=None: vsincos(source, out=(out, array.array("d", out))),
+        [(-0.78, 0.78), (-10.0, 10.0), (1e3, 1e6), (1e10, 1e300)],
+    ),
+    "atan": (vatan, [(-0.4, 0.4), (0.5, 2.0), (10.0, 1e3), (1e20, 1e300)]),
+}
+
+
+def run(size: int, repeat: int) -> None:
+    random.seed(0)
+
+    for name, (func, domains) in DOMAINS.items():
+        print(f"{name}:")
+        for low, high in domains:
+            input = array.array("d", (random.uniform(low, high) for _ in range(size)))
+            out = array.array("d", input)
+            cost = min(
+                timeit.repeat(lambda: func(input, out=out), number=1, repeat=repeat)
+            )
+            print(f"    [{low:>9.2g}, {high:>9.2g}]: {1e9 * cost / size:6.2f} ns/call")
+
+
+def compare(size: int, repeat: int) -> None:
+    ufuncs = {
+        "log": (vlog, np.log, (1e-3, 1e3)),
+        "exp": (vexp, np.exp, (-10.0, 10.0)),
+        "pow": (
+            lambda source, out: vpow(source, 2.5, out=out),
+            lambda source, out: np.power(source, 2.5, out=out),
+            (1e-3, 1e3),
+        ),
+        "sqrt": (vsqrt, np.sqrt, (1e-3, 1e3)),
+        "sin": (vsin, np.sin, (-10.0, 10.0)),
+        "cos": (vcos, np.cos, (-10.0, 10.0)),
+        "atan": (vatan, np.arctan, (-10.0, 10.0)),
+    }
+    rng = np.random.default_rng(0)
+
+    for name, (func, ufunc, (low, high)) in ufuncs.items():
+        input = rng.uniform(low, high, size)
+        out = np.empty_like(input)
+        costs = [
+            min(timeit.repeat(lambda: call(input, out=out), number=1, repeat=repeat))
+            for call in (func, ufunc)
+        ]
+        print(
+            f"{name:>6}: agrow {1e3 * costs[0]:7.2f} ms, numpy {1e3 * costs[1]:7.2f} ms"
+            f" ({costs[0] / costs[1]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--precision", choices=PRECISIONS, default="default")
+    parser.add_argument("--numpy", action="store_true", help="compare with NumPy")
+    args = parser.parse_args()
+
+    if args.numpy and np is None:
+        parser.error("--numpy requires numpy to be installed")
+
+    with precision(args.precision):
+        (compare if args.numpy else run)(size=args.size, repeat=args.repeat)
@@ -0,0 +1,319 @@
+import array
+import math
+import random
+import unittest
+from typing import Callable, List
+
+from func import (
+    PRECISIONS,
+    get_precision,
+    set_precision,
+    precision,
+    fmod,
+    sqrt,
+    exp,
+    log,
+    pow,
+    asin,
+    acos,
+    atan,
+    sin,
+    cos,
+    tan,
+    sincos,
+    vfmod,
+    vsqrt,
+    vexp,
+    vlog,
+    vpow,
+    vsin,
+    vcos,
+    vsincos,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBase(unittest.TestCase):
+    def _run_test(self, vfunc: Callable, func: Callable, input: array.array) -> None:
+        output = vfunc(input)
+        self.assertEqual(len(output), len(input))
+        for value, expected in zip(output, map(func, input)):
+            self.assertAlmostEqual(value, expected)
+
+
+class TestULP(unittest.TestCase):
+    def _assert_ulp(
+        self, func: Callable, expected: Callable, input: List[float], ulp: int = 1
+    ) -> None:
+        for value in input:
+            self.assertLessEqual(
+                abs(func(value) - expected(value)),
+                ulp * math.ulp(expected(value)),
+                f"Expected value within {ulp} ULP with input '{value}'",
+            )
+
+
+class TestExpLog(TestULP):
+    def test_exp(self) -> None:
+        random.seed(0)
+        input = [random.uniform(-745.0, 709.0) for _ in range(10000)]
+        self._assert_ulp(exp, math.exp, input + [-1e-300, 0.0, 1.0, 1e-300])
+
+    def test_log(self) -> None:
+        random.seed(0)
+        input = [math.exp(random.uniform(-744.0, 709.0)) for _ in range(10000)]
+        self._assert_ulp(log, math.log, input + [5e-324, 0.5, 1.0, 2.0])
+
+    def test_pow(self) -> None:
+        random.seed(0)
+        for _ in range(10000):
+            base, power = math.exp(random.uniform(-10.0, 10.0)), random.uniform(-60, 60)
+            self._assert_ulp(lambda _: pow(base, power), lambda _: base**power, [0])
+
+    def test_exp_special(self) -> None:
+        self.assertEqual(exp(1000.0), math.inf)
+        self.assertEqual(exp(-1000.0), 0.0)
+        self.assertEqual(exp(-math.inf), 0.0)
+        self.assertTrue(math.isnan(exp(math.nan)))
+
+    def test_log_special(self) -> None:
+        self.assertEqual(log(0.0), -math.inf)
+        self.assertEqual(log(math.inf), math.inf)
+        self.assertTrue(math.isnan(log(-1.0)))
+        self.assertTrue(math.isnan(log(math.nan)))
+
+    def test_pow_special(self) -> None:
+        self.assertEqual(pow(-2.0, 3.0), -8.0)
+        self.assertEqual(pow(-2.0, 2.0), 4.0)
+        self.assertEqual(pow(0.0, -1.0), math.inf)
+        self.assertEqual(pow(2.0, 1024.0), math.inf)
+        self.assertEqual(pow(2.0, -1075.0), 0.0)
+        self.assertEqual(pow(0.5, math.inf), 0.0)
+        self.assertEqual(pow(math.nan, 0.0), 1.0)
+        self.assertTrue(math.isnan(pow(-2.0, 0.5)))
+
+
+class TestTrigonometry(TestULP):
+    @property
+    def input(self) -> List[float]:
+        random.seed(0)
+        return (
+            [random.uniform(-10.0, 10.0) for _ in range(5000)]
+            + [random.uniform(1e5, 1e7) for _ in range(1000)]
+            + [math.exp(random.uniform(20.0, 709.0)) for _ in range(1000)]
+            + [0.0, 1e-300, math.pi / 4, math.pi / 2, math.pi, 1e22]
+        )
+
+    def test_sin(self) -> None:
+        self._assert_ulp(sin, math.sin, self.input)
+
+    def test_cos(self) -> None:
+        self._assert_ulp(cos, math.cos, self.input)
+
+    def test_tan(self) -> None:
+        self._assert_ulp(tan, math.tan, self.input, ulp=2)
+
+    def test_sincos(self) -> None:
+        for value in self.input:
+            self.assertEqual(sincos(value), (sin(value), cos(value)))
+
+    def test_asin(self) -> None:
+        random.seed(0)
+        input = [random.uniform(-1.0, 1.0) for _ in range(10000)]
+        self._assert_ulp(asin, math.asin, input + [-1.0, 0.0, 1.0], ulp=2)
+
+    def test_acos(self) -> None:
+        random.seed(0)
+        input = [random.uniform(-1.0, 1.0) for _ in range(10000)]
+        self._assert_ulp(acos, math.acos, input + [-1.0, 0.0, 1.0], ulp=2)
+
+    def test_atan(self) -> None:
+        random.seed(0)
+        input = [math.exp(random.uniform(-700.0, 700.0)) for _ in range(10000)]
+        self._assert_ulp(atan, math.atan, input + [-v for v in input] + [0.0])
+
+    def test_sqrt(self) -> None:
+        random.seed(0)
+        input = [math.exp(random.uniform(-744.0, 709.0)) for _ in range(10000)]
+        self._assert_ulp(sqrt, math.sqrt, input + [0.0, 1.0, 4.0])
+
+    def test_special(self) -> None:
+        for func in (sin, cos, tan):
+            self.assertTrue(math.isnan(func(math.inf)))
+            self.assertTrue(math.isnan(func(math.nan)))
+        self.assertTrue(math.isnan(asin(1.5)))
+        self.assertTrue(math.isnan(acos(-1.5)))
+        self.assertTrue(math.isnan(sqrt(-1.0)))
+        self.assertEqual(atan(math.inf), math.pi / 2)
+        self.assertEqual(sqrt(math.inf), math.inf)
+
+
+class TestPrecision(TestULP):
+    @property
+    def input(self) -> List[float]:
+        random.seed(0)
+        return [random.uniform(-20.0, 20.0) for _ in range(5000)]
+
+    @property
+    def positive_input(self) -> List[float]:
+        random.seed(0)
+        return [math.exp(random.uniform(-700.0, 700.0)) for _ in range(5000)]
+
+    def _assert_relative(
+        self, func: Callable, expected: Callable, input: List[float]
+    ) -> None:
+        with precision("fast"):
+            for value in input:
+                self.assertLessEqual(
+                    abs(func(value) - expected(value)),
+                    2e-7 * max(abs(expected(value)), 1.0 if func in (sin, cos) else 0),
+                    f"Expected relative error below 2e-7 with input '{value}'",
+                )
+
+    def test_fast(self) -> None:
+        self._assert_relative(exp, math.exp, self.input)
+        self._assert_relative(log, math.log, self.positive_input)
+        self._assert_relative(sqrt, math.sqrt, self.positive_input)
+        self._assert_relative(sin, math.sin, self.input)
+        self._assert_relative(cos, math.cos, self.input)
+
+    def test_exact(self) -> None:
+        with precision("exact"):
+            self._assert_ulp(exp, math.exp, self.input)
+            self._assert_ulp(log, math.log, self.positive_input)
+            self._assert_ulp(sqrt, math.sqrt, self.positive_input)
+            self._assert_ulp(sin, math.sin, self.input)
+            self._assert_ulp(cos, math.cos, self.input)
+            self._assert_ulp(tan, math.tan, self.input)
+
+    def test_context(self) -> None:
+        self.assertEqual(get_precision(), "default")
+        with precision("fast"):
+            self.assertEqual(get_precision(), "fast")
+            with precision("exact"):
+                self.assertEqual(get_precision(), "exact")
+            self.assertEqual(get_precision(), "fast")
+        self.assertEqual(get_precision(), "default")
+
+    def test_set_precision(self) -> None:
+        for mode in PRECISIONS:
+            set_precision(mode)
+            self.assertEqual(get_precision(), mode)
+        set_precision("default")
+        with self.assertRaises(ValueError):
+            set_precision("fastest")
+
+    def test_array_mode(self) -> None:
+        input = array.array("d", self.input)
+        with precision("fast"):
+            expected = [exp(value) for value in input]
+        self.assertEqual(list(vexp(input, mode="fast")), expected)
+        with precision("fast"):
+            self.assertEqual(list(vexp(input)), expected)
+        with self.assertRaises(ValueError):
+            vexp(input, mode="fastest")
+
+
+class TestArrayFunc(TestBase):
+    @property
+    def input(self) -> array.array:
+        return array.array("d", [0.25, 0.5, 1.0, 2.0, 3.5, 10.0])
+
+    def test_sqrt(self) -> None:
+        self._run_test(vsqrt, sqrt, self.input)
+
+    def test_exp(self) -> None:
+        self._run_test(vexp, exp, self.input)
+
+    def test_log(self) -> None:
+        self._run_test(vlog, log, self.input)
+
+    def test_sin(self) -> None:
+        self._run_test(vsin, sin, self.input)
+
+    def test_sincos(self) -> None:
+        sin_out, cos_out = vsincos(self.input)
+        self.assertEqual(list(sin_out), list(vsin(self.input)))
+        self.assertEqual(list(cos_out), list(vcos(self.input)))
+
+    def test_sincos_out(self) -> None:
+        out = (array.array("d", self.input), array.array("d", self.input))
+        self.assertEqual(vsincos(self.input, out=out), out)
+        self.assertEqual(list(out[0]), list(vsin(self.input)))
+        with self.assertRaises(ValueError):
+            vsincos(self.input, out=out[:1])
+
+    def test_scalar(self) -> None:
+        self.assertEqual(list(vsin(3.0)), [sin(3.0)])
+        self.assertEqual(list(vsqrt(4)), [2.0])
+        self.assertEqual([list(out) for out in vsincos(1.0)], [[sin(1.0)], [cos(1.0)]])
+
+    def test_empty(self) -> None:
+        self.assertEqual(len(vsqrt(array.array("d"))), 0)
+
+    def test_iterable(self) -> None:
+        self.assertEqual(list(vsqrt([1, 4, 9])), [1.0, 2.0, 3.0])
+
+    def test_int_buffer(self) -> None:
+        self.assertEqual(list(vsqrt(array.array("i", [1, 4, 9]))), [1.0, 2.0, 3.0])
+
+    def test_strided_buffer(self) -> None:
+        self.assertEqual(
+            list(vsqrt(memoryview(self.input)[::2])), [0.5, 1.0, 1.8708286933869707]
+        )
+
+    def test_out(self) -> None:
+        out = array.array("d", [0.0] * len(self.input))
+        self.assertIs(vexp(self.input, out=out), out)
+        self.assertEqual(list(out), [exp(value) for value in self.input])
+
+    def test_inplace(self) -> None:
+        input = self.input
+        vsqrt(input, out=input)
+        self.assertEqual(list(input), [sqrt(value) for value in self.input])
+
+    def test_out_size_mismatch(self) -> None:
+        with self.assertRaises(ValueError):
+            vsqrt(self.input, out=array.array("d", [0.0]))
+
+    def test_out_wrong_type(self) -> None:
+        with self.assertRaises(ValueError):
+            vsqrt(self.input, out=array.array("f", [0.0] * len(self.input)))
+
+    def test_out_readonly(self) -> None:
+        with self.assertRaises(ValueError):
+            vsqrt(self.input, out=bytes(8 * len(self.input)))
+
+    def test_binary(self) -> None:
+        output = vpow(self.input, self.input)
+        for value, base in zip(output, self.input):
+            self.assertAlmostEqual(value, pow(base, base))
+
+    def test_binary_broadcast(self) -> None:
+        self.assertEqual(
+            list(vfmod(self.input, 2)), [fmod(value, 2) for value in self.input]
+        )
+        self.assertEqual(list(vfmod(7, [2, 3])), [fmod(7, 2), fmod(7, 3)])
+
+    def test_binary_size_mismatch(self) -> None:
+        with self.assertRaises(ValueError):
+            vpow([1, 2, 3], [1, 2])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        input = np.linspace(0.1, 10.0, 12).reshape(3, 4)
+        out = np.empty_like(input)
+        vlog(input, out=out)
+        np.testing.assert_allclose(out, np.log(input))
+        np.testing.assert_allclose(np.asarray(vlog(input.T)), np.log(input.T).ravel())
+        np.testing.assert_allclose(
+            np.asarray(vlog(input.astype(np.float32))), np.log(input).ravel(), rtol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
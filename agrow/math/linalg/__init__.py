@@ -0,0 +1,27 @@
+from .linalg import (
+    Vector,
+    Matrix,
+    asvector,
+    asmatrix,
+    dot,
+    axpy,
+    gemv,
+    gemm,
+    CSR_DTYPES,
+    CSRMatrix,
+    ascsr
+)
+
+__all__ = [
+    "Vector",
+    "Matrix",
+    "asvector",
+    "asmatrix",
+    "dot",
+    "axpy",
+    "gemv",
+    "gemm",
+    "CSR_DTYPES",
+    "CSRMatrix",
+    "ascsr"
+]
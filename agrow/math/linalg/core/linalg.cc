@@ -1 +1,180 @@
-#include "linalg.h"
\ No newline at end of file
+#include "linalg.h"
+
+#include <math.h>
+
+namespace agrow {
+    template <typename T>
+    T ag_dot(const T* x, const T* y, size_t size) {
+        // independent accumulators let the CPU overlap additions
+        T acc0 = 0, acc1 = 0, acc2 = 0, acc3 = 0;
+        size_t i = 0;
+
+        for (; i + 4 <= size; i += 4) {
+            acc0 += x[i] * y[i];
+            acc1 += x[i + 1] * y[i + 1];
+            acc2 += x[i + 2] * y[i + 2];
+            acc3 += x[i + 3] * y[i + 3];
+        }
+        for (; i < size; i++) acc0 += x[i] * y[i];
+
+        return (acc0 + acc1) + (acc2 + acc3);
+    }
+
+    template <typename T>
+    void ag_axpy(T alpha, const T* x, T* y, size_t size) {
+        for (size_t i = 0; i < size; i++) y[i] += alpha * x[i];
+    }
+
+    template <typename T>
+    void ag_gemv(size_t rows, size_t cols, T alpha, const T* a, size_t lda,
+                 const T* x, T beta, T* y) {
+        size_t i = 0;
+
+        // four rows at once, so every x[j] load is used four times
+        for (; i + 4 <= rows; i += 4) {
+            const T* a0 = a + i * lda;
+            const T* a1 = a0 + lda;
+            const T* a2 = a1 + lda;
+            const T* a3 = a2 + lda;
+            T acc0 = 0, acc1 = 0, acc2 = 0, acc3 = 0;
+
+            for (size_t j = 0; j < cols; j++) {
+                acc0 += a0[j] * x[j];
+                acc1 += a1[j] * x[j];
+                acc2 += a2[j] * x[j];
+                acc3 += a3[j] * x[j];
+            }
+
+            y[i] = alpha * acc0 + ((beta == 0) ? 0 : beta * y[i]);
+            y[i + 1] = alpha * acc1 + ((beta == 0) ? 0 : beta * y[i + 1]);
+            y[i + 2] = alpha * acc2 + ((beta == 0) ? 0 : beta * y[i + 2]);
+            y[i + 3] = alpha * acc3 + ((beta == 0) ? 0 : beta * y[i + 3]);
+        }
+        for (; i < rows; i++) {
+            T acc = ag_dot(a + i * lda, x, cols);
+            y[i] = alpha * acc + ((beta == 0) ? 0 : beta * y[i]);
+        }
+    }
+
+    /*
+        C[rows, cols] += A[rows, depth] * B[depth, cols] for a single block.
+        Four rows of C are updated at once, so every B[p, j] load is used four
+        times, the innermost loop is contiguous and gets vectorized
+    */
+    template <typename T>
+    static void ag_gemm_block(size_t rows, size_t cols, size_t depth, T alpha,
+                              const T* a, size_t lda, const T* b, size_t ldb,
+                              T* c, size_t ldc) {
+        size_t i = 0;
+
+        for (; i + 4 <= rows; i += 4) {
+            T* c0 = c + i * ldc;
+            T* c1 = c0 + ldc;
+            T* c2 = c1 + ldc;
+            T* c3 = c2 + ldc;
+
+            for (size_t p = 0; p < depth; p++) {
+                const T* brow = b + p * ldb;
+                T a0 = alpha * a[i * lda + p];
+                T a1 = alpha * a[(i + 1) * lda + p];
+                T a2 = alpha * a[(i + 2) * lda + p];
+                T a3 = alpha * a[(i + 3) * lda + p];
+
+                for (size_t j = 0; j < cols; j++) {
+                    T value = brow[j];
+                    c0[j] += a0 * value;
+                    c1[j] += a1 * value;
+                    c2[j] += a2 * value;
+                    c3[j] += a3 * value;
+                }
+            }
+        }
+        for (; i < rows; i++) {
+            for (size_t p = 0; p < depth; p++)
+                ag_axpy(alpha * a[i * lda + p], b + p * ldb, c + i * ldc, cols);
+        }
+    }
+
+    template <typename T>
+    void ag_gemm(size_t m, size_t n, size_t k, T alpha, const T* a, size_t lda,
+                 const T* b, size_t ldb, T beta, T* c, size_t ldc) {
+        for (size_t i = 0; i < m; i++) {
+            T* row = c + i * ldc;
+            for (size_t j = 0; j < n; j++) row[j] = (beta == 0) ? 0 : beta * row[j];
+        }
+
+        for (size_t pp = 0; pp < k; pp += AG_BLOCK_K) {
+            size_t depth = (k - pp < AG_BLOCK_K) ? k - pp : AG_BLOCK_K;
+
+            for (size_t jj = 0; jj < n; jj += AG_BLOCK_N) {
+                size_t cols = (n - jj < AG_BLOCK_N) ? n - jj : AG_BLOCK_N;
+
+                for (size_t ii = 0; ii < m; ii += AG_BLOCK_M) {
+                    size_t rows = (m - ii < AG_BLOCK_M) ? m - ii : AG_BLOCK_M;
+
+                    ag_gemm_block(rows, cols, depth, alpha, a + ii * lda + pp, lda,
+                                  b + pp * ldb + jj, ldb, c + ii * ldc + jj, ldc);
+                }
+            }
+        }
+    }
+
+    template <typename T>
+    void ag_csr_gemm(size_t rows, size_t n, const T* data, const int* indices,
+                     const long long* indptr, const double* b, size_t ldb,
+                     double* c, size_t ldc) {
+        for (size_t i = 0; i < rows; i++) {
+            double* row = c + i * ldc;
+            for (size_t j = 0; j < n; j++) row[j] = 0;
+
+            // every non-zero value scales a (contiguous) row of B
+            for (long long p = indptr[i]; p < indptr[i + 1]; p++)
+                ag_axpy<double>(data[p], b + (size_t)indices[p] * ldb, row, n);
+        }
+    }
+
+    template <typename T>
+    void ag_csr_normalize(size_t rows, T* data, const long long* indptr, int order) {
+        for (size_t i = 0; i < rows; i++) {
+            double norm = 0;
+
+            for (long long p = indptr[i]; p < indptr[i + 1]; p++)
+                norm += (order == 1) ? fabs(data[p]) : (double)data[p] * data[p];
+            if (norm == 0) continue;
+
+            norm = (order == 1) ? norm : sqrt(norm);
+            for (long long p = indptr[i]; p < indptr[i + 1]; p++)
+                data[p] = (T)(data[p] / norm);
+        }
+    }
+
+    template float ag_dot<float>(const float*, const float*, size_t);
+    template double ag_dot<double>(const double*, const double*, size_t);
+
+    template void ag_axpy<float>(float, const float*, float*, size_t);
+    template void ag_axpy<double>(double, const double*, double*, size_t);
+
+    template void ag_gemv<float>(size_t, size_t, float, const float*, size_t,
+                                 const float*, float, float*);
+    template void ag_gemv<double>(size_t, size_t, double, const double*, size_t,
+                                  const double*, double, double*);
+
+    template void ag_gemm<float>(size_t, size_t, size_t, float, const float*, size_t,
+                                 const float*, size_t, float, float*, size_t);
+    template void ag_gemm<double>(size_t, size_t, size_t, double, const double*,
+                                  size_t, const double*, size_t, double, double*,
+                                  size_t);
+
+    template void ag_csr_gemm<int>(size_t, size_t, const int*, const int*,
+                                   const long long*, const double*, size_t, double*,
+                                   size_t);
+    template void ag_csr_gemm<float>(size_t, size_t, const float*, const int*,
+                                     const long long*, const double*, size_t, double*,
+                                     size_t);
+    template void ag_csr_gemm<double>(size_t, size_t, const double*, const int*,
+                                      const long long*, const double*, size_t,
+                                      double*, size_t);
+
+    template void ag_csr_normalize<float>(size_t, float*, const long long*, int);
+    template void ag_csr_normalize<double>(size_t, double*, const long long*, int);
+}  // agrow
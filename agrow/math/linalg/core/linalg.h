@@ -1,17 +1,101 @@
 #ifndef __LINALG_CORE_LINALG_H__
 #define __LINALG_CORE_LINALG_H__
 
+#include <stddef.h>
+
+// GEMM blocks sizes: AG_BLOCK_K x AG_BLOCK_N block of B (256 KB for doubles)
+// stays in L2 cache while AG_BLOCK_M rows of A and C are streamed over it
+#define AG_BLOCK_M 64
+#define AG_BLOCK_N 256
+#define AG_BLOCK_K 128
+
 namespace agrow {
-    template <typename T, size_t Size>
-    class ag_vector {
-    private:
-        T m_data[Size];
-
-    public:
-        ag_vector()
-        {
-        }
-    };
+    /*
+        @brief This function is for getting dot product of two vectors
+        @param x is a pointer to the first vector data
+        @param y is a pointer to the second vector data
+        @param size is a number of elements in both vectors
+        @return sum of x[i] * y[i]
+    */
+    template <typename T>
+    T ag_dot(const T* x, const T* y, size_t size);
+
+    /*
+        @brief This function is for computing y = alpha * x + y in place
+        @param alpha is a scale of x
+        @param x is a pointer to the vector data
+        @param y is a pointer to the vector data to update
+        @param size is a number of elements in both vectors
+    */
+    template <typename T>
+    void ag_axpy(T alpha, const T* x, T* y, size_t size);
+
+    /*
+        @brief This function is for computing y = alpha * A * x + beta * y in
+                place, where A is a row-major matrix
+        @param rows is a number of rows of A (size of y)
+        @param cols is a number of columns of A (size of x)
+        @param alpha is a scale of A * x
+        @param a is a pointer to the matrix data
+        @param lda is a distance (in elements) between rows of A
+        @param x is a pointer to the vector data
+        @param beta is a scale of y (y isn't read if beta is 0)
+        @param y is a pointer to the result vector data
+    */
+    template <typename T>
+    void ag_gemv(size_t rows, size_t cols, T alpha, const T* a, size_t lda,
+                 const T* x, T beta, T* y);
+
+    /*
+        @brief This function is for computing C = alpha * A * B + beta * C in
+                place, where all matrices are row-major. Computation is blocked
+                (see AG_BLOCK_*), so B block is reused from the cache
+        @param m is a number of rows of A and C
+        @param n is a number of columns of B and C
+        @param k is a number of columns of A and rows of B
+        @param alpha is a scale of A * B
+        @param a is a pointer to the A matrix data
+        @param lda is a distance (in elements) between rows of A
+        @param b is a pointer to the B matrix data
+        @param ldb is a distance (in elements) between rows of B
+        @param beta is a scale of C (C isn't read if beta is 0)
+        @param c is a pointer to the C matrix data
+        @param ldc is a distance (in elements) between rows of C
+    */
+    template <typename T>
+    void ag_gemm(size_t m, size_t n, size_t k, T alpha, const T* a, size_t lda,
+                 const T* b, size_t ldb, T beta, T* c, size_t ldc);
+
+    /*
+        @brief This function is for computing C = A * B, where A is a sparse
+                matrix in CSR (compressed sparse row) format, B and C are dense
+                row-major matrices. Cost is O(nnz(A) * n)
+        @param rows is a number of rows of A and C
+        @param n is a number of columns of B and C
+        @param data is a pointer to non-zero values of A
+        @param indices is a pointer to column indices of non-zero values of A
+        @param indptr is a pointer to rows offsets of A (rows + 1 elements),
+                values of i-th row are data[indptr[i]:indptr[i + 1]]
+        @param b is a pointer to the B matrix data
+        @param ldb is a distance (in elements) between rows of B
+        @param c is a pointer to the C matrix data
+        @param ldc is a distance (in elements) between rows of C
+    */
+    template <typename T>
+    void ag_csr_gemm(size_t rows, size_t n, const T* data, const int* indices,
+                     const long long* indptr, const double* b, size_t ldb,
+                     double* c, size_t ldc);
+
+    /*
+        @brief This function is for scaling every row of CSR matrix in place,
+                so its L1 or L2 norm is 1 (all-zero rows are left as is)
+        @param rows is a number of rows of the matrix
+        @param data is a pointer to non-zero values of the matrix
+        @param indptr is a pointer to rows offsets of the matrix
+        @param order is an order of the norm (1 or 2)
+    */
+    template <typename T>
+    void ag_csr_normalize(size_t rows, T* data, const long long* indptr, int order);
 }  // agrow
 
-#endif  // __LINALG_CORE_LINALG_H__
\ No newline at end of file
+#endif  // __LINALG_CORE_LINALG_H__
@@ -0,0 +1,579 @@
+cimport cython
+from cpython.buffer cimport PyBUF_FORMAT
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.string cimport memcpy, memset
+
+import array
+
+
+cdef extern from "core/linalg.h" namespace "agrow" nogil:
+    T ag_dot[T](const T* x, const T* y, size_t size)
+    void ag_axpy[T](T alpha, const T* x, T* y, size_t size)
+    void ag_gemv[T](
+        size_t rows, size_t cols, T alpha, const T* a, size_t lda,
+        const T* x, T beta, T* y
+    )
+    void ag_gemm[T](
+        size_t m, size_t n, size_t k, T alpha, const T* a, size_t lda,
+        const T* b, size_t ldb, T beta, T* c, size_t ldc
+    )
+    void ag_csr_gemm[T](
+        size_t rows, size_t n, const T* data, const int* indices,
+        const long long* indptr, const double* b, size_t ldb, double* c, size_t ldc
+    )
+    void ag_csr_normalize[T](size_t rows, T* data, const long long* indptr, int order)
+
+
+ctypedef fused value_t:
+    int
+    float
+    double
+
+
+# Dense float64 containers. Elements are stored in a single C-contiguous
+# (row-major) block owned by the object, which is exposed through the buffer
+# protocol, so memoryview(...), numpy.asarray(...) and typed memoryviews are
+# zero-copy views of it. Kernels below accept Vector / Matrix as well as any
+# other C-contiguous float64 buffer (e.g. NumPy arrays) and run with the GIL
+# released; other inputs are converted (copied) first.
+
+
+cdef char* _FORMAT = "d"
+
+
+cdef class _Dense:
+    cdef double* data
+    cdef Py_ssize_t size
+    cdef int ndim
+    cdef Py_ssize_t shape_[2]
+    cdef Py_ssize_t strides_[2]
+
+    def __cinit__(self, *args, **kwargs):
+        self.data = NULL
+        self.size = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.data)
+
+    cdef void _allocate(self, Py_ssize_t rows, Py_ssize_t cols, int ndim) except *:
+        if rows < 0 or cols < 0:
+            raise ValueError(f"Dimensions should be non-negative, got {(rows, cols)}")
+
+        self.ndim = ndim
+        self.size = rows * cols
+        self.shape_[0] = cols if ndim == 1 else rows
+        self.shape_[1] = cols
+        self.strides_[0] = sizeof(double) * (1 if ndim == 1 else cols)
+        self.strides_[1] = sizeof(double)
+        # at least one element, so data is never NULL (even for empty objects)
+        self.data = <double*>PyMem_Malloc(max(self.size, 1) * sizeof(double))
+        if self.data == NULL:
+            raise MemoryError()
+        memset(self.data, 0, self.size * sizeof(double))
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = self.data
+        buffer.obj = self
+        buffer.len = self.size * sizeof(double)
+        buffer.readonly = 0
+        buffer.itemsize = sizeof(double)
+        buffer.format = _FORMAT if flags & PyBUF_FORMAT else NULL
+        buffer.ndim = self.ndim
+        buffer.shape = self.shape_
+        buffer.strides = self.strides_
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __len__(self):
+        return self.shape_[0]
+
+    @property
+    def shape(self):
+        return tuple(self.shape_[i] for i in range(self.ndim))
+
+    cdef Py_ssize_t _index(self, Py_ssize_t index, int axis) except -1:
+        cdef Py_ssize_t size = self.shape_[axis]
+
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Index out of range for axis {axis} of size {size}")
+
+        return index
+
+
+cdef class Vector(_Dense):
+    def __init__(self, Py_ssize_t size):
+        self._allocate(1, size, 1)
+
+    def __getitem__(self, Py_ssize_t index):
+        return self.data[self._index(index, 0)]
+
+    def __setitem__(self, Py_ssize_t index, double value):
+        self.data[self._index(index, 0)] = value
+
+    def tolist(self):
+        return [self.data[i] for i in range(self.size)]
+
+    def __repr__(self):
+        return f"Vector({self.tolist()})"
+
+
+cdef class Matrix(_Dense):
+    def __init__(self, Py_ssize_t rows, Py_ssize_t cols):
+        self._allocate(rows, cols, 2)
+
+    cdef double* _row(self, Py_ssize_t row) except NULL:
+        return self.data + self._index(row, 0) * self.shape_[1]
+
+    def __getitem__(self, index):
+        # m[i, j] is an element, m[i] is a copy of i-th row
+        if isinstance(index, tuple):
+            row, col = index
+            return self._row(row)[self._index(col, 1)]
+
+        cdef Vector vector = Vector(self.shape_[1])
+        memcpy(vector.data, self._row(index), vector.size * sizeof(double))
+        return vector
+
+    def __setitem__(self, index, double value):
+        row, col = index
+        self._row(row)[self._index(col, 1)] = value
+
+    def tolist(self):
+        cdef Py_ssize_t i, j, cols = self.shape_[1]
+        return [
+            [self.data[i * cols + j] for j in range(cols)]
+            for i in range(self.shape_[0])
+        ]
+
+    def __repr__(self):
+        return f"Matrix({self.tolist()})"
+
+
+cdef double[::1] _vector_view(Vector vector):
+    return vector
+
+
+cdef double[:, ::1] _matrix_view(Matrix matrix):
+    return matrix
+
+
+def asvector(source):
+    if isinstance(source, Vector):
+        return source
+
+    cdef const double[:] view
+
+    try:
+        view = source
+    except (TypeError, ValueError):
+        # non-float64 buffers and plain iterables
+        view = array.array("d", source)
+
+    cdef Vector vector = Vector(view.shape[0])
+    _vector_view(vector)[:] = view
+    return vector
+
+
+def asmatrix(source):
+    if isinstance(source, Matrix):
+        return source
+
+    cdef const double[:, :] view
+    cdef const double[::1] row
+    cdef Matrix matrix
+    cdef Py_ssize_t i
+
+    try:
+        view = source
+    except (TypeError, ValueError):
+        # non-float64 buffers and nested iterables
+        rows = [array.array("d", values) for values in source]
+        if any(len(values) != len(rows[0]) for values in rows):
+            raise ValueError("All rows should have the same size")
+
+        matrix = Matrix(len(rows), len(rows[0]) if rows else 0)
+        for i, values in enumerate(rows):
+            row = values
+            _matrix_view(matrix)[i, :] = row
+        return matrix
+
+    matrix = Matrix(view.shape[0], view.shape[1])
+    _matrix_view(matrix)[:, :] = view
+    return matrix
+
+
+cdef const double[::1] _as_vector(object source):
+    try:
+        return source
+    except (TypeError, ValueError):
+        return asvector(source)
+
+
+cdef const double[:, ::1] _as_matrix(object source):
+    try:
+        return source
+    except (TypeError, ValueError):
+        return asmatrix(source)
+
+
+cdef inline size_t _ld(Py_ssize_t stride) nogil:
+    # leading dimension (distance between rows in elements) of a 2D view
+    return <size_t>(stride // sizeof(double))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def dot(x, y):
+    cdef const double[::1] xview = _as_vector(x)
+    cdef const double[::1] yview = _as_vector(y)
+    cdef Py_ssize_t size = xview.shape[0]
+    cdef double result = 0
+
+    if yview.shape[0] != size:
+        raise ValueError(f"Operands sizes mismatch: {size} and {yview.shape[0]}")
+
+    if size:
+        with nogil:
+            result = ag_dot[double](&xview[0], &yview[0], size)
+
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def axpy(double alpha, x, y):
+    # y = alpha * x + y, y is updated in place and returned
+    cdef const double[::1] xview = _as_vector(x)
+    cdef double[::1] yview = y
+    cdef Py_ssize_t size = xview.shape[0]
+
+    if yview.shape[0] != size:
+        raise ValueError(f"Operands sizes mismatch: {size} and {yview.shape[0]}")
+
+    if size:
+        with nogil:
+            ag_axpy[double](alpha, &xview[0], &yview[0], size)
+
+    return y
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def gemv(a, x, y=None, double alpha=1.0, double beta=0.0):
+    # y = alpha * A * x + beta * y, new Vector is returned if y isn't given
+    cdef const double[:, ::1] aview = _as_matrix(a)
+    cdef const double[::1] xview = _as_vector(x)
+    cdef Py_ssize_t rows = aview.shape[0], cols = aview.shape[1]
+
+    if xview.shape[0] != cols:
+        raise ValueError(
+            f"Operands shapes mismatch: {(rows, cols)} and {xview.shape[0]}"
+        )
+    if y is None:
+        y = Vector(rows)
+    cdef double[::1] yview = y
+    if yview.shape[0] != rows:
+        raise ValueError(f"Output size should be {rows}, got {yview.shape[0]}")
+
+    if rows:
+        with nogil:
+            ag_gemv[double](
+                rows, cols, alpha, &aview[0, 0], _ld(aview.strides[0]),
+                &xview[0] if cols else NULL, beta, &yview[0]
+            )
+
+    return y
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def gemm(a, b, c=None, double alpha=1.0, double beta=0.0):
+    # C = alpha * A * B + beta * C, new Matrix is returned if c isn't given
+    cdef const double[:, ::1] aview = _as_matrix(a)
+    cdef const double[:, ::1] bview = _as_matrix(b)
+    cdef Py_ssize_t m = aview.shape[0], k = aview.shape[1], n = bview.shape[1]
+
+    if bview.shape[0] != k:
+        raise ValueError(
+            f"Operands shapes mismatch: {(m, k)} and {(bview.shape[0], n)}"
+        )
+    if c is None:
+        c = Matrix(m, n)
+    cdef double[:, ::1] cview = c
+    if cview.shape[0] != m or cview.shape[1] != n:
+        raise ValueError(
+            f"Output shape should be {(m, n)}, got {(cview.shape[0], cview.shape[1])}"
+        )
+
+    if m and n:
+        with nogil:
+            ag_gemm[double](
+                m, n, k, alpha,
+                &aview[0, 0] if k else NULL, _ld(aview.strides[0]),
+                &bview[0, 0] if k else NULL, _ld(bview.strides[0]),
+                beta, &cview[0, 0], _ld(cview.strides[0])
+            )
+
+    return c
+
+
+# Sparse matrices in CSR (compressed sparse row) format. Non-zero values of
+# i-th row are data[indptr[i]:indptr[i + 1]], their column indices are
+# indices[indptr[i]:indptr[i + 1]]. All three are array.array objects: data is
+# int32 ("i"), float32 ("f") or float64 ("d"), indices are int32 ("i") and
+# indptr is int64 ("q"), so memory scales with the number of non-zero values
+# and arrays can be shared with NumPy / scipy without copying.
+CSR_DTYPES = ("i", "f", "d")
+
+
+cdef object _as_array(object source, str typecodes):
+    # source as array.array of one of typecodes (first one if conversion is
+    # needed), arrays of right type are used as is
+    if isinstance(source, array.array) and source.typecode in typecodes:
+        return source
+
+    try:
+        view = memoryview(source)
+        if view.format in typecodes and view.ndim == 1:
+            return array.array(view.format, view.tobytes())
+    except TypeError:
+        pass
+
+    return array.array(typecodes[0], source)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _check_csr(
+    const int[::1] indices, const long long[::1] indptr, Py_ssize_t cols, Py_ssize_t nnz
+) except -1:
+    cdef Py_ssize_t i
+
+    if indptr[0] != 0 or indptr[indptr.shape[0] - 1] != nnz:
+        raise ValueError(f"indptr should start with 0 and end with nnz ({nnz})")
+    for i in range(1, indptr.shape[0]):
+        if indptr[i] < indptr[i - 1]:
+            raise ValueError("indptr should be non-decreasing")
+    for i in range(indices.shape[0]):
+        if not 0 <= indices[i] < cols:
+            raise ValueError(f"Column index {indices[i]} is out of range [0, {cols})")
+
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _csr_gemm(
+    const value_t[::1] data, const int[::1] indices, const long long[::1] indptr,
+    size_t n, const double* b, size_t ldb, double* c, size_t ldc
+):
+    with nogil:
+        ag_csr_gemm(
+            indptr.shape[0] - 1, n, &data[0], &indices[0], &indptr[0], b, ldb, c, ldc
+        )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _csr_normalize(
+    value_t[::1] data, const long long[::1] indptr, int order
+):
+    with nogil:
+        ag_csr_normalize(indptr.shape[0] - 1, &data[0], &indptr[0], order)
+
+
+cdef class CSRMatrix:
+    cdef readonly object data
+    cdef readonly object indices
+    cdef readonly object indptr
+    cdef readonly tuple shape
+
+    def __init__(self, data, indices, indptr, shape=None):
+        self.data = _as_array(data, "dfi")
+        self.indices = _as_array(indices, "i")
+        self.indptr = _as_array(indptr, "q")
+
+        if len(self.indptr) == 0:
+            raise ValueError("indptr should have at least one element")
+        if len(self.data) != len(self.indices):
+            raise ValueError(
+                f"data and indices sizes mismatch: {len(self.data)} and "
+                f"{len(self.indices)}"
+            )
+        if shape is None:
+            shape = (len(self.indptr) - 1, max(self.indices, default=-1) + 1)
+        if len(self.indptr) != shape[0] + 1:
+            raise ValueError(
+                f"indptr size should be {shape[0] + 1}, got {len(self.indptr)}"
+            )
+
+        self.shape = (int(shape[0]), int(shape[1]))
+        _check_csr(self.indices, self.indptr, self.shape[1], len(self.data))
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def dtype(self):
+        return self.data.typecode
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, index):
+        # m[i] is a single-row matrix, m[start:stop:step] is a matrix of rows
+        if isinstance(index, slice):
+            return self._take(range(*index.indices(self.shape[0])))
+
+        if index < 0:
+            index += self.shape[0]
+        if not 0 <= index < self.shape[0]:
+            raise IndexError(f"Row index out of range for {self.shape[0]} rows")
+        return self._take(range(index, index + 1))
+
+    cdef CSRMatrix _take(self, range rows):
+        cdef object indptr = array.array("q", [0])
+        cdef long long start, stop, shift
+        cdef object data, indices
+
+        if rows.step == 1 or len(rows) < 2:
+            # contiguous rows - values are a single slice of data and indices
+            start = self.indptr[rows.start] if rows else 0
+            stop = self.indptr[rows.start + len(rows)] if rows else 0
+            data, indices = self.data[start:stop], self.indices[start:stop]
+            indptr.extend(
+                p - start for p in self.indptr[rows.start + 1:rows.start + len(rows) + 1]
+            )
+        else:
+            data = array.array(self.data.typecode)
+            indices = array.array("i")
+            for row in rows:
+                start, stop = self.indptr[row], self.indptr[row + 1]
+                data.extend(self.data[start:stop])
+                indices.extend(self.indices[start:stop])
+                indptr.append(len(data))
+
+        return CSRMatrix(data, indices, indptr, (len(rows), self.shape[1]))
+
+    def dot(self, other):
+        # sparse x dense product, other is a 2D buffer (Matrix, NumPy array,
+        # nested lists) with shape[1] rows or a 1D one with shape[1] elements
+        cdef const double[:, ::1] matrix
+        cdef const double[::1] vector
+        cdef double[:, ::1] out_matrix
+        cdef double[::1] out_vector
+        cdef const double* b
+        cdef double* c
+        cdef size_t n, ldb, ldc
+
+        try:
+            vector = _as_vector(other)
+        except (TypeError, ValueError):
+            matrix = _as_matrix(other)
+            if matrix.shape[0] != self.shape[1]:
+                raise ValueError(
+                    f"Operands shapes mismatch: {self.shape} and "
+                    f"{(matrix.shape[0], matrix.shape[1])}"
+                )
+            out = Matrix(self.shape[0], matrix.shape[1])
+            out_matrix = out
+            n, ldb, ldc = matrix.shape[1], _ld(matrix.strides[0]), matrix.shape[1]
+            b = &matrix[0, 0] if matrix.shape[0] and n else NULL
+            c = &out_matrix[0, 0] if self.shape[0] and n else NULL
+        else:
+            if vector.shape[0] != self.shape[1]:
+                raise ValueError(
+                    f"Operands shapes mismatch: {self.shape} and {vector.shape[0]}"
+                )
+            out = Vector(self.shape[0])
+            out_vector = out
+            n, ldb, ldc = 1, 1, 1
+            b = &vector[0] if vector.shape[0] else NULL
+            c = &out_vector[0] if self.shape[0] else NULL
+
+        if self.dtype == "i":
+            _csr_gemm[int](self.data, self.indices, self.indptr, n, b, ldb, c, ldc)
+        elif self.dtype == "f":
+            _csr_gemm[float](self.data, self.indices, self.indptr, n, b, ldb, c, ldc)
+        else:
+            _csr_gemm[double](self.data, self.indices, self.indptr, n, b, ldb, c, ldc)
+
+        return out
+
+    def __matmul__(self, other):
+        return self.dot(other)
+
+    def normalize(self, norm="l2"):
+        # scales rows in place, so their L1 / L2 norm is 1, returns self
+        if norm not in ("l1", "l2", None):
+            raise ValueError(f"Norm should be one of 'l1', 'l2' or None, got {norm!r}")
+        if norm is None:
+            return self
+        if self.dtype == "i":
+            raise TypeError("Only float32 and float64 matrices can be normalized")
+
+        cdef int order = 1 if norm == "l1" else 2
+        if self.dtype == "f":
+            _csr_normalize[float](self.data, self.indptr, order)
+        else:
+            _csr_normalize[double](self.data, self.indptr, order)
+
+        return self
+
+    def toarray(self):
+        cdef Matrix out = Matrix(self.shape[0], self.shape[1])
+        cdef Py_ssize_t row, p
+
+        for row in range(self.shape[0]):
+            for p in range(self.indptr[row], self.indptr[row + 1]):
+                out.data[row * self.shape[1] + self.indices[p]] = self.data[p]
+
+        return out
+
+    def to_numpy(self):
+        # (data, indices, indptr) NumPy arrays sharing memory with the matrix
+        import numpy as np
+
+        return tuple(
+            np.frombuffer(values, dtype=values.typecode)
+            for values in (self.data, self.indices, self.indptr)
+        )
+
+    def to_scipy(self):
+        # scipy.sparse.csr_matrix, data is shared with the matrix
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix(self.to_numpy(), shape=self.shape, copy=False)
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz}, dtype={self.dtype!r})"
+
+
+def ascsr(source, dtype="d"):
+    # CSRMatrix from a dense 2D source or a scipy sparse matrix
+    if isinstance(source, CSRMatrix):
+        return source
+    if hasattr(source, "tocsr"):
+        source = source.tocsr()
+        return CSRMatrix(source.data, source.indices, source.indptr, source.shape)
+    if dtype not in CSR_DTYPES:
+        raise ValueError(f"dtype should be one of {CSR_DTYPES}, got {dtype!r}")
+
+    cdef Matrix matrix = asmatrix(source)
+    cdef Py_ssize_t i, rows = matrix.shape_[0], cols = matrix.shape_[1]
+    data, indices, indptr = array.array(dtype), array.array("i"), array.array("q", [0])
+
+    for i in range(rows * cols):
+        if matrix.data[i] != 0:
+            data.append(int(matrix.data[i]) if dtype == "i" else matrix.data[i])
+            indices.append(i % cols)
+        if (i + 1) % cols == 0:
+            indptr.append(len(data))
+
+    return CSRMatrix(data, indices, indptr, (rows, cols))
@@ -0,0 +1,223 @@
+import array
+import random
+import unittest
+from typing import List
+
+from linalg import (
+    Vector,
+    Matrix,
+    CSRMatrix,
+    asvector,
+    asmatrix,
+    ascsr,
+    dot,
+    axpy,
+    gemv,
+    gemm,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _random_matrix(rows: int, cols: int) -> List[List[float]]:
+    return [[random.uniform(-1.0, 1.0) for _ in range(cols)] for _ in range(rows)]
+
+
+def _matmul(a: List[List[float]], b: List[List[float]]) -> List[List[float]]:
+    return [[sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+
+
+class TestBase(unittest.TestCase):
+    def _assert_matrix(self, matrix: Matrix, expected: List[List[float]]) -> None:
+        self.assertEqual(matrix.shape, (len(expected), len(expected[0])))
+        for row, expected_row in zip(matrix.tolist(), expected):
+            for value, expected_value in zip(row, expected_row):
+                self.assertAlmostEqual(value, expected_value)
+
+
+class TestDense(TestBase):
+    def test_vector(self) -> None:
+        vector = Vector(3)
+        self.assertEqual(len(vector), 3)
+        self.assertEqual(vector.shape, (3,))
+        self.assertEqual(vector.tolist(), [0.0, 0.0, 0.0])
+        vector[0], vector[-1] = 1.0, 2.0
+        self.assertEqual(vector.tolist(), [1.0, 0.0, 2.0])
+        with self.assertRaises(IndexError):
+            vector[3]
+
+    def test_matrix(self) -> None:
+        matrix = Matrix(2, 3)
+        self.assertEqual(len(matrix), 2)
+        self.assertEqual(matrix.shape, (2, 3))
+        matrix[1, 2] = 5.0
+        self.assertEqual(matrix[-1, -1], 5.0)
+        self.assertEqual(matrix[1].tolist(), [0.0, 0.0, 5.0])
+        with self.assertRaises(IndexError):
+            matrix[2, 0]
+
+    def test_negative_size(self) -> None:
+        with self.assertRaises(ValueError):
+            Matrix(-1, 2)
+
+    def test_convert(self) -> None:
+        self.assertEqual(asvector(range(3)).tolist(), [0.0, 1.0, 2.0])
+        self.assertEqual(asvector(array.array("d", [1.5])).tolist(), [1.5])
+        self.assertEqual(asmatrix([[1, 2], [3, 4]]).tolist(), [[1.0, 2.0], [3.0, 4.0]])
+        with self.assertRaises(ValueError):
+            asmatrix([[1, 2], [3]])
+
+    def test_buffer(self) -> None:
+        matrix = asmatrix([[1, 2, 3], [4, 5, 6]])
+        view = memoryview(matrix)
+        self.assertEqual(
+            (view.format, view.shape, view.c_contiguous), ("d", (2, 3), True)
+        )
+        view[0, 0] = 10.0
+        self.assertEqual(matrix[0, 0], 10.0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        matrix = asmatrix([[1, 2], [3, 4]])
+        view = np.asarray(matrix)
+        view[1, 1] = 0.0
+        self.assertEqual(matrix[1, 1], 0.0)
+        self.assertEqual(asmatrix(np.arange(6).reshape(2, 3)).shape, (2, 3))
+
+
+class TestKernels(TestBase):
+    def test_dot(self) -> None:
+        random.seed(0)
+        x = [random.uniform(-1.0, 1.0) for _ in range(1001)]
+        y = [random.uniform(-1.0, 1.0) for _ in range(1001)]
+        self.assertAlmostEqual(dot(x, y), sum(a * b for a, b in zip(x, y)))
+        self.assertEqual(dot([], []), 0.0)
+        with self.assertRaises(ValueError):
+            dot([1, 2], [1])
+
+    def test_axpy(self) -> None:
+        y = asvector([1, 2, 3])
+        self.assertIs(axpy(2.0, [1, 1, 1], y), y)
+        self.assertEqual(y.tolist(), [3.0, 4.0, 5.0])
+
+    def test_gemv(self) -> None:
+        random.seed(0)
+        a, x = _random_matrix(67, 45), [random.uniform(-1.0, 1.0) for _ in range(45)]
+        expected = [sum(v * w for v, w in zip(row, x)) for row in a]
+        self._assert_matrix(asmatrix([gemv(a, x).tolist()]), [expected])
+
+        y = asvector([1.0] * 67)
+        self.assertIs(gemv(a, x, y, alpha=2.0, beta=-1.0), y)
+        self._assert_matrix(asmatrix([y.tolist()]), [[2 * v - 1 for v in expected]])
+        with self.assertRaises(ValueError):
+            gemv(a, x[1:])
+
+    def test_gemm(self) -> None:
+        random.seed(0)
+        # sizes aren't multiples of block sizes, so all block tails are covered
+        a, b = _random_matrix(70, 300), _random_matrix(300, 261)
+        self._assert_matrix(gemm(a, b), _matmul(a, b))
+
+    def test_gemm_scale(self) -> None:
+        a, b = [[1, 2], [3, 4]], [[5, 6], [7, 8]]
+        c = asmatrix([[1, 1], [1, 1]])
+        self.assertIs(gemm(a, b, c, alpha=2.0, beta=3.0), c)
+        self._assert_matrix(c, [[41.0, 47.0], [89.0, 103.0]])
+        with self.assertRaises(ValueError):
+            gemm(a, b, Matrix(3, 2))
+        with self.assertRaises(ValueError):
+            gemm(a, [[1, 2, 3]])
+
+    def test_gemm_empty(self) -> None:
+        self._assert_matrix(gemm(Matrix(2, 0), Matrix(0, 3)), [[0.0] * 3] * 2)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        a, b = np.random.rand(130, 90), np.random.rand(90, 40)
+        np.testing.assert_allclose(np.asarray(gemm(a, b)), a @ b)
+        # row-strided views are used as is
+        np.testing.assert_allclose(
+            np.asarray(gemm(a[::2, :40], b[:40])), a[::2, :40] @ b[:40]
+        )
+        np.testing.assert_allclose(np.asarray(gemv(a, b[:, 0])), a @ b[:, 0])
+        out = np.ones((130, 40))
+        gemm(a, b, out, beta=1.0)
+        np.testing.assert_allclose(out, a @ b + 1.0)
+
+
+class TestCSR(TestBase):
+    @property
+    def dense(self) -> List[List[float]]:
+        return [[1, 0, 2], [0, 0, 0], [3, 4, 0], [0, 5, 0]]
+
+    def test_layout(self) -> None:
+        matrix = ascsr(self.dense)
+        self.assertEqual((matrix.shape, matrix.nnz, matrix.dtype), ((4, 3), 5, "d"))
+        self.assertEqual(list(matrix.data), [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(list(matrix.indices), [0, 2, 0, 1, 1])
+        self.assertEqual(list(matrix.indptr), [0, 2, 2, 4, 5])
+        self._assert_matrix(matrix.toarray(), self.dense)
+
+    def test_arrays_shared(self) -> None:
+        data = array.array("f", [1.0, 2.0])
+        matrix = CSRMatrix(data, [0, 2], [0, 1, 2])
+        self.assertIs(matrix.data, data)
+        self.assertEqual((matrix.shape, matrix.dtype), ((2, 3), "f"))
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            CSRMatrix([1.0], [5], [0, 1], (1, 3))
+        with self.assertRaises(ValueError):
+            CSRMatrix([1.0], [0], [0, 2], (1, 3))
+        with self.assertRaises(ValueError):
+            CSRMatrix([1.0, 2.0], [0], [0, 1], (1, 3))
+        with self.assertRaises(ValueError):
+            CSRMatrix([1.0], [0], [0, 1], (2, 3))
+
+    def test_rows(self) -> None:
+        matrix = ascsr(self.dense)
+        self._assert_matrix(matrix[2].toarray(), [self.dense[2]])
+        self._assert_matrix(matrix[-1].toarray(), [self.dense[-1]])
+        self._assert_matrix(matrix[1:3].toarray(), self.dense[1:3])
+        self._assert_matrix(matrix[::-2].toarray(), self.dense[::-2])
+        self.assertEqual(matrix[2:2].shape, (0, 3))
+        with self.assertRaises(IndexError):
+            matrix[4]
+
+    def test_dot(self) -> None:
+        random.seed(0)
+        matrix, dense = ascsr(self.dense), _random_matrix(3, 5)
+        self._assert_matrix(matrix.dot(dense), _matmul(self.dense, dense))
+        self.assertEqual((matrix @ [1, 1, 1]).tolist(), [3.0, 0.0, 7.0, 5.0])
+        self.assertEqual((ascsr(self.dense, "i") @ [1, 1, 1]).tolist(), [3, 0, 7, 5])
+        with self.assertRaises(ValueError):
+            matrix @ [1, 1]
+
+    def test_normalize(self) -> None:
+        matrix = ascsr(self.dense)
+        self.assertIs(matrix.normalize(), matrix)
+        self._assert_matrix(
+            matrix.toarray(),
+            [[0.2**0.5, 0, 0.8**0.5], [0, 0, 0], [0.6, 0.8, 0], [0, 1, 0]],
+        )
+        self._assert_matrix(
+            ascsr(self.dense, "f").normalize("l1").toarray(),
+            [[1 / 3, 0, 2 / 3], [0, 0, 0], [3 / 7, 4 / 7, 0], [0, 1, 0]],
+        )
+        with self.assertRaises(TypeError):
+            ascsr(self.dense, "i").normalize()
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self) -> None:
+        matrix = ascsr(self.dense)
+        data, indices, indptr = matrix.to_numpy()
+        self.assertEqual((data.dtype, indices.dtype, indptr.dtype), ("f8", "i4", "i8"))
+        data[0] = 10.0
+        self.assertEqual(matrix.data[0], 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
 from .src.base import BaseTokenizer
 from .src.regex import RegexTokenizer
 from .src.tokenizers import WhitespaceTokenizer, NaivePunctTokenizer, PunctTokenizer
+from .tokenizers import (
+    whitespace_tokenize,
+    whitespace_spans,
+    naive_punct_tokenize,
+    naive_punct_spans
+)
 
 __all__ = [
     "BaseTokenizer",
@@ -8,4 +14,8 @@ __all__ = [
     "WhitespaceTokenizer",
     "NaivePunctTokenizer",
     "PunctTokenizer",
+    "whitespace_tokenize",
+    "whitespace_spans",
+    "naive_punct_tokenize",
+    "naive_punct_spans",
 ]
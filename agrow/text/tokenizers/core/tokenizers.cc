@@ -0,0 +1,78 @@
+#include "tokenizers.h"
+
+namespace agrow {
+    // ASCII characters classes: \t\n\v\f\r, \x1c-\x1f and space are
+    // whitespaces, [0-9A-Za-z_] are word characters
+    static const unsigned char AG_ASCII_CLASSES[128] = {
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0,
+        0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2,
+        2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 1,
+        2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2,
+    };
+
+    static inline int ag_char_class(uint32_t ch, ag_char_class_t classify) {
+        return ch < 128 ? AG_ASCII_CLASSES[ch] : classify(ch);
+    }
+
+    template <typename T>
+    size_t ag_whitespace_spans(const T* text, size_t pos, size_t size,
+                               ag_char_class_t classify, size_t* spans,
+                               size_t max_spans) {
+        size_t count = 0;
+
+        while (count < max_spans) {
+            while (pos < size && ag_char_class(text[pos], classify) == AG_CHAR_SPACE)
+                pos++;
+            if (pos == size) break;
+
+            spans[2 * count] = pos;
+            while (pos < size && ag_char_class(text[pos], classify) != AG_CHAR_SPACE)
+                pos++;
+            spans[2 * count + 1] = pos;
+            count++;
+        }
+
+        return count;
+    }
+
+    template <typename T>
+    size_t ag_naive_punct_spans(const T* text, size_t pos, size_t size,
+                                ag_char_class_t classify, size_t* spans,
+                                size_t max_spans) {
+        size_t count = 0;
+
+        while (count < max_spans) {
+            int cls = AG_CHAR_SPACE;
+            while (pos < size
+                   && (cls = ag_char_class(text[pos], classify)) == AG_CHAR_SPACE)
+                pos++;
+            if (pos == size) break;
+
+            // token is the longest run of either word or punctuation characters
+            spans[2 * count] = pos++;
+            while (pos < size && ag_char_class(text[pos], classify) == cls) pos++;
+            spans[2 * count + 1] = pos;
+            count++;
+        }
+
+        return count;
+    }
+
+    template size_t ag_whitespace_spans<uint8_t>(const uint8_t*, size_t, size_t,
+                                                 ag_char_class_t, size_t*, size_t);
+    template size_t ag_whitespace_spans<uint16_t>(const uint16_t*, size_t, size_t,
+                                                  ag_char_class_t, size_t*, size_t);
+    template size_t ag_whitespace_spans<uint32_t>(const uint32_t*, size_t, size_t,
+                                                  ag_char_class_t, size_t*, size_t);
+
+    template size_t ag_naive_punct_spans<uint8_t>(const uint8_t*, size_t, size_t,
+                                                  ag_char_class_t, size_t*, size_t);
+    template size_t ag_naive_punct_spans<uint16_t>(const uint16_t*, size_t, size_t,
+                                                   ag_char_class_t, size_t*, size_t);
+    template size_t ag_naive_punct_spans<uint32_t>(const uint32_t*, size_t, size_t,
+                                                   ag_char_class_t, size_t*, size_t);
+}  // agrow
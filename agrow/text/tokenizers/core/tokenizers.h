@@ -0,0 +1,59 @@
+#ifndef __TOKENIZERS_CORE_TOKENIZERS_H__
+#define __TOKENIZERS_CORE_TOKENIZERS_H__
+
+#include <stddef.h>
+#include <stdint.h>
+
+// Character classes (the same as in Python regular expressions: \s is a
+// whitespace, \w is a word character, everything else is a punctuation)
+#define AG_CHAR_SPACE 0
+#define AG_CHAR_WORD 1
+#define AG_CHAR_PUNCT 2
+
+namespace agrow {
+    /*
+        @brief Character class function for non-ASCII characters (ASCII
+                characters are classified with a lookup table)
+        @param ch is a character code point
+        @return one of AG_CHAR_* classes
+    */
+    typedef int (*ag_char_class_t)(uint32_t ch);
+
+    /*
+        @brief This function is for finding whitespace separated tokens
+                (the same as r"\s+" regex split without empty tokens)
+        @param text is a pointer to the text characters (code units of 1, 2 or
+                4 bytes long, i.e. Python string data)
+        @param pos is a position to start searching tokens from
+        @param size is a number of characters in the text
+        @param classify is a character class function for non-ASCII characters
+        @param spans is a pointer to the output (start, end) pairs of tokens
+        @param max_spans is a maximum number of tokens to find
+        @return number of found tokens (if it is max_spans, searching should be
+                continued from the end of the last token)
+    */
+    template <typename T>
+    size_t ag_whitespace_spans(const T* text, size_t pos, size_t size,
+                               ag_char_class_t classify, size_t* spans,
+                               size_t max_spans);
+
+    /*
+        @brief This function is for finding words and punctuation sequences
+                tokens (the same as r"\w+|[^\w\s]+" regex search)
+        @param text is a pointer to the text characters (code units of 1, 2 or
+                4 bytes long, i.e. Python string data)
+        @param pos is a position to start searching tokens from
+        @param size is a number of characters in the text
+        @param classify is a character class function for non-ASCII characters
+        @param spans is a pointer to the output (start, end) pairs of tokens
+        @param max_spans is a maximum number of tokens to find
+        @return number of found tokens (if it is max_spans, searching should be
+                continued from the end of the last token)
+    */
+    template <typename T>
+    size_t ag_naive_punct_spans(const T* text, size_t pos, size_t size,
+                                ag_char_class_t classify, size_t* spans,
+                                size_t max_spans);
+}  // agrow
+
+#endif  // __TOKENIZERS_CORE_TOKENIZERS_H__
@@ -1,5 +1,10 @@
+import os
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Tokenizer of the current process pool worker (see stokenize(...))
+_WORKER_TOKENIZER: Optional["BaseTokenizer"] = None
 
 
 class BaseTokenizer(ABC):
@@ -12,6 +17,10 @@ class BaseTokenizer(ABC):
           tokenization.
     """
 
+    # Number of characters after a token which could change it (i.e. regex
+    # lookaheads), see stream_tokenize(...)
+    stream_lookahead: int = 64
+
     @abstractmethod
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -32,21 +41,160 @@ class BaseTokenizer(ABC):
 
         return self.stokenize([string])[0]
 
-    def stokenize(self, strings: List[str]) -> List[List[str]]:
+    def itokenize(self, string: str) -> Iterator[str]:
+        """
+        Lazy single string (sentence/context) tokenization method. Yields
+        tokens one by one instead of building a list. By default it iterates
+        over tokenize(...) output, regex based tokenizers override it.
+
+        Args:
+            string (str) : String (sentence/context) to be tokenized
+
+        Returns:
+            Iterator of tokens, i.e "string to tokenize" -> "string", "to", "tokenize"
+        """
+
+        return iter(self.tokenize(string))
+
+    def span_tokenize(self, string: str) -> Iterator[Tuple[int, int]]:
+        """
+        Lazy single string (sentence/context) tokenization method which yields
+        tokens (start, end) offsets, so string[start:end] is a token. Should be
+        overridden by tokenizers which can find token offsets.
+
+        Args:
+            string (str) : String (sentence/context) to be tokenized
+
+        Returns:
+            Iterator of token offsets, i.e "string to tokenize" -> (0, 6), (7, 9), (10, 18)
+        """
+
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support span tokenization"
+        )
+
+    def stream_tokenize(
+        self,
+        source: Union[IO[str], Iterable[str]],
+        chunksize: int = 1 << 16,
+        spans: bool = False,
+    ) -> Iterator[Union[str, Tuple[int, int]]]:
+        """
+        Lazy tokenization of a text which doesn't fit (or shouldn't be loaded)
+        in memory. Text is read from a file object (opened in text mode) by
+        chunksize characters or is taken from an iterable of text chunks. Tokens
+        are found with span_tokenize(...) and the tail of the text read so far
+        is held back and scanned again with the next chunk. The tail starts at
+        the earliest token which is followed by a token starting less than
+        stream_lookahead characters before the end of the text read so far, so
+        tokens crossing chunk boundaries (even ones containing whitespaces) are
+        the same as if the whole text was tokenized at once, for any chunksize.
+
+        Args:
+            source (Union[IO[str], Iterable[str]]) : File object or iterable of text
+                                                     chunks to be tokenized
+            chunksize (int)                        : Number of characters read from
+                                                     a file object at once
+            spans (bool)                           : If (start, end) offsets in the
+                                                     whole text should be yielded
+                                                     instead of tokens flag
+
+        Returns:
+            Iterator of tokens (or token offsets) of the whole text
+        """
+
+        if chunksize < 1:
+            raise ValueError(f"Chunk size should be positive, got {chunksize}")
+
+        read = getattr(source, "read", None)
+        chunks = iter(lambda: read(chunksize), "") if read is not None else source
+
+        buffer, offset = "", 0
+        for chunk in chunks:
+            buffer += chunk
+            found = list(self.span_tokenize(buffer))
+
+            # A token is final once the next token is found and enough text
+            # follows it, matches closer to the end could still change (grow,
+            # merge or split) with the next chunk. Scanning is resumed from the
+            # start of the first token which isn't final, so separators before
+            # it aren't scanned again (which would give extra empty gaps).
+            limit = len(buffer) - self.stream_lookahead
+            keep = found[0][0] if found else max(0, limit)
+            for (start, end), (following, _) in zip(found, found[1:]):
+                if following > limit:
+                    break
+                yield (offset + start, offset + end) if spans else buffer[start:end]
+                keep = following
+
+            buffer, offset = buffer[keep:], offset + keep
+
+        for start, end in self.span_tokenize(buffer):
+            yield (offset + start, offset + end) if spans else buffer[start:end]
+
+    def stokenize(
+        self,
+        strings: Iterable[str],
+        n_jobs: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ) -> List[List[str]]:
         """
         Abstract list of strings (group of sentences/contexts) tokenization
         method. Runs tokenize for each string (sentence/context) in a list
-        of strings.
+        of strings. With n_jobs != 1 strings are split into chunks which are
+        tokenized by a pool of processes. Every worker process gets a copy
+        of the tokenizer (with its compiled state) once, when it starts.
 
         Args:
-            strings (List[str]) : List of strings (sentences/contexts) to be
-                                  tokenized
+            strings (Iterable[str])   : List of strings (sentences/contexts) to be
+                                        tokenized
+            n_jobs (Optional[int])    : Number of worker processes (None or -1 to
+                                        use all CPUs)
+            chunksize (Optional[int]) : Number of strings sent to a worker at once
+                                        (by default strings are split into about
+                                        4 chunks per worker)
 
         Returns:
-            List of tokenized strings (sentences/contexts), i.e:
+            List of tokenized strings (sentences/contexts) in the input order, i.e:
 
             ["first string of tokens", "second string of tokens"] ->
             [["first", "string", "of", "tokens"], ["second", "string", "of", "tokens"]]
         """
 
-        return [self.tokenize(string) for string in strings]
+        if n_jobs is None or n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs < 1:
+            raise ValueError(f"Number of jobs should be positive or -1, got {n_jobs}")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"Chunk size should be positive, got {chunksize}")
+
+        if n_jobs == 1:
+            return [self.tokenize(string) for string in strings]
+
+        strings = list(strings)
+        chunksize = chunksize or max(1, -(-len(strings) // (4 * n_jobs)))
+        chunks = [
+            strings[start : start + chunksize]
+            for start in range(0, len(strings), chunksize)
+        ]
+        if len(chunks) < 2:
+            return [self.tokenize(string) for string in strings]
+
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(chunks)),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            return [
+                tokens for chunk in pool.map(_stokenize, chunks) for tokens in chunk
+            ]
+
+
+def _init_worker(tokenizer: BaseTokenizer) -> None:
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = tokenizer
+
+
+def _stokenize(strings: List[str]) -> List[List[str]]:
+    tokenize = _WORKER_TOKENIZER.tokenize
+    return [tokenize(string) for string in strings]
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import Iterator, List, Tuple
 
 from .base import BaseTokenizer
 
@@ -78,3 +78,45 @@ class RegexTokenizer(BaseTokenizer):
                 return self.regex.split(string)
         else:
             return self.regex.findall(string)
+
+    def itokenize(self, string: str) -> Iterator[str]:
+        """
+        Lazy RegexTokenizer tokenization method. Yields the same tokens as
+        tokenize(...) (whole matches for patterns with groups) one by one.
+
+        Args:
+            string (str) : String (sentence/context) to be tokenized
+
+        Returns:
+            Iterator of tokens, i.e "string to tokenize" -> "string", "to", "tokenize"
+        """
+
+        if self.find_gaps:
+            return (string[start:end] for start, end in self.span_tokenize(string))
+        return (match.group() for match in self.regex.finditer(string))
+
+    def span_tokenize(self, string: str) -> Iterator[Tuple[int, int]]:
+        """
+        Lazy RegexTokenizer tokenization method which yields tokens (start, end)
+        offsets. Offsets are taken from the matches (or gaps between matches if
+        find_gaps is set) found with finditer.
+
+        Args:
+            string (str) : String (sentence/context) to be tokenized
+
+        Returns:
+            Iterator of token offsets, i.e "string to tokenize" -> (0, 6), (7, 9), (10, 18)
+        """
+
+        if not self.find_gaps:
+            for match in self.regex.finditer(string):
+                yield match.span()
+            return
+
+        start = 0
+        for match in self.regex.finditer(string):
+            if match.start() > start or not self.remove_empty:
+                yield start, match.start()
+            start = match.end()
+        if len(string) > start or not self.remove_empty:
+            yield start, len(string)
@@ -1,9 +1,23 @@
 import re
-from typing import List
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
 
 from .base import BaseTokenizer
 from .regex import RegexTokenizer
 
+try:
+    from ..tokenizers import (
+        whitespace_tokenize,
+        whitespace_spans,
+        naive_punct_tokenize,
+        naive_punct_spans,
+    )
+except ImportError:
+    # compiled module isn't built (or src is imported as a top-level package),
+    # regular expressions are used then
+    whitespace_tokenize = whitespace_spans = None
+    naive_punct_tokenize = naive_punct_spans = None
+
 
 class WhitespaceTokenizer(RegexTokenizer):
     """
@@ -22,6 +36,32 @@ class WhitespaceTokenizer(RegexTokenizer):
 
         RegexTokenizer.__init__(self, pattern=r"\s+", find_gaps=True)
 
+    def tokenize(self, string: str) -> List[str]:
+        """
+        Splits string on whitespaces with the compiled scanner (if it is
+        built), otherwise with the regular expression.
+
+        Args:
+            string (str) : String (sentence/context) to be tokenized
+
+        Returns:
+            List of tokens, i.e "string to tokenize" -> ["string", "to", "tokenize"]
+        """
+
+        if whitespace_tokenize is None:
+            return RegexTokenizer.tokenize(self, string)
+        return whitespace_tokenize(string)
+
+    def span_tokenize(self, string: str) -> Iterator[Tuple[int, int]]:
+        """
+        Finds tokens (start, end) offsets with the compiled scanner (if it is
+        built), otherwise with the regular expression.
+        """
+
+        if whitespace_spans is None:
+            return RegexTokenizer.span_tokenize(self, string)
+        return iter(whitespace_spans(string))
+
 
 class NaivePunctTokenizer(RegexTokenizer):
     r"""
@@ -41,19 +81,72 @@ class NaivePunctTokenizer(RegexTokenizer):
 
         RegexTokenizer.__init__(self, pattern=r"\w+|[^\w\s]+")
 
+    def tokenize(self, string: str) -> List[str]:
+        """
+        Splits string to words and punctuation sequences with the compiled
+        scanner (if it is built), otherwise with the regular expression.
+
+        Args:
+            string (str) : String (sentence/context) to be tokenized
+
+        Returns:
+            List of tokens, i.e "cost $10.48" -> ["cost", "$", "10", ".", "48"]
+        """
+
+        if naive_punct_tokenize is None:
+            return RegexTokenizer.tokenize(self, string)
+        return naive_punct_tokenize(string)
+
+    def span_tokenize(self, string: str) -> Iterator[Tuple[int, int]]:
+        """
+        Finds tokens (start, end) offsets with the compiled scanner (if it is
+        built), otherwise with the regular expression.
+        """
+
+        if naive_punct_spans is None:
+            return RegexTokenizer.span_tokenize(self, string)
+        return iter(naive_punct_spans(string))
+
 
 class PunctTokenizer(BaseTokenizer):
     """
     Stores regular expressions for string tokenization with respect to
-    punctuation
+    punctuation. Regular expression is compiled once per configuration
+    (ending context chars, word start chars, flags) and shared by all
+    instances with the same configuration.
     """
 
+    def __init__(
+        self,
+        cend: Iterable[str] = ".!?;:",
+        word_start: Iterable[str] = '()[]{}"`:;&#*@-,',
+        rflags: re.RegexFlag = re.UNICODE | re.VERBOSE,
+    ) -> None:
+        """
+        Initializes PunctTokenizer object with given parameters. Takes compiled
+        regular expression from the process-wide cache (compiles it only if
+        there is no tokenizer with the same parameters yet).
+
+        Args:
+            cend (Iterable[str])       : Ending context chars
+            word_start (Iterable[str]) : Characters which can't start word tokens
+            rflags (re.RegexFlag)      : Regex compilation flags
+
+        Returns:
+            None (only initializes PunctTokenizer instance)
+        """
+
+        self.cend = "".join(cend)
+        self.word_start = "".join(word_start)
+        self.rflags = rflags
+        self._RE_STRING_TOKENIZER = _compile_punct(self.cend, self.word_start, rflags)
+
     def __repr__(self) -> str:
         return "{}(string_tokenizer_regex={})".format(
             __class__.__name__, self._RE_STRING_TOKENIZER
         )
 
-    __slots__ = ["_RE_STRING_TOKENIZER"]
+    __slots__ = ["cend", "word_start", "rflags", "_RE_STRING_TOKENIZER"]
 
     # Format of a regular expression to split punctuation from words
     # (taken from nltk sources)
@@ -71,18 +164,13 @@ class PunctTokenizer(BaseTokenizer):
         \S
     )"""
 
-    # Ending context chars
-    cend = (".", "!", "?", ";", ":")
-
     """
     Characters that cannot appear without words
     """
 
     @property
     def _re_non_word_chars(self):
-        return r"(?:[)\";}\]\*:@\'\({\[%s])" % re.escape(
-            "".join(set(self.cend) - {"."})
-        )
+        return _re_non_word_chars(self.cend)
 
     """
     Multi-char punctuation symbols
@@ -92,24 +180,17 @@ class PunctTokenizer(BaseTokenizer):
     """
     Excludes some characters from starting word tokens
     """
-    _re_word_start = r"[^\(\"\`{\[:;&\#\*@\)}\]\-,]"
+
+    @property
+    def _re_word_start(self):
+        return _re_word_start(self.word_start)
 
     """
-    Compiles word search regular experession
+    Compiled word search regular experession
     """
 
     @property
-    def gstring_re(self) -> str:
-        self._RE_STRING_TOKENIZER = re.compile(
-            self._STRING_TOKENIZER_FMT
-            % {
-                "NonWord": self._re_non_word_chars,
-                "WordStart": self._re_word_start,
-                "MultiChar": self._re_multi_char_punct,
-            },
-            re.UNICODE | re.VERBOSE,
-        )
-
+    def gstring_re(self) -> re.Pattern:
         return self._RE_STRING_TOKENIZER
 
     def tokenize(self, string: str) -> List[str]:
@@ -125,4 +206,65 @@ class PunctTokenizer(BaseTokenizer):
             List of tokens, i.e "string to tokenize" -> ["string", "to", "tokenize"]
         """
 
-        return self.gstring_re.findall(string)
+        return self._RE_STRING_TOKENIZER.findall(string)
+
+    def itokenize(self, string: str) -> Iterator[str]:
+        """
+        Lazy version of tokenize(...). Yields tokens one by one.
+
+        Args:
+            string (str) : String to be tokenized
+
+        Returns:
+            Iterator of tokens, i.e "string to tokenize" -> "string", "to", "tokenize"
+        """
+
+        return (match.group() for match in self._RE_STRING_TOKENIZER.finditer(string))
+
+    def span_tokenize(self, string: str) -> Iterator[Tuple[int, int]]:
+        """
+        Lazy tokenization method which yields tokens (start, end) offsets,
+        so string[start:end] is a token.
+
+        Args:
+            string (str) : String to be tokenized
+
+        Returns:
+            Iterator of token offsets, i.e "string to tokenize" -> (0, 6), (7, 9), (10, 18)
+        """
+
+        return (match.span() for match in self._RE_STRING_TOKENIZER.finditer(string))
+
+
+def _re_non_word_chars(cend: str) -> str:
+    return r"(?:[)\";}\]\*:@\'\({\[%s])" % re.escape(cend.replace(".", ""))
+
+
+def _re_word_start(word_start: str) -> str:
+    return r"[^%s]" % re.escape(word_start)
+
+
+@lru_cache(maxsize=None)
+def _compile_punct(cend: str, word_start: str, rflags: re.RegexFlag) -> re.Pattern:
+    """
+    Compiles PunctTokenizer regular expression for the given configuration.
+    Results are cached process-wide, so every configuration is compiled once.
+
+    Args:
+        cend (str)            : Ending context chars
+        word_start (str)      : Characters which can't start word tokens
+        rflags (re.RegexFlag) : Regex compilation flags
+
+    Returns:
+        Compiled regular expression
+    """
+
+    return re.compile(
+        PunctTokenizer._STRING_TOKENIZER_FMT
+        % {
+            "NonWord": _re_non_word_chars(cend),
+            "WordStart": _re_word_start(word_start),
+            "MultiChar": PunctTokenizer._re_multi_char_punct,
+        },
+        rflags,
+    )
@@ -0,0 +1,152 @@
+from cpython.unicode cimport (
+    PyUnicode_KIND,
+    PyUnicode_DATA,
+    PyUnicode_GET_LENGTH,
+    PyUnicode_1BYTE_KIND,
+    PyUnicode_2BYTE_KIND,
+)
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+
+
+cdef extern from "Python.h" nogil:
+    # unicode database lookups, they don't touch Python objects
+    bint Py_UNICODE_ISSPACE(Py_UCS4 ch)
+    bint Py_UNICODE_ISALNUM(Py_UCS4 ch)
+
+
+cdef extern from "core/tokenizers.h" nogil:
+    int AG_CHAR_SPACE
+    int AG_CHAR_WORD
+    int AG_CHAR_PUNCT
+
+
+cdef extern from "core/tokenizers.h" namespace "agrow" nogil:
+    ctypedef int (*ag_char_class_t)(uint32_t ch) noexcept nogil
+
+    size_t ag_whitespace_spans[T](
+        const T* text, size_t pos, size_t size, ag_char_class_t classify,
+        size_t* spans, size_t max_spans
+    )
+    size_t ag_naive_punct_spans[T](
+        const T* text, size_t pos, size_t size, ag_char_class_t classify,
+        size_t* spans, size_t max_spans
+    )
+
+
+ctypedef fused char_t:
+    uint8_t
+    uint16_t
+    uint32_t
+
+
+# Compiled versions of WhitespaceTokenizer (r"\s+" gaps) and NaivePunctTokenizer
+# (r"\w+|[^\w\s]+") regular expressions. Strings are scanned once, character
+# by character, in their own (1, 2 or 4 bytes per character) representation
+# with the GIL released. Tokens are found in batches of _MAX_SPANS, so memory
+# used for token offsets doesn't depend on the string length.
+cdef enum:
+    _MAX_SPANS = 1024
+
+
+cdef int _char_class(uint32_t ch) noexcept nogil:
+    # the same classes as \s and \w of Python regular expressions
+    if Py_UNICODE_ISSPACE(ch):
+        return AG_CHAR_SPACE
+    if ch == 95 or Py_UNICODE_ISALNUM(ch):  # 95 is "_"
+        return AG_CHAR_WORD
+    return AG_CHAR_PUNCT
+
+
+cdef size_t _scan(
+    const char_t* text, size_t pos, size_t size, bint punct, size_t* spans
+) noexcept nogil:
+    if punct:
+        return ag_naive_punct_spans(text, pos, size, _char_class, spans, _MAX_SPANS)
+    return ag_whitespace_spans(text, pos, size, _char_class, spans, _MAX_SPANS)
+
+
+cdef list _tokenize(str string, bint punct, bint spans_only):
+    cdef int kind = PyUnicode_KIND(string)
+    cdef void* data = PyUnicode_DATA(string)
+    cdef size_t size = PyUnicode_GET_LENGTH(string)
+    cdef size_t spans[2 * _MAX_SPANS]
+    cdef size_t pos = 0, count = _MAX_SPANS, i
+    cdef list tokens = []
+
+    while count == _MAX_SPANS:
+        with nogil:
+            if kind == PyUnicode_1BYTE_KIND:
+                count = _scan(<const uint8_t*>data, pos, size, punct, spans)
+            elif kind == PyUnicode_2BYTE_KIND:
+                count = _scan(<const uint16_t*>data, pos, size, punct, spans)
+            else:
+                count = _scan(<const uint32_t*>data, pos, size, punct, spans)
+
+        if spans_only:
+            for i in range(count):
+                tokens.append((spans[2 * i], spans[2 * i + 1]))
+        else:
+            for i in range(count):
+                tokens.append(string[spans[2 * i] : spans[2 * i + 1]])
+        if count:
+            pos = spans[2 * count - 1]
+
+    return tokens
+
+
+def whitespace_tokenize(str string):
+    """
+    Splits string on whitespaces, the same as WhitespaceTokenizer().tokenize(...)
+    (or str.split()).
+
+    Args:
+        string (str) : String to be tokenized
+
+    Returns:
+        List of tokens, i.e "string\\tto\\n tokenize" -> ["string", "to", "tokenize"]
+    """
+
+    return _tokenize(string, False, False)
+
+
+def whitespace_spans(str string):
+    """
+    Finds (start, end) offsets of whitespace separated tokens.
+
+    Args:
+        string (str) : String to be tokenized
+
+    Returns:
+        List of token offsets, i.e "string to tokenize" -> [(0, 6), (7, 9), (10, 18)]
+    """
+
+    return _tokenize(string, False, True)
+
+
+def naive_punct_tokenize(str string):
+    """
+    Splits string to words and punctuation sequences, the same as
+    NaivePunctTokenizer().tokenize(...).
+
+    Args:
+        string (str) : String to be tokenized
+
+    Returns:
+        List of tokens, i.e "cost $10.48" -> ["cost", "$", "10", ".", "48"]
+    """
+
+    return _tokenize(string, True, False)
+
+
+def naive_punct_spans(str string):
+    """
+    Finds (start, end) offsets of words and punctuation sequences.
+
+    Args:
+        string (str) : String to be tokenized
+
+    Returns:
+        List of token offsets, i.e "cost $10.48" -> [(0, 4), (5, 6), (6, 8), (8, 9), (9, 11)]
+    """
+
+    return _tokenize(string, True, True)
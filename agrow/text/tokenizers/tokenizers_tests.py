@@ -1,11 +1,24 @@
+import io
+import sys
 import unittest
 from enum import Enum
+from types import SimpleNamespace
 from typing import Callable, List
 
+from src.regex import RegexTokenizer
 from src.tokenizers import WhitespaceTokenizer, NaivePunctTokenizer, PunctTokenizer
+from tokenizers import (
+    whitespace_tokenize,
+    whitespace_spans,
+    naive_punct_tokenize,
+    naive_punct_spans,
+)
 
 from nltk.tokenize import WhitespaceTokenizer as nltk_ws_tkn
 from nltk.tokenize import wordpunct_tokenize, word_tokenize
+from nltk.tokenize.punkt import PunktLanguageVars
+
+punkt_tokenize = PunktLanguageVars().word_tokenize
 
 
 class TestBase(unittest.TestCase):
@@ -122,20 +135,187 @@ class TestNaivePunct(TestBase):
         self._run_test(self.tokenizer.tokenize, wordpunct_tokenize, "L")
 
 
-# class TestPunct(unittest.TestCase):
-#     @property
-#     def tokenizer(self) -> Callable:
-#         return Tokenizers.PUNCT.value()
+class TestNativeWhitespace(TestWhitespace):
+    @property
+    def tokenizer(self) -> Callable:
+        return SimpleNamespace(tokenize=whitespace_tokenize)
+
+
+class TestNativeNaivePunct(TestNaivePunct):
+    @property
+    def tokenizer(self) -> Callable:
+        return SimpleNamespace(tokenize=naive_punct_tokenize)
+
+
+class TestNative(unittest.TestCase):
+    @property
+    def inputs(self) -> List[str]:
+        # 1, 2 and 4 bytes per character strings, and all of code points at once
+        return [
+            "Lorem ipsum, dolor_sit 42amet!",
+            "Привет,\u2003мир… ¿qué? ½",
+            "emoji 😀😀 and\u3000ideographic　space",
+            "".join(map(chr, range(sys.maxunicode + 1))).replace("\ud800", ""),
+        ]
+
+    def test_regex(self) -> None:
+        for native, tokenizer in (
+            (whitespace_tokenize, WhitespaceTokenizer()),
+            (naive_punct_tokenize, NaivePunctTokenizer()),
+        ):
+            for input in self.inputs:
+                self.assertEqual(native(input), tokenizer.tokenize(input))
+
+    def test_spans(self) -> None:
+        for native, tokenizer in (
+            (whitespace_spans, WhitespaceTokenizer()),
+            (naive_punct_spans, NaivePunctTokenizer()),
+        ):
+            for input in self.inputs:
+                self.assertEqual(native(input), list(tokenizer.span_tokenize(input)))
+
+    def test_many_tokens(self) -> None:
+        # more tokens than a single batch of offsets holds
+        input = "a, " * 5000
+        self.assertEqual(whitespace_tokenize(input), input.split())
+        self.assertEqual(naive_punct_tokenize(input), ["a", ","] * 5000)
+
+
+class TestPunct(TestBase):
+    @property
+    def tokenizer(self) -> Callable:
+        return Tokenizers.PUNCT.value()
+
+    def test_empty_string(self) -> None:
+        self._run_test(self.tokenizer.tokenize, punkt_tokenize, "")
+
+    def test_simple_phrase(self) -> None:
+        self._run_test(
+            self.tokenizer.tokenize, punkt_tokenize, "Burger costs $5.4 dollars"
+        )
+
+    def test_with_punct(self) -> None:
+        self._run_test(
+            self.tokenizer.tokenize,
+            punkt_tokenize,
+            'Mr. Smith (the "boss") said: no;yes -- really... Lorem, ipsum!',
+        )
+
+    def test_only_punct(self) -> None:
+        self._run_test(self.tokenizer.tokenize, punkt_tokenize, ",?.,;")
+
+    def test_end_of_sentence(self) -> None:
+        self._run_test(self.tokenizer.tokenize, punkt_tokenize, "Lorem ipsum end.")
 
-#     def __check_equal(self, expected_output: List[str], input: str) -> None:
-#         self.assertEqual(
-#             self.tokenizer.tokenize.tokenize(input),
-#             expected_output,
-#             self.__assert_message(expected_output=expected_output, input=input),
-#         )
+    def test_compiled_once(self) -> None:
+        self.assertIs(self.tokenizer.gstring_re, self.tokenizer.gstring_re)
+        self.assertIs(
+            PunctTokenizer(cend="!?").gstring_re, PunctTokenizer(cend="!?").gstring_re
+        )
 
-#     def test_empty_string(self):
-#         _self._run_test()
+    def test_custom_chars(self) -> None:
+        self.assertEqual(PunctTokenizer(cend=".").tokenize("a!b c?d"), ["a!b", "c?d"])
+        self.assertEqual(
+            PunctTokenizer(word_start="-").tokenize("(a) -b"), ["(a", ")", "-", "b"]
+        )
+
+
+class TestBatch(unittest.TestCase):
+    @property
+    def input(self) -> List[str]:
+        return [f"Sentence number {idx}, with punct." for idx in range(100)]
+
+    def test_parallel(self) -> None:
+        for tokenizer in (PunctTokenizer(), NaivePunctTokenizer()):
+            self.assertEqual(
+                tokenizer.stokenize(self.input, n_jobs=2, chunksize=7),
+                tokenizer.stokenize(self.input),
+            )
+
+    def test_generator(self) -> None:
+        tokenizer = WhitespaceTokenizer()
+        self.assertEqual(
+            tokenizer.stokenize(iter(self.input), n_jobs=2),
+            [string.split() for string in self.input],
+        )
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            PunctTokenizer().stokenize(self.input, n_jobs=0)
+        with self.assertRaises(ValueError):
+            PunctTokenizer().stokenize(self.input, n_jobs=2, chunksize=0)
+
+
+class TestIterators(unittest.TestCase):
+    @property
+    def input(self) -> str:
+        return 'Mr. Smith (the "boss")  said: no;yes -- really... Lorem, ipsum! end'
+
+    @property
+    def tokenizers(self) -> List[Callable]:
+        return [
+            WhitespaceTokenizer(),
+            NaivePunctTokenizer(),
+            PunctTokenizer(),
+            RegexTokenizer(r"\s", find_gaps=True, remove_empty=False),
+        ]
+
+    def test_itokenize(self) -> None:
+        for tokenizer in self.tokenizers:
+            tokens = tokenizer.itokenize(self.input)
+            self.assertNotIsInstance(tokens, list)
+            self.assertEqual(list(tokens), tokenizer.tokenize(self.input))
+
+    def test_span_tokenize(self) -> None:
+        for tokenizer in self.tokenizers:
+            for input in (self.input, " " + self.input + " ", ""):
+                self.assertEqual(
+                    [input[start:end] for start, end in tokenizer.span_tokenize(input)],
+                    tokenizer.tokenize(input),
+                )
+
+    def test_stream(self) -> None:
+        for tokenizer in self.tokenizers[:3]:
+            expected = tokenizer.tokenize(self.input)
+            for chunksize in (1, 2, 3, 7, 100):
+                self.assertEqual(
+                    list(tokenizer.stream_tokenize(io.StringIO(self.input), chunksize)),
+                    expected,
+                )
+
+    def test_stream_spans(self) -> None:
+        tokenizer = PunctTokenizer()
+        chunks = [
+            self.input[start : start + 5] for start in range(0, len(self.input), 5)
+        ]
+        self.assertEqual(
+            list(tokenizer.stream_tokenize(chunks, spans=True)),
+            list(tokenizer.span_tokenize(self.input)),
+        )
+        with self.assertRaises(ValueError):
+            next(tokenizer.stream_tokenize(io.StringIO(self.input), chunksize=0))
+
+    def test_stream_boundaries(self) -> None:
+        tokenizers = [
+            (PunctTokenizer(), "He paused. . . and left. Then -- nothing. " * 4),
+            (RegexTokenizer(r"\s+", find_gaps=True, remove_empty=False), "a  b c   "),
+        ]
+        for tokenizer, text in tokenizers:
+            expected = tokenizer.tokenize(text)
+            spans = list(tokenizer.span_tokenize(text))
+            for chunksize in range(1, len(text) + 1):
+                self.assertEqual(
+                    list(tokenizer.stream_tokenize(io.StringIO(text), chunksize)),
+                    expected,
+                )
+                self.assertEqual(
+                    list(
+                        tokenizer.stream_tokenize(
+                            io.StringIO(text), chunksize, spans=True
+                        )
+                    ),
+                    spans,
+                )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 from .src.base import BaseVectorizer
 from .src.count import CountVectorizer
 from .src.tfidf import TfidfVectorizer
+from .src.hashing import HashingVectorizer
 from .src.word2vec import Word2Vec
 
 
@@ -8,5 +9,6 @@ __all__ = [
     "BaseVectorizer",
     "CountVectorizer",
     "TfidfVectorizer",
+    "HashingVectorizer",
     "Word2Vec",
 ]
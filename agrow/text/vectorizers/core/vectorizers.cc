@@ -0,0 +1,83 @@
+#include "vectorizers.h"
+
+#include <math.h>
+#include <string.h>
+
+namespace agrow {
+    static inline double ag_vdot(const double* x, const double* y, size_t dim) {
+        double acc = 0;
+        for (size_t i = 0; i < dim; i++) acc += x[i] * y[i];
+        return acc;
+    }
+
+    // log(sigmoid(x)) without overflows for large |x|
+    static inline double ag_log_sigmoid(double x) {
+        return x >= 0 ? -log1p(exp(-x)) : x - log1p(exp(x));
+    }
+
+    /*
+        One binary logistic regression step of the hidden vector h against the
+        output vector v: gradient of h is accumulated in work (h is updated
+        after all outputs of the pair, as in the reference implementation),
+        v is updated in place
+    */
+    static inline double ag_output_update(const double* h, double* v, size_t dim,
+                                          double label, double alpha,
+                                          double* work) {
+        double f = ag_vdot(h, v, dim);
+        double g = alpha * (label - 1 / (1 + exp(-f)));
+
+        for (size_t i = 0; i < dim; i++) work[i] += g * v[i];
+        for (size_t i = 0; i < dim; i++) v[i] += g * h[i];
+
+        return -ag_log_sigmoid(label > 0 ? f : -f);
+    }
+
+    static inline void ag_hidden_update(double* h, const double* work, size_t dim) {
+        for (size_t i = 0; i < dim; i++) h[i] += work[i];
+    }
+
+    double ag_sgns_update(double* w1, double* w2t, size_t dim,
+                          const int32_t* centers, const int32_t* contexts,
+                          size_t size, const int32_t* negatives, size_t negative,
+                          double alpha, double* work) {
+        double loss = 0;
+
+        for (size_t p = 0; p < size; p++) {
+            double* h = w1 + (size_t)centers[p] * dim;
+            const int32_t* sampled = negatives + p * negative;
+
+            memset(work, 0, dim * sizeof(double));
+            loss += ag_output_update(h, w2t + (size_t)contexts[p] * dim, dim, 1,
+                                     alpha, work);
+            for (size_t k = 0; k < negative; k++) {
+                if (sampled[k] == contexts[p]) continue;
+                loss += ag_output_update(h, w2t + (size_t)sampled[k] * dim, dim, 0,
+                                         alpha, work);
+            }
+            ag_hidden_update(h, work, dim);
+        }
+
+        return loss;
+    }
+
+    double ag_hs_update(double* w1, double* w2t, size_t dim,
+                        const int32_t* centers, const int32_t* contexts,
+                        size_t size, const int32_t* points, const int8_t* codes,
+                        const int64_t* offsets, double alpha, double* work) {
+        double loss = 0;
+
+        for (size_t p = 0; p < size; p++) {
+            double* h = w1 + (size_t)centers[p] * dim;
+
+            memset(work, 0, dim * sizeof(double));
+            for (int64_t j = offsets[contexts[p]]; j < offsets[contexts[p] + 1]; j++)
+                // branch 0 is the positive label (as in the reference implementation)
+                loss += ag_output_update(h, w2t + (size_t)points[j] * dim, dim,
+                                         1 - codes[j], alpha, work);
+            ag_hidden_update(h, work, dim);
+        }
+
+        return loss;
+    }
+}  // agrow
@@ -0,0 +1,57 @@
+#ifndef __VECTORIZERS_CORE_VECTORIZERS_H__
+#define __VECTORIZERS_CORE_VECTORIZERS_H__
+
+#include <stddef.h>
+#include <stdint.h>
+
+namespace agrow {
+    /*
+        @brief This function is for Word2Vec negative sampling SGD over
+                training pairs. Every pair updates the embedding of its center
+                and output vectors of its context and negatives right away,
+                without any locks, so it could be run by several threads on the
+                same weights at once (Hogwild)
+        @param w1 is a pointer to the embeddings (row-major, dim columns)
+        @param w2t is a pointer to the output vectors (row-major, dim columns)
+        @param dim is an embedding size
+        @param centers is a pointer to the center words indices
+        @param contexts is a pointer to the context words indices
+        @param size is a number of training pairs
+        @param negatives is a pointer to the negative words indices (row-major,
+                negative indices per pair), ones equal to the context are skipped
+        @param negative is a number of negative words per pair
+        @param alpha is a learning rate
+        @param work is a pointer to dim elements of scratch memory
+        @return sum of pairs losses (negative log-likelihood of labels)
+    */
+    double ag_sgns_update(double* w1, double* w2t, size_t dim,
+                          const int32_t* centers, const int32_t* contexts,
+                          size_t size, const int32_t* negatives, size_t negative,
+                          double alpha, double* work);
+
+    /*
+        @brief This function is for Word2Vec hierarchical softmax SGD over
+                training pairs. Every pair updates the embedding of its center
+                and vectors of inner nodes on the Huffman tree path of its
+                context right away, without any locks (Hogwild)
+        @param w1 is a pointer to the embeddings (row-major, dim columns)
+        @param w2t is a pointer to the inner nodes vectors (row-major, dim columns)
+        @param dim is an embedding size
+        @param centers is a pointer to the center words indices
+        @param contexts is a pointer to the context words indices
+        @param size is a number of training pairs
+        @param points is a pointer to the inner nodes of all paths
+        @param codes is a pointer to the branches (0 or 1) of all paths
+        @param offsets is a pointer to the paths offsets, path of i-th word is
+                [offsets[i], offsets[i + 1]) range of points and codes
+        @param alpha is a learning rate
+        @param work is a pointer to dim elements of scratch memory
+        @return sum of pairs losses (negative log-likelihood of contexts)
+    */
+    double ag_hs_update(double* w1, double* w2t, size_t dim,
+                        const int32_t* centers, const int32_t* contexts,
+                        size_t size, const int32_t* points, const int8_t* codes,
+                        const int64_t* offsets, double alpha, double* work);
+}  // agrow
+
+#endif  // __VECTORIZERS_CORE_VECTORIZERS_H__
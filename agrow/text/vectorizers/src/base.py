@@ -1,15 +1,41 @@
 from abc import ABC, abstractmethod
+import array
+from collections import Counter
+from functools import lru_cache
+import heapq
+from itertools import islice
+import math
+import os
 import nltk
 from nltk.corpus import stopwords
 
 nltk.download("stopwords")
 
-import dtypes
-from tokenizers import PunctTokenizer
-from .utils import is_punct
-
-CorpusInput = dtypes.Union[dtypes.List[str], str]
-VectorizedOutput = dtypes.List[dtypes.List[str]]
+import typing as dtypes
+from agrow.math.linalg import CSR_DTYPES, CSRMatrix
+from agrow.text.tokenizers import PunctTokenizer
+from .utils import (
+    CacheInfo,
+    SpaceSaving,
+    TokenCache,
+    is_punct,
+    pack_ngram,
+    pack_ngrams,
+    unpack_ngram,
+)
+
+# Number of strings (sentences/contexts) tokenized at once by stokenize(...)
+TOKENIZE_CHUNKSIZE = 1024
+
+# Features analyzers: token n-grams or character n-grams of tokens (padded
+# with spaces, so n-grams at the beginning and the end of tokens are distinct)
+ANALYZERS = ("word", "char_wb")
+# Number of bits per token id / character in packed n-gram keys
+WORD_BITS = 32
+CHAR_BITS = 21
+
+CorpusInput = dtypes.Union[dtypes.Iterable[str], str, os.PathLike]
+VectorizedOutput = dtypes.Union[dtypes.List[dtypes.List[str]], CSRMatrix]
 
 
 class BaseVectorizer(ABC):
@@ -23,20 +49,61 @@ class BaseVectorizer(ABC):
 
     """
     BaseVectorizer attributes:
-        1. stopwords_  - List of provided corpus stopwords
+        1. stopwords_  - Set of provided corpus stopwords
         2. vocab_     - List of corpus vocabulary (without punctuation).
                          In extracts from given documents at fit(...) stage.
         3. tk_         - Tokenizer used to divide string (sentence/context)
-                         by tokens
+                         by tokens. Tokenizer instance (BaseTokenizer) or a
+                         plain callable (string -> list of tokens)
         4. indices_    - (Vocabulary element: its index) mapping dictionary
         5. invindices_ - Inversed (vocabulary element: its index) mapping
                          dictionary (vocab. element index: its value).
+        6. docfreq_    - Number of documents (strings) each vocabulary element
+                         occurs in, indexed by vocabulary element index
+                         (approximate, never underestimated, if fitted with
+                         approx)
+        7. ndocs_      - Number of documents (strings) vectorizer is fitted on
+        8. cache_      - Token normalization cache (TokenCache) shared by fitting
+                         and transforming (see cache_info())
+        9. ngram_range_ - (min n, max n) of n-gram features
+        10. analyzer_   - Features analyzer (one of ANALYZERS)
+        11. features_   - (Packed n-gram key: its index) mapping dictionary
+                          (n-gram features only, see pack_ngrams(...))
+        12. tokids_     - (Token: its id) mapping dictionary of tokens of word
+                          n-gram features (ids start from 1)
+        13. idtoks_     - List of tokens of word n-grams features (by id - 1)
+        14. skipwords_  - Tokens removed before building n-grams (stopwords
+                          if they aren't ignored)
     """
-    stopwords_: dtypes.List[str] = []
+    stopwords_: dtypes.Set[str] = set()
     vocab_: dtypes.Set[str] = set()
     tk_: dtypes.Any = None
     indices_: dtypes.Dict[str, int] = {}
     invindices_: dtypes.Dict[int, str] = {}
+    docfreq_: array.array = array.array("q")
+    ndocs_: int = 0
+    ngram_range_: dtypes.Tuple[int, int] = (1, 1)
+    analyzer_: str = "word"
+    features_: dtypes.Dict[int, int] = {}
+    tokids_: dtypes.Dict[str, int] = {}
+    idtoks_: dtypes.List[str] = []
+    skipwords_: dtypes.FrozenSet[str] = frozenset()
+
+    def __init__(self, cache_size: int = 1 << 16) -> None:
+        """
+        Initializes vectorizer object.
+
+        Args:
+            cache_size (int) : Maximum number of tokens in normalization cache
+                               (0 to disable caching)
+
+        Returns:
+            None (only initializes vectorizer instance)
+        """
+
+        self.cache_ = TokenCache(cache_size)
+        # Character n-grams keys of tokens (bounded by the cache size as well)
+        self._chargrams: dtypes.Dict[str, dtypes.List[int]] = {}
 
     def __repr__(self) -> str:
         return "{}(size={}, stopwords={})".format(
@@ -56,8 +123,10 @@ class BaseVectorizer(ABC):
         vectorize only one sentence.
 
         Args:
-            input (CorpusInput)     : Corpus to fit with. Could be one sentence or
-                                      a list of sentences
+            input (CorpusInput)     : Corpus to fit with. Could be one sentence,
+                                      any iterable of sentences (walked through
+                                      once) or a path to a text file with a
+                                      sentence per line
             ignore_stopwords (bool) : If ignore corpus stopwords or not flag
 
         Returns:
@@ -108,73 +177,569 @@ class BaseVectorizer(ABC):
 
         raise NotImplementedError("Base class methods should be overwritten")
 
+    def itransform(
+        self,
+        input: CorpusInput,
+        sparse: bool = False,
+        chunksize: int = 1024,
+        **kwargs: dtypes.Any,
+    ) -> dtypes.Iterator[VectorizedOutput]:
+        """
+        Lazy (generator-based) tranforming method. Reads given corpus by chunks of
+        chunksize strings (sentences/contexts), so corpora larger than memory (i.e.
+        files) could be vectorized.
+
+        Args:
+            input (CorpusInput) : Corpus to be vectorized (see fit(...))
+            sparse (bool)       : If chunks should be vectorized to CSRMatrix row
+                                  batches instead of separate vectors flag
+            chunksize (int)     : Number of strings (sentences/contexts) transformed
+                                  at once
+            kwargs (dtypes.Any) : Other transform(...) arguments (i.e. dtype, norm)
+
+        Returns:
+            Generator of vectors (one per string) or CSRMatrix batches (of up to
+            chunksize rows) if sparse is set
+        """
+
+        if chunksize < 1:
+            raise ValueError(f"Chunk size should be positive, got {chunksize}")
+
+        input = iter(self._check_input(input))
+        while chunk := list(islice(input, chunksize)):
+            if sparse:
+                yield self.transform(chunk, sparse=True, **kwargs)
+            else:
+                yield from self.transform(chunk, **kwargs)
+
+    def encode(
+        self, input: CorpusInput, oov_id: dtypes.Optional[int] = -1
+    ) -> dtypes.Tuple[array.array, array.array]:
+        """
+        Encoding corpus to vocabulary indices method. Tokens are mapped to their
+        indices right after tokenization (without building vectors or lists of
+        preprocessed tokens), and all of the corpus indices are stored in a single
+        flat array (ragged layout).
+
+        Args:
+            input (CorpusInput)           : Corpus to be encoded (see fit(...))
+            oov_id (dtypes.Optional[int]) : Index of out-of-vocabulary tokens (None to
+                                            drop them)
+
+        Returns:
+            Tuple of (ids, offsets) arrays: ids is int32 array of all tokens indices,
+            offsets is int64 array of (number of strings + 1) elements, so indices of
+            i-th string (sentence/context) are ids[offsets[i]:offsets[i + 1]]
+        """
+
+        ids = array.array("i")
+        offsets = array.array("q", [0])
+
+        for row in self._iencode(self._check_input(input), oov_id=oov_id):
+            ids.extend(row)
+            offsets.append(len(ids))
+
+        return ids, offsets
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Token normalization cache statistics method (i.e. to tune cache size, as
+        hits / (hits + misses) is a fraction of tokens which weren't normalized
+        again).
+
+        Returns:
+            CacheInfo(hits, misses, maxsize, currsize) named tuple
+        """
+
+        return self.cache_.info()
+
     """
     Given language stopwords
     """
 
     @property
-    def lang_stopwords_(self, language: str = "english") -> dtypes.List[str]:
-        return stopwords.words(language)
+    def lang_stopwords_(self, language: str = "english") -> dtypes.FrozenSet[str]:
+        return _lang_stopwords(language)
 
     def _cvocab(
-        self, input: CorpusInput, ignore_stopwords: bool, tokenizer: dtypes.Any
+        self,
+        input: CorpusInput,
+        ignore_stopwords: bool,
+        tokenizer: dtypes.Any,
+        reset: bool = True,
+        ngram_range: dtypes.Tuple[int, int] = (1, 1),
+        analyzer: str = "word",
+        min_df: dtypes.Union[int, float] = 1,
+        max_df: dtypes.Union[int, float] = 1.0,
+        max_features: dtypes.Optional[int] = None,
+        approx: dtypes.Optional[int] = None,
     ) -> None:
         """
-        Creating corpus vocabulary (fitting wrapper) method. Creates corpus vocabulary
-        adding token one-by-one while walking through each of the tokens (in fact, just
-        flatten given multidimensional corpus into 1d vector).
+        Creating corpus vocabulary (fitting wrapper) method. Walks through the
+        corpus once, counting document frequencies (and total counts, if
+        max_features is set) of features - tokens or n-grams (see _ifeatures(...)).
+        New features are pruned by their frequencies and added to the vocabulary
+        after that. With approx set, document frequencies are counted
+        approximately by a single sketch of at most 2 * approx counters (see
+        SpaceSaving), so memory doesn't depend on the number of distinct
+        features. At most approx features with the largest counts are kept, they
+        are ranked by document frequencies for max_features too (total counts
+        aren't tracked) and their docfreq_ are approximate (overestimated).
+
+        New vocabulary elements get indices after already existing ones (in sorted
+        order), so indices of existing elements stay the same when vocabulary is
+        updated (see partial_fit(...)).
 
         Args:
-            input (CorpusInput)     : Corpus to fit with
-            ignore_stopwords (bool) : If ignore corpus stopwords or not flag
+            input (CorpusInput)                  : Corpus to fit with
+            ignore_stopwords (bool)              : If ignore corpus stopwords or not flag
+            reset (bool)                         : If vocabulary should be created from
+                                                   scratch (instead of updated) flag
+            ngram_range (dtypes.Tuple[int, int]) : (min n, max n) of n-gram features
+            analyzer (str)                       : Features analyzer (see ANALYZERS)
+            min_df (dtypes.Union[int, float])    : Minimal number (int) or fraction
+                                                   (float) of documents new features
+                                                   should occur in
+            max_df (dtypes.Union[int, float])    : Maximal number (int) or fraction
+                                                   (float) of documents new features
+                                                   could occur in
+            max_features (dtypes.Optional[int])  : Maximal number of new features (the
+                                                   most frequent ones are kept)
+            approx (dtypes.Optional[int])        : Maximal number of kept features,
+                                                   which are counted approximately
+                                                   (None to count features exactly)
 
         Returns:
             None (only creates corpus vocabulary)
         """
 
-        self.tk_: dtypes.Any = tokenizer
-        lstopwords: dtypes.List[str] = self.lang_stopwords_
+        self.tk_: dtypes.Any = self._check_tokenizer(tokenizer)
+        ngram_range = self._check_ngrams(ngram_range, analyzer)
+        self._check_pruning(min_df, max_df, max_features)
+        if reset:
+            # Class level defaults are shared by all instances, so every fit starts
+            # with its own containers
+            self.vocab_ = set()
+            self.stopwords_ = set()
+            self.indices_ = {}
+            self.invindices_ = {}
+            self.docfreq_ = array.array("q")
+            self.ndocs_ = 0
+            self.ngram_range_ = ngram_range
+            self.analyzer_ = analyzer
+            self.features_ = {}
+            self.tokids_ = {}
+            self.idtoks_ = []
+            self.skipwords_ = frozenset()
+            self._chargrams.clear()
+        elif (ngram_range, analyzer) != (self.ngram_range_, self.analyzer_):
+            raise ValueError(
+                f"Vectorizer is fitted with ngram_range={self.ngram_range_} and "
+                f"analyzer={self.analyzer_!r}, got {ngram_range} and {analyzer!r}"
+            )
+        lstopwords: dtypes.FrozenSet[str] = self.lang_stopwords_
+        unigrams: bool = self._unigrams
+        if not unigrams and not ignore_stopwords:
+            self.skipwords_ = self.skipwords_.union(lstopwords)
+
+        docfreq: dtypes.Counter[dtypes.Union[str, int]] = (
+            Counter() if approx is None else SpaceSaving(approx)
+        )
+        termfreq: dtypes.Optional[dtypes.Counter[dtypes.Union[str, int]]] = (
+            None if max_features is None or approx is not None else Counter()
+        )
+        ndocs: int = 0
+
+        for features in self._ifeatures(input, intern=True):
+            docfreq.update(set(features))
+            if termfreq is not None:
+                termfreq.update(features)
+            ndocs += 1
+
+        if approx is not None:
+            # the sketch holds up to 2 * approx items between evictions, only
+            # approx largest ones are kept, and they are ranked by the same sketch
+            docfreq = Counter(dict(docfreq.most_common(approx)))
+            termfreq = None if max_features is None else docfreq
+
+        if unigrams:
+            new = [
+                tok for tok in docfreq if tok not in self.indices_ and not is_punct(tok)
+            ]
+            self.stopwords_.update(lstopwords.intersection(new))
+            if not ignore_stopwords:
+                new = [tok for tok in new if tok not in lstopwords]
+        else:
+            new = [key for key in docfreq if key not in self.features_]
+
+        new = self._prune(new, docfreq, termfreq, ndocs, min_df, max_df, max_features)
+
+        if unigrams:
+            for word in sorted(new):
+                self.__add_feature(word)
+            for word, cnt in docfreq.items():
+                if word in self.indices_:
+                    self.docfreq_[self.indices_[word]] += cnt
+        else:
+            for word, key in sorted((self._feature_name(key), key) for key in new):
+                self.features_[key] = self.__add_feature(word)
+            for key, cnt in docfreq.items():
+                if key in self.features_:
+                    self.docfreq_[self.features_[key]] += cnt
+            if reset and self.analyzer_ == "word":
+                self.__compact_tokids()
+        self.ndocs_ += ndocs
+
+    def __add_feature(self, word: str) -> int:
+        # different n-gram keys could have the same name (i.e. tokens of a custom
+        # tokenizer could contain spaces), such keys share the feature
+        if word in self.indices_:
+            return self.indices_[word]
+
+        idx = len(self.invindices_)
+        self.vocab_.add(word)
+        self.indices_[word] = idx
+        self.invindices_[idx] = word
+        self.docfreq_.append(0)
+
+        return idx
+
+    def __compact_tokids(self) -> None:
+        """
+        Dropping tokens which aren't a part of any word n-gram feature (i.e. they
+        were pruned) from tokids_ method. Token ids are renumbered, so n-gram
+        keys are packed again.
+        """
 
-        for sent in input:
-            tokens: dtypes.List[str] = self.tk_().tokenize(sent)
-            for idx, tok in enumerate(tokens):
-                # In case we can't process tokens like "end." and "end" at the end
-                # of string (sentence/context) like different tokens.
-                tok = self._preprocess_tok(tok=tok, tokens=tokens, curr_idx=idx)
+        used: dtypes.List[int] = sorted(
+            {code for key in self.features_ for code in unpack_ngram(key, WORD_BITS)}
+        )
+        if len(used) == len(self.idtoks_):
+            return
+
+        codes: dtypes.Dict[int, int] = {code: new for new, code in enumerate(used, 1)}
+        self.idtoks_ = [self.idtoks_[code - 1] for code in used]
+        self.tokids_ = {tok: code for code, tok in enumerate(self.idtoks_, 1)}
+        self.features_ = {
+            pack_ngram(
+                (codes[code] for code in unpack_ngram(key, WORD_BITS)), WORD_BITS
+            ): idx
+            for key, idx in self.features_.items()
+        }
+
+    def _csr(
+        self,
+        input: dtypes.List[str],
+        dtype: str,
+        norm: dtypes.Optional[str],
+        weights: dtypes.Optional[dtypes.Sequence[float]] = None,
+    ) -> CSRMatrix:
+        """
+        Transforming corpus to a sparse matrix of token counts method. Walks through
+        the corpus once, appending every string (sentence/context) as a row of
+        (column index, count) pairs, so memory scales with the number of distinct
+        tokens per row instead of the vocabulary size.
 
-                if not is_punct(tok) and tok not in self.vocab_:
-                    if tok not in lstopwords:
-                        self.vocab_.add(tok)
-                    else:
-                        if ignore_stopwords:
-                            self.vocab_.add(tok)
-                        self.stopwords_.append(tok)
+        Args:
+            input (dtypes.List[str])            : Corpus to be vectorized
+            dtype (str)                         : Values type code - "i" (int32),
+                                                  "f" (float32) or "d" (float64)
+            norm (dtypes.Optional[str])         : Rows normalization - "l1", "l2"
+                                                  or None
+            weights (dtypes.Sequence[float])    : Optional per-column weights counts
+                                                  are multiplied by (i.e. IDF)
+
+        Returns:
+            CSRMatrix of (number of strings, vocabulary size) shape
+        """
 
-        self.indices_ = {word: idx for idx, word in enumerate(sorted(self.vocab_))}
-        self.invindices_ = {idx: word for idx, word in enumerate(sorted(self.vocab_))}
+        return self._tocsr(
+            rows=map(Counter, self._iencode(input)),
+            cols=len(self.indices_),
+            dtype=dtype,
+            norm=norm,
+            weights=weights,
+        )
 
-    def _preprocess_tok(self, tok: str, tokens: dtypes.List[str], curr_idx: int) -> str:
+    @staticmethod
+    def _tocsr(
+        rows: dtypes.Iterable[dtypes.Mapping[int, float]],
+        cols: int,
+        dtype: str,
+        norm: dtypes.Optional[str],
+        weights: dtypes.Optional[dtypes.Sequence[float]] = None,
+    ) -> CSRMatrix:
         """
-        Preprocessing separate token method.
+        Building sparse matrix from (column index: value) mappings method (see
+        _csr(...)). Zero values aren't stored.
 
         Args:
-            tok (str)                 : Token to be preprocessed
-            tokens (dtypes.List[str]) : All string (sentence/context) tokens array
-            curr_idx (int)            : Source tokens array index
+            rows (dtypes.Iterable[dtypes.Mapping[int, float]]) : Rows (column index:
+                                                                 value) mappings
+            cols (int)                                         : Number of columns
+            dtype (str)                                        : Values type code
+            norm (dtypes.Optional[str])                        : Rows normalization
+            weights (dtypes.Sequence[float])                   : Optional per-column
+                                                                 weights
 
         Returns:
-            Preprocessed token
+            CSRMatrix of (number of rows, cols) shape
         """
 
-        tok = tok.lower()
-        if tok[-1] == "." and curr_idx == len(tokens) - 1:
-            tok = tok[:-1]
+        if dtype not in CSR_DTYPES:
+            raise ValueError(f"dtype should be one of {CSR_DTYPES}, got {dtype!r}")
+        if dtype == "i" and (norm is not None or weights is not None):
+            raise ValueError("Weighted or normalized values can't be stored as int32")
+
+        data = array.array(dtype)
+        indices = array.array("i")
+        indptr = array.array("q", [0])
 
-        return tok
+        for counts in rows:
+            row: dtypes.List[int] = sorted(col for col, cnt in counts.items() if cnt)
+            indices.extend(row)
+            if weights is None:
+                data.extend(counts[col] for col in row)
+            else:
+                data.extend(counts[col] * weights[col] for col in row)
+            indptr.append(len(indices))
 
-    def _check_input(self, input: CorpusInput) -> dtypes.List[str]:
+        return CSRMatrix(data, indices, indptr, (len(indptr) - 1, cols)).normalize(norm)
+
+    def _check_tokenizer(self, tokenizer: dtypes.Any) -> dtypes.Any:
         """
-        Checking provided corpus validity method.
+        Checking provided tokenizer validity method. Tokenizer classes are
+        instantiated (once), so they could be used as before.
+
+        Args:
+            tokenizer (dtypes.Any) : Tokenizer class, instance (object with
+                                     tokenize(...) method) or a callable
+                                     (string -> list of tokens)
+
+        Returns:
+            None (raises error if tokenizer is invalid) or tokenizer instance
+        """
+
+        if isinstance(tokenizer, type):
+            tokenizer = tokenizer()
+        if not (hasattr(tokenizer, "tokenize") or callable(tokenizer)):
+            raise TypeError(
+                "Tokenizer should be a tokenizer class, instance or a callable."
+            )
+
+        return tokenizer
+
+    def _tokenized(
+        self, input: dtypes.Iterable[str]
+    ) -> dtypes.Iterator[dtypes.List[str]]:
+        """
+        Tokenizing corpus method. Binds tokenize method once and, if tokenizer
+        supports batches (has stokenize(...) method), tokenizes corpus by chunks
+        of TOKENIZE_CHUNKSIZE strings (sentences/contexts) at once.
+
+        Args:
+            input (dtypes.Iterable[str]) : Corpus to be tokenized
+
+        Returns:
+            Generator of strings (sentences/contexts) tokens
+        """
+
+        if self.tk_ is None:
+            raise AttributeError("Vectorizer should be fitted to have tokenizer")
+
+        stokenize = getattr(self.tk_, "stokenize", None)
+        if stokenize is None:
+            yield from map(getattr(self.tk_, "tokenize", self.tk_), input)
+            return
+
+        input = iter(input)
+        while chunk := list(islice(input, TOKENIZE_CHUNKSIZE)):
+            yield from stokenize(chunk)
+
+    def _iencode(
+        self, input: dtypes.Iterable[str], oov_id: dtypes.Optional[int] = None
+    ) -> dtypes.Iterator[dtypes.List[int]]:
+        """
+        Encoding corpus to vocabulary indices method. Features (see _ifeatures(...))
+        of a whole string (sentence/context) are looked up in indices_ (or features_
+        for n-grams) at once.
+
+        Args:
+            input (dtypes.Iterable[str])  : Corpus to be encoded
+            oov_id (dtypes.Optional[int]) : Index of out-of-vocabulary features (None
+                                            to drop them)
+
+        Returns:
+            Generator of strings (sentences/contexts) features indices
+        """
+
+        get = (self.indices_ if self._unigrams else self.features_).get
+
+        for features in self._ifeatures(input):
+            if oov_id is None:
+                ids = [get(feature) for feature in features]
+                yield [idx for idx in ids if idx is not None]
+            else:
+                yield [get(feature, oov_id) for feature in features]
+
+    def _ifeatures(
+        self, input: dtypes.Iterable[str], intern: bool = False
+    ) -> dtypes.Iterator[dtypes.List[dtypes.Union[str, int]]]:
+        """
+        Extracting corpus features method. Features are normalized tokens (see
+        TokenCache.normalize(...)) for unigrams or packed n-gram keys (see
+        pack_ngrams(...)) otherwise: n-grams of token ids for "word" analyzer
+        and of characters for "char_wb" analyzer. Punctuation and skipwords_ are
+        removed before building n-grams.
+
+        Args:
+            input (dtypes.Iterable[str]) : Corpus to be analyzed
+            intern (bool)                : If new tokens should get ids (while
+                                           fitting) instead of breaking n-grams flag
+
+        Returns:
+            Generator of strings (sentences/contexts) features
+        """
+
+        normalize = self.cache_.normalize
+
+        if self._unigrams:
+            for tokens in self._tokenized(input):
+                yield [tok for tok, _ in normalize(tokens) if tok]
+            return
+
+        nmin, nmax = self.ngram_range_
+        skipwords = self.skipwords_
+
+        if self.analyzer_ == "char_wb":
+            chargrams, maxsize = self._chargrams, self.cache_.maxsize
+            for tokens in self._tokenized(input):
+                keys: dtypes.List[int] = []
+                for tok, punct in normalize(tokens):
+                    if punct or not tok or tok in skipwords:
+                        continue
+                    grams = chargrams.get(tok)
+                    if grams is None:
+                        codes = [code + 1 for code in map(ord, f" {tok} ")]
+                        grams = pack_ngrams(codes, nmin, nmax, CHAR_BITS)
+                        if len(chargrams) >= maxsize:
+                            chargrams.clear()
+                        if maxsize:
+                            chargrams[tok] = grams
+                    keys.extend(grams)
+                yield keys
+            return
+
+        tokids, idtoks = self.tokids_, self.idtoks_
+        for tokens in self._tokenized(input):
+            toks = [
+                tok
+                for tok, punct in normalize(tokens)
+                if not (punct or not tok or tok in skipwords)
+            ]
+            if intern:
+                for tok in toks:
+                    if tok not in tokids:
+                        idtoks.append(tok)
+                        tokids[tok] = len(idtoks)
+                codes = [tokids[tok] for tok in toks]
+            else:
+                codes = [tokids.get(tok, 0) for tok in toks]
+            yield pack_ngrams(codes, nmin, nmax, WORD_BITS)
+
+    @property
+    def _unigrams(self) -> bool:
+        return self.ngram_range_ == (1, 1) and self.analyzer_ == "word"
+
+    def _feature_name(self, key: int) -> str:
+        """
+        Unpacking n-gram feature key (see _ifeatures(...)) to a string method.
+        Word n-grams tokens are joined with spaces.
+
+        Args:
+            key (int) : Packed n-gram key
+
+        Returns:
+            N-gram string
+        """
+
+        if self.analyzer_ == "char_wb":
+            return "".join(chr(code - 1) for code in unpack_ngram(key, CHAR_BITS))
+        return " ".join(self.idtoks_[code - 1] for code in unpack_ngram(key, WORD_BITS))
+
+    @staticmethod
+    def _check_ngrams(
+        ngram_range: dtypes.Tuple[int, int], analyzer: str
+    ) -> dtypes.Tuple[int, int]:
+        nmin, nmax = ngram_range
+        if not 1 <= nmin <= nmax:
+            raise ValueError(
+                f"ngram_range should be 1 <= min n <= max n, got {ngram_range}"
+            )
+        if analyzer not in ANALYZERS:
+            raise ValueError(f"analyzer should be one of {ANALYZERS}, got {analyzer!r}")
+
+        return nmin, nmax
+
+    @staticmethod
+    def _check_pruning(
+        min_df: dtypes.Union[int, float],
+        max_df: dtypes.Union[int, float],
+        max_features: dtypes.Optional[int],
+    ) -> None:
+        for name, value in (("min_df", min_df), ("max_df", max_df)):
+            if value < 0 or isinstance(value, float) and value > 1.0:
+                raise ValueError(
+                    f"{name} should be a non-negative int or a float in [0, 1], "
+                    f"got {value}"
+                )
+        if max_features is not None and max_features < 0:
+            raise ValueError(f"max_features should be non-negative, got {max_features}")
+
+    @staticmethod
+    def _prune(
+        features: dtypes.List[dtypes.Union[str, int]],
+        docfreq: dtypes.Counter[dtypes.Union[str, int]],
+        termfreq: dtypes.Optional[dtypes.Counter[dtypes.Union[str, int]]],
+        ndocs: int,
+        min_df: dtypes.Union[int, float],
+        max_df: dtypes.Union[int, float],
+        max_features: dtypes.Optional[int],
+    ) -> dtypes.List[dtypes.Union[str, int]]:
+        """
+        Pruning features by their frequencies method (see _cvocab(...)).
+
+        Args:
+            features (dtypes.List[dtypes.Union[str, int]]) : Features to be pruned
+            docfreq (dtypes.Counter)                       : Features document
+                                                             frequencies
+            termfreq (dtypes.Optional[dtypes.Counter])     : Features total counts
+                                                             (if max_features is set)
+            ndocs (int)                                    : Number of documents
+            min_df (dtypes.Union[int, float])              : Minimal document frequency
+            max_df (dtypes.Union[int, float])              : Maximal document frequency
+            max_features (dtypes.Optional[int])            : Maximal number of features
+
+        Returns:
+            Kept features
+        """
+
+        low = math.ceil(min_df * ndocs) if isinstance(min_df, float) else min_df
+        high = math.floor(max_df * ndocs) if isinstance(max_df, float) else max_df
+        if low > 1 or high < ndocs:
+            features = [
+                feature for feature in features if low <= docfreq[feature] <= high
+            ]
+
+        if max_features is not None and len(features) > max_features:
+            features = heapq.nlargest(max_features, features, key=termfreq.__getitem__)
+
+        return features
+
+    def _check_input(self, input: CorpusInput) -> dtypes.Iterable[str]:
+        """
+        Checking provided corpus validity method. Lists are checked at once, other
+        iterables and files are checked (and read) lazily, string by string.
 
         Args:
             input (CorpusInput) : Corpus to be checked
@@ -184,8 +749,52 @@ class BaseVectorizer(ABC):
         """
 
         if isinstance(input, str):
-            input = [input]
-        if not all(isinstance(sent, str) for sent in input):
-            raise TypeError("Input corpus should be a list of strings or a string.")
+            return [input]
+        if isinstance(input, os.PathLike):
+            return self._read_lines(input)
+        if isinstance(input, list):
+            if not all(isinstance(sent, str) for sent in input):
+                raise TypeError(
+                    "Input corpus should be an iterable of strings, a string or a path."
+                )
+            return input
+
+        return self._check_strings(input)
+
+    def _reiterable(self, input: CorpusInput) -> CorpusInput:
+        """
+        Making corpus walkable through more than once method (i.e. for fitting and
+        transforming after). One-shot iterators (generators) are materialized,
+        strings, paths (re-read) and collections are returned as is.
+
+        Args:
+            input (CorpusInput) : Corpus to be walked through
+
+        Returns:
+            Corpus which could be iterated multiple times
+        """
+
+        if isinstance(input, (str, os.PathLike)) or iter(input) is not input:
+            return input
+
+        return list(input)
+
+    @staticmethod
+    def _read_lines(path: os.PathLike) -> dtypes.Iterator[str]:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                yield line.rstrip("\r\n")
+
+    @staticmethod
+    def _check_strings(input: dtypes.Iterable[str]) -> dtypes.Iterator[str]:
+        for sent in input:
+            if not isinstance(sent, str):
+                raise TypeError(
+                    "Input corpus should be an iterable of strings, a string or a path."
+                )
+            yield sent
+
 
-        return input
+@lru_cache(maxsize=None)
+def _lang_stopwords(language: str) -> dtypes.FrozenSet[str]:
+    return frozenset(stopwords.words(language))
@@ -1,8 +1,11 @@
-from vectorizers import BaseVectorizer, dtypes
-from tokenizers import PunctTokenizer
+import os
 
-CorpusInput = dtypes.Union[dtypes.List[str], str]
-VectorizedOutput = dtypes.List[dtypes.List[int]]
+from agrow.math.linalg import CSRMatrix
+from agrow.text.tokenizers import PunctTokenizer
+from .base import BaseVectorizer, dtypes
+
+CorpusInput = dtypes.Union[dtypes.Iterable[str], str, os.PathLike]
+VectorizedOutput = dtypes.Union[dtypes.List[dtypes.List[int]], CSRMatrix]
 
 
 class CountVectorizer(BaseVectorizer):
@@ -16,6 +19,12 @@ class CountVectorizer(BaseVectorizer):
         input: CorpusInput,
         ignore_stopwords: bool = True,
         tokenizer: dtypes.Any = PunctTokenizer,
+        ngram_range: dtypes.Tuple[int, int] = (1, 1),
+        analyzer: str = "word",
+        min_df: dtypes.Union[int, float] = 1,
+        max_df: dtypes.Union[int, float] = 1.0,
+        max_features: dtypes.Optional[int] = None,
+        approx: dtypes.Optional[int] = None,
     ) -> None:
         """
         You can find more complete docs at ./base.py
@@ -23,8 +32,24 @@ class CountVectorizer(BaseVectorizer):
         Fitting on a given corpus method.
 
         Args:
-            input (CorpusInput)     : Corpus to fit with
-            ignore_stopwords (bool) : If ignore corpus stopwords or not flag
+            input (CorpusInput)                  : Corpus to fit with
+            ignore_stopwords (bool)              : If ignore corpus stopwords or not flag
+            ngram_range (dtypes.Tuple[int, int]) : (min n, max n) of n-gram features
+            analyzer (str)                       : "word" (token n-grams) or "char_wb"
+                                                   (character n-grams of tokens)
+            min_df (dtypes.Union[int, float])    : Minimal number (int) or fraction
+                                                   (float) of documents features
+                                                   should occur in
+            max_df (dtypes.Union[int, float])    : Maximal number (int) or fraction
+                                                   (float) of documents features
+                                                   could occur in
+            max_features (dtypes.Optional[int])  : Maximal vocabulary size (the most
+                                                   frequent features are kept)
+            approx (dtypes.Optional[int])        : Number of approximate (bounded
+                                                   memory) frequency counters, for
+                                                   huge corpora (None to count exactly).
+                                                   At most approx features are kept,
+                                                   docfreq_ is approximate then
 
         Returns:
             None (only creates corpus vocabulary)
@@ -33,29 +58,98 @@ class CountVectorizer(BaseVectorizer):
         input = self._check_input(input)
 
         self._cvocab(
-            input=input, ignore_stopwords=ignore_stopwords, tokenizer=tokenizer
+            input=input,
+            ignore_stopwords=ignore_stopwords,
+            tokenizer=tokenizer,
+            ngram_range=ngram_range,
+            analyzer=analyzer,
+            min_df=min_df,
+            max_df=max_df,
+            max_features=max_features,
+            approx=approx,
+        )
+
+    def partial_fit(
+        self,
+        input: CorpusInput,
+        ignore_stopwords: bool = True,
+        tokenizer: dtypes.Any = PunctTokenizer,
+        ngram_range: dtypes.Tuple[int, int] = (1, 1),
+        analyzer: str = "word",
+    ) -> None:
+        """
+        Updating fitted vectorizer with a given corpus method. New vocabulary
+        elements are appended to the end of indices, so existing indices (and
+        columns of already vectorized corpora) stay the same. Works as fit(...)
+        if vectorizer isn't fitted yet.
+
+        Features aren't pruned (see fit(...)), as frequencies of the whole corpus
+        aren't known yet.
+
+        Args:
+            input (CorpusInput)                  : Corpus to update vectorizer with
+            ignore_stopwords (bool)              : If ignore corpus stopwords or not flag
+            ngram_range (dtypes.Tuple[int, int]) : (min n, max n) of n-gram features
+                                                   (should be the same for every call)
+            analyzer (str)                       : Features analyzer (should be the
+                                                   same for every call)
+
+        Returns:
+            None (only updates corpus vocabulary)
+        """
+
+        input = self._check_input(input)
+
+        self._cvocab(
+            input=input,
+            ignore_stopwords=ignore_stopwords,
+            tokenizer=tokenizer,
+            reset=not self.ndocs_,
+            ngram_range=ngram_range,
+            analyzer=analyzer,
         )
 
-    def transform(self, input: CorpusInput) -> VectorizedOutput:
+    def transform(
+        self,
+        input: CorpusInput,
+        sparse: bool = False,
+        dtype: str = "i",
+        norm: dtypes.Optional[str] = None,
+    ) -> VectorizedOutput:
         """
         You can find more complete docs at ./base.py
 
         Tranforming given corpus method.
 
         Args:
-            input (CorpusInput) : Corpus to be vectorized
+            input (CorpusInput)         : Corpus to be vectorized
+            sparse (bool)               : If corpus should be vectorized to a CSRMatrix
+                                          (built in one pass) instead of lists flag
+            dtype (str)                 : Sparse values type code - "i" (int32),
+                                          "f" (float32) or "d" (float64)
+            norm (dtypes.Optional[str]) : Sparse rows normalization - "l1", "l2" or
+                                          None (requires float dtype)
 
         Returns:
             Vectorized corpus
         """
 
-        return [self.__trsent(sent) for sent in input]
+        input = self._check_input(input)
+
+        if sparse:
+            return self._csr(input=input, dtype=dtype, norm=norm)
+
+        return [self.__trsent(ids) for ids in self._iencode(input)]
 
     def fit_transform(
         self,
         input: CorpusInput,
         ignore_stopwords: bool = True,
         tokenizer: dtypes.Any = PunctTokenizer,
+        sparse: bool = False,
+        dtype: str = "i",
+        norm: dtypes.Optional[str] = None,
+        **kwargs: dtypes.Any,
     ) -> VectorizedOutput:
         """
         You can find more complete docs at ./base.py
@@ -63,35 +157,48 @@ class CountVectorizer(BaseVectorizer):
         Fitting and tranforming corpus wrapper method
 
         Args:
-            input (CorpusInput)     : Corpus to fit with and which to transform after
-            ignore_stopwords (bool) : If ignore corpus stopwords or not flag
+            input (CorpusInput)         : Corpus to fit with and which to transform after
+                                          (one-shot iterators are materialized, use
+                                          fit(...) + itransform(...) to stream)
+            ignore_stopwords (bool)     : If ignore corpus stopwords or not flag
+            sparse (bool)               : If corpus should be vectorized to a CSRMatrix
+                                          instead of lists flag
+            dtype (str)                 : Sparse values type code (see transform(...))
+            norm (dtypes.Optional[str]) : Sparse rows normalization (see transform(...))
+            kwargs (dtypes.Any)         : Other fit(...) arguments (i.e. ngram_range,
+                                          min_df)
 
         Returns:
             Vectorized corpus
         """
 
-        return self.transform(input)
+        input = self._reiterable(input)
+
+        self.fit(
+            input=input,
+            ignore_stopwords=ignore_stopwords,
+            tokenizer=tokenizer,
+            **kwargs,
+        )
+
+        return self.transform(input, sparse=sparse, dtype=dtype, norm=norm)
 
-    def __trsent(self, input: str) -> dtypes.List[int]:
+    def __trsent(self, input_ids: dtypes.List[int]) -> dtypes.List[int]:
         """
         Transforming single given string (sentence/context) method. Calls by tranform(...)
         to vectorize full corpus.
 
         Args:
-            input (str) : String (sentence/context) to be vectorized
+            input_ids (dtypes.List[int]) : Vocabulary indices of string (sentence/context)
+                                           tokens to be vectorized (see _iencode(...))
 
         Returns:
             Vectorized string (sentence/context)
         """
 
-        input_tokens: dtypes.List[str] = self.tk_().tokenize(input)
-        res_vec = [0] * len(self.vocab_)
+        res_vec = [0] * len(self.invindices_)
 
-        for idx, tok in enumerate(input_tokens):
-            # In case we can't process tokens like "end." and "end" at the end
-            # of string (sentence/context) like different tokens.
-            tok = self._preprocess_tok(tok=tok, tokens=input_tokens, curr_idx=idx)
-            if tok in self.vocab_:
-                res_vec[self.indices_[tok]] += 1
+        for idx in input_ids:
+            res_vec[idx] += 1
 
         return res_vec
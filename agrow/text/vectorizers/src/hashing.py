@@ -0,0 +1,192 @@
+import os
+from zlib import crc32
+
+from agrow.math.linalg import CSRMatrix
+from agrow.text.tokenizers import PunctTokenizer
+from .base import BaseVectorizer, dtypes
+
+CorpusInput = dtypes.Union[dtypes.Iterable[str], str, os.PathLike]
+
+# Column indices are stored as int32
+MAX_FEATURES = (1 << 31) - 1
+
+
+class HashingVectorizer(BaseVectorizer):
+    """
+    Hashing vectorizer class. Maps tokens to columns of a fixed size feature
+    space with a hash function (CRC32) instead of a vocabulary. It is stateless:
+    there is nothing to fit, memory doesn't depend on the vocabulary size and
+    vectorizer could be used by parallel workers without any synchronization.
+    Hash collisions are partially compensated with alternating signs of values
+    (sign trick), so colliding tokens cancel each other out on average.
+    """
+
+    """
+    HashingVectorizer custom attributes
+    """
+    __slots__ = ["n_features_", "alternate_sign_", "skipwords_"]
+
+    def __init__(
+        self,
+        n_features: int = 1 << 20,
+        alternate_sign: bool = True,
+        tokenizer: dtypes.Any = PunctTokenizer,
+        ignore_stopwords: bool = True,
+        cache_size: int = 1 << 16,
+    ) -> None:
+        """
+        Initializes HashingVectorizer object with given parameters.
+
+        Args:
+            n_features (int)        : Number of columns of the feature space
+            alternate_sign (bool)   : If values sign should be taken from the token
+                                      hash (sign trick) flag
+            tokenizer (dtypes.Any)  : Tokenizer class, instance or a callable
+            ignore_stopwords (bool) : If ignore corpus stopwords (keep them as
+                                      features) or not flag
+            cache_size (int)        : Maximum number of tokens in normalization cache
+
+        Returns:
+            None (only initializes HashingVectorizer instance)
+        """
+
+        BaseVectorizer.__init__(self, cache_size=cache_size)
+
+        if not 0 < n_features <= MAX_FEATURES:
+            raise ValueError(
+                f"Number of features should be in [1, {MAX_FEATURES}], got {n_features}"
+            )
+
+        self.n_features_ = n_features
+        self.alternate_sign_ = alternate_sign
+        self.fit(ignore_stopwords=ignore_stopwords, tokenizer=tokenizer)
+
+    def __repr__(self) -> str:
+        return "{}(n_features={}, alternate_sign={})".format(
+            self.__class__.__name__, self.n_features_, self.alternate_sign_
+        )
+
+    def fit(
+        self,
+        input: dtypes.Optional[CorpusInput] = None,
+        ignore_stopwords: bool = True,
+        tokenizer: dtypes.Any = PunctTokenizer,
+    ) -> None:
+        """
+        You can find more complete docs at ./base.py
+
+        HashingVectorizer is stateless, so corpus isn't walked through (and could
+        be omitted), only tokenizer and stopwords settings are changed.
+
+        Args:
+            input (CorpusInput)     : Corpus to fit with (not used)
+            ignore_stopwords (bool) : If ignore corpus stopwords or not flag
+
+        Returns:
+            None
+        """
+
+        self.tk_ = self._check_tokenizer(tokenizer)
+        self.skipwords_: dtypes.FrozenSet[str] = (
+            frozenset() if ignore_stopwords else self.lang_stopwords_
+        )
+
+    def transform(
+        self,
+        input: CorpusInput,
+        sparse: bool = True,
+        dtype: str = "d",
+        norm: dtypes.Optional[str] = None,
+    ) -> CSRMatrix:
+        """
+        You can find more complete docs at ./base.py
+
+        Tranforming given corpus method.
+
+        Args:
+            input (CorpusInput)         : Corpus to be vectorized
+            sparse (bool)               : Should be True, output is always a
+                                          CSRMatrix (kept for itransform(...))
+            dtype (str)                 : Sparse values type code - "i" (int32),
+                                          "f" (float32) or "d" (float64)
+            norm (dtypes.Optional[str]) : Sparse rows normalization - "l1", "l2" or
+                                          None (requires float dtype)
+
+        Returns:
+            CSRMatrix of (number of strings, n_features) shape
+        """
+
+        if not sparse:
+            raise ValueError("HashingVectorizer output is always sparse")
+
+        input = self._check_input(input)
+
+        return self._tocsr(
+            rows=self.__rows(input),
+            cols=self.n_features_,
+            dtype=dtype,
+            norm=norm,
+        )
+
+    def fit_transform(
+        self,
+        input: CorpusInput,
+        ignore_stopwords: bool = True,
+        tokenizer: dtypes.Any = PunctTokenizer,
+        sparse: bool = True,
+        dtype: str = "d",
+        norm: dtypes.Optional[str] = None,
+    ) -> CSRMatrix:
+        """
+        You can find more complete docs at ./base.py
+
+        Fitting and tranforming corpus wrapper method. Corpus is walked through
+        once (see fit(...)).
+
+        Args:
+            input (CorpusInput)         : Corpus to be vectorized
+            ignore_stopwords (bool)     : If ignore corpus stopwords or not flag
+            sparse (bool)               : Should be True (see transform(...))
+            dtype (str)                 : Sparse values type code (see transform(...))
+            norm (dtypes.Optional[str]) : Sparse rows normalization (see transform(...))
+
+        Returns:
+            CSRMatrix of (number of strings, n_features) shape
+        """
+
+        self.fit(ignore_stopwords=ignore_stopwords, tokenizer=tokenizer)
+
+        return self.transform(input, sparse=sparse, dtype=dtype, norm=norm)
+
+    def __rows(
+        self, input: dtypes.Iterable[str]
+    ) -> dtypes.Iterator[dtypes.Dict[int, int]]:
+        """
+        Hashing corpus tokens method. Column of a token is its CRC32 (lower 31
+        bits) modulo n_features, the highest hash bit is its sign.
+
+        Args:
+            input (dtypes.Iterable[str]) : Corpus to be vectorized
+
+        Returns:
+            Generator of strings (sentences/contexts) (column index: value) mappings
+        """
+
+        n_features = self.n_features_
+        alternate_sign = self.alternate_sign_
+        skipwords = self.skipwords_
+        normalize = self.cache_.normalize
+
+        for tokens in self._tokenized(input):
+            counts: dtypes.Dict[int, int] = {}
+            for tok, punct in normalize(tokens):
+                if punct or not tok or tok in skipwords:
+                    continue
+
+                h = crc32(tok.encode("utf-8"))
+                col = (h & 0x7FFFFFFF) % n_features
+                counts[col] = counts.get(col, 0) + (
+                    -1 if alternate_sign and h & 0x80000000 else 1
+                )
+
+            yield counts
@@ -1,9 +1,250 @@
+from collections import OrderedDict, namedtuple
+import heapq
+from operator import itemgetter
+import typing as dtypes
+
+# Punctuation tokens which aren't added to vocabularies
+PUNCT = frozenset(".!?;:,")
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
 def is_punct(char: str) -> bool:
-    return (
-        char == "."
-        or char == "!"
-        or char == "?"
-        or char == ";"
-        or char == ":"
-        or char == ","
-    )
+    return char in PUNCT
+
+
+class TokenCache:
+    """
+    Size-capped token normalization cache. Maps raw tokens to (normalized token,
+    punctuation flag) pairs, so every distinct token is lowercased and checked
+    once while it stays in the cache. As token frequencies are heavily skewed,
+    a small cache covers most of the token occurrences. When the cache is full,
+    the least recently used entries are evicted first.
+    """
+
+    __slots__ = ["maxsize", "hits", "misses", "data"]
+
+    def __init__(self, maxsize: int = 1 << 16) -> None:
+        """
+        Initializes TokenCache object with given size.
+
+        Args:
+            maxsize (int) : Maximum number of cached tokens (0 to disable caching)
+
+        Returns:
+            None (only initializes TokenCache instance)
+        """
+
+        if maxsize < 0:
+            raise ValueError(f"Cache size should be non-negative, got {maxsize}")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data: "OrderedDict[str, dtypes.Tuple[str, bool]]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return "{}({})".format(self.__class__.__name__, self.info())
+
+    def normalize(
+        self, tokens: dtypes.List[str]
+    ) -> dtypes.List[dtypes.Tuple[str, bool]]:
+        """
+        Normalizing string (sentence/context) tokens method. Tokens are lowercased
+        and the trailing period is stripped from the last token (in case we can't
+        process tokens like "end." and "end" at the end of string like different
+        tokens).
+
+        Args:
+            tokens (dtypes.List[str]) : String (sentence/context) tokens
+
+        Returns:
+            List of (normalized token, punctuation flag) pairs
+        """
+
+        get, refresh = self.data.get, self.data.move_to_end
+        misses = self.misses
+
+        entries: dtypes.List[dtypes.Tuple[str, bool]] = [get(tok) for tok in tokens]
+        # hits are moved to the end (before misses are added, so they can't be
+        # evicted by them), i.e. the least recently used tokens are evicted first
+        for tok, entry in zip(tokens, entries):
+            if entry is not None:
+                refresh(tok)
+        if None in entries:
+            entries = [
+                # tokens repeated in a string are added once
+                entry or get(tok) or self._add(tok)
+                for tok, entry in zip(tokens, entries)
+            ]
+
+        if entries and entries[-1][0][-1:] == ".":
+            norm = entries[-1][0][:-1]
+            entries[-1] = (norm, is_punct(norm))
+        self.hits += len(tokens) - (self.misses - misses)
+
+        return entries
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+    def clear(self) -> None:
+        self.hits = self.misses = 0
+        self.data.clear()
+
+    def _add(self, tok: str) -> dtypes.Tuple[str, bool]:
+        norm = tok.lower()
+        entry = (norm, is_punct(norm))
+
+        self.misses += 1
+        if self.maxsize:
+            if len(self.data) >= self.maxsize:
+                self.data.popitem(last=False)
+            self.data[tok] = entry
+
+        return entry
+
+
+def pack_ngrams(
+    codes: dtypes.Sequence[int], nmin: int, nmax: int, bits: int
+) -> dtypes.List[int]:
+    """
+    Finding n-grams (nmin <= n <= nmax) of a sequence of positive codes (i.e. token
+    or character ids). Every n-gram is packed into a single integer key, which is
+    extended code by code (key << bits | code) while the n-gram grows, so no
+    per-position slices are built. Codes are non-zero, so keys of n-grams of
+    different lengths never collide. Zero codes (unknown tokens) break n-grams.
+
+    Args:
+        codes (dtypes.Sequence[int]) : Sequence of codes (less than 2 ** bits)
+        nmin (int)                   : Minimal n-gram length
+        nmax (int)                   : Maximal n-gram length
+        bits (int)                   : Number of bits per code
+
+    Returns:
+        List of n-gram keys (n-grams starting at the same position are adjacent)
+    """
+
+    keys: dtypes.List[int] = []
+    size = len(codes)
+
+    for start in range(size):
+        key = 0
+        for pos in range(start, min(start + nmax, size)):
+            code = codes[pos]
+            if not code:
+                break
+            key = key << bits | code
+            if pos - start + 1 >= nmin:
+                keys.append(key)
+
+    return keys
+
+
+def pack_ngram(codes: dtypes.Iterable[int], bits: int) -> int:
+    """
+    Packing a single n-gram to its key (see pack_ngrams(...)) method.
+
+    Args:
+        codes (dtypes.Iterable[int]) : N-gram codes
+        bits (int)                   : Number of bits per code
+
+    Returns:
+        Packed n-gram key
+    """
+
+    key = 0
+    for code in codes:
+        key = key << bits | code
+
+    return key
+
+
+def unpack_ngram(key: int, bits: int) -> dtypes.List[int]:
+    """
+    Unpacking n-gram key (see pack_ngrams(...)) to its codes method.
+
+    Args:
+        key (int)  : Packed n-gram
+        bits (int) : Number of bits per code
+
+    Returns:
+        List of n-gram codes
+    """
+
+    mask = (1 << bits) - 1
+    codes: dtypes.List[int] = []
+
+    while key:
+        codes.append(key & mask)
+        key >>= bits
+
+    return codes[::-1]
+
+
+class SpaceSaving:
+    """
+    Approximate (heavy hitters) counter with bounded memory, a batched version
+    of the Space-Saving algorithm. At most 2 * capacity items are counted: when
+    there are more, only capacity most frequent ones are kept. Items counted
+    for the first time (or again after eviction) start from the largest count
+    evicted so far, so counts are never underestimated, and an item which
+    occurs more often than that count is never lost. Supports Counter methods
+    used while fitting vectorizers.
+    """
+
+    __slots__ = ["capacity", "floor", "counts"]
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes SpaceSaving object with given capacity.
+
+        Args:
+            capacity (int) : Number of counted items kept after eviction
+
+        Returns:
+            None (only initializes SpaceSaving instance)
+        """
+
+        if capacity < 1:
+            raise ValueError(f"Capacity should be positive, got {capacity}")
+
+        self.capacity = capacity
+        self.floor = 0
+        self.counts: dtypes.Dict[dtypes.Hashable, int] = {}
+
+    def __repr__(self) -> str:
+        return "{}(capacity={}, size={}, floor={})".format(
+            self.__class__.__name__, self.capacity, len(self.counts), self.floor
+        )
+
+    def __getitem__(self, item: dtypes.Hashable) -> int:
+        return self.counts.get(item, 0)
+
+    def __contains__(self, item: dtypes.Hashable) -> bool:
+        return item in self.counts
+
+    def __iter__(self) -> dtypes.Iterator[dtypes.Hashable]:
+        return iter(self.counts)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def items(self) -> dtypes.ItemsView:
+        return self.counts.items()
+
+    def most_common(self, n: int) -> dtypes.List[dtypes.Tuple[dtypes.Hashable, int]]:
+        return heapq.nlargest(n, self.counts.items(), key=itemgetter(1))
+
+    def update(self, items: dtypes.Iterable[dtypes.Hashable]) -> None:
+        counts, floor = self.counts, self.floor
+        for item in items:
+            counts[item] = counts.get(item, floor) + 1
+
+        if len(counts) > 2 * self.capacity:
+            self._evict()
+
+    def _evict(self) -> None:
+        top = self.most_common(self.capacity + 1)
+        self.floor = max(self.floor, top.pop()[1])
+        self.counts = dict(top)
@@ -1,13 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import os
+import threading
+import time
+import warnings
+
 import numpy as np
 
-from tokenizers import PunctTokenizer
-from vectorizers import (
+from agrow.text.tokenizers import PunctTokenizer
+from .base import (
     BaseVectorizer,
     dtypes,
 )
 
+try:
+    from ..vectorizers import hs_update, sgns_update
+except ImportError:
+    # compiled module isn't built (or src is imported as a top-level package),
+    # training runs NumPy batch steps in a single thread then
+    hs_update = sgns_update = None
+
 CorpusInput = dtypes.Union[dtypes.List[str], str]
 
+# Training objectives: full softmax over the vocabulary, negative sampling and
+# hierarchical softmax (over Huffman tree of vocabulary elements)
+OBJECTIVES = ("softmax", "negative", "hierarchical")
+# Power of unigram counts in negative sampling distribution
+UNIGRAM_POWER = 0.75
+# Default number of training pairs per batch (a gradient step of NumPy training or
+# pairs a worker thread takes at once), so memory per epoch is bounded
+BATCH_SIZE = 1 << 12
+
 
 class Word2Vec(BaseVectorizer):
     """
@@ -16,7 +40,37 @@ class Word2Vec(BaseVectorizer):
     between words, preserving the semantics of the language.
     """
 
-    __slots__ = ["train_", "embed_size_", "history_" "model_"]
+    """
+    Word2Vec custom attributes:
+        1. window_size_ - Maximal number of context words on each side of a word
+                          (see _ipairs(...))
+        2. embed_size_ - Embedding (hidden layer) size
+        3. history_    - Training loss values (one per epoch, sum of batches losses)
+        4. model_      - Model weights: "w1" (embeddings, vocab. size x embedding
+                         size) and "w2" (embedding size x vocab. size). With
+                         hierarchical softmax columns of "w2" are vectors of
+                         Huffman tree inner nodes (the last one is unused)
+        5. objective_  - Training objective (one of OBJECTIVES)
+        6. counts_     - Number of occurrences of each vocabulary element in the
+                         corpus (int64 array indexed by vocabulary element index)
+        7. table_      - Cumulative negative sampling distribution (counts_ to the
+                         power of UNIGRAM_POWER, normalized)
+        8. tree_       - Huffman tree paths as a tuple of (points, codes, offsets):
+                         inner nodes (int32) and branches (int8) from the root to
+                         i-th vocabulary element are at [offsets[i]:offsets[i + 1]]
+        9. throughput_ - Training speed in corpus words per second (one per epoch)
+    """
+    __slots__ = [
+        "window_size_",
+        "embed_size_",
+        "history_",
+        "model_",
+        "objective_",
+        "counts_",
+        "table_",
+        "tree_",
+        "throughput_",
+    ]
 
     def fit(
         self,
@@ -27,35 +81,186 @@ class Word2Vec(BaseVectorizer):
         learning_rate: float = 1e-4,
         embedding_size: int = 10,
         window_size: int = 2,
+        sample: dtypes.Optional[float] = 1e-3,
+        shrink_window: bool = True,
+        objective: str = "softmax",
+        negative: int = 5,
+        batch_size: int = BATCH_SIZE,
+        shuffle: bool = True,
+        min_learning_rate: dtypes.Optional[float] = None,
+        tol: dtypes.Optional[float] = None,
+        n_iter_no_change: int = 5,
+        workers: dtypes.Optional[int] = 1,
     ) -> None:
         """
         You can find more complete docs at ./base.py
 
-        Fitting on a given corpus method.
+        Fitting on a given corpus method. Full softmax costs O(vocab. size) per
+        training pair, negative sampling - O(negative) and hierarchical softmax -
+        O(log(vocab. size)), so use one of the latter for big vocabularies.
+
+        Training pairs are generated by sliding window over the encoded corpus
+        strings and streamed by batches (see _ipairs(...)), so memory doesn't
+        depend on the number of pairs. NumPy steps (softmax, or any objective if
+        the compiled module isn't built) take one gradient step per batch,
+        compiled kernels (see workers) update weights pair by pair. Losses and
+        gradients are summed over pairs either way, so the learning rate is a
+        per pair step size for every batch size.
 
         Args:
             input (CorpusInput)     : Corpus to fit with
             ignore_stopwords (bool) : If ignore corpus stopwords or not flag
+            n_iter (int)            : Number of training epochs
+            learning_rate (float)   : Gradient descent step size (initial one, if
+                                      min_learning_rate is set)
+            embedding_size (int)    : Size of words embeddings
+            window_size (int)       : Maximal number of context words on each side
+                                      of a word
+            sample (dtypes.Optional[float])
+                                    : Frequent words subsampling threshold, words
+                                      with frequency f are kept with probability
+                                      (sqrt(f / sample) + 1) * sample / f (None to
+                                      keep all of the words)
+            shrink_window (bool)    : If window size of each word should be random
+                                      (from 1 to window_size, so closer words are
+                                      paired more often) flag
+            objective (str)         : Training objective - "softmax", "negative"
+                                      (negative sampling) or "hierarchical"
+                                      (hierarchical softmax)
+            negative (int)          : Number of negative samples per training pair
+                                      (negative sampling only)
+            batch_size (int)        : Number of training pairs per gradient step
+                                      (with compiled kernels, number of pairs a
+                                      worker takes at once)
+            shuffle (bool)          : If strings order should be shuffled every
+                                      epoch flag
+            min_learning_rate (dtypes.Optional[float])
+                                    : Learning rate at the end of training, it
+                                      decays linearly from learning_rate (None to
+                                      keep it constant)
+            tol (dtypes.Optional[float])
+                                    : Minimal relative epoch loss improvement (None
+                                      to train for all n_iter epochs)
+            n_iter_no_change (int)  : Number of epochs without improvement to stop
+                                      training after (if tol is set)
+            workers (dtypes.Optional[int])
+                                    : Number of training threads (None or -1 to use
+                                      all CPUs). Negative sampling and
+                                      hierarchical softmax batches are trained
+                                      pair by pair by compiled kernels with the
+                                      GIL released (for any number of workers),
+                                      all threads update the same weights without
+                                      locks (Hogwild). If the compiled module
+                                      isn't built, NumPy batch steps run in a
+                                      single thread (with a RuntimeWarning if
+                                      workers > 1)
 
         Returns:
-            None (only creates corpus vocabulary)
+            None (only creates corpus vocabulary and trains embeddings)
         """
 
-        input = self._check_input(input)
+        if objective not in OBJECTIVES:
+            raise ValueError(
+                f"Objective should be one of {OBJECTIVES}, got {objective!r}"
+            )
+        if negative < 1:
+            raise ValueError(
+                f"Number of negative samples should be positive, got {negative}"
+            )
+        if window_size < 1:
+            raise ValueError(f"Window size should be positive, got {window_size}")
+        if sample is not None and sample <= 0:
+            raise ValueError(f"Subsampling threshold should be positive, got {sample}")
+        if batch_size < 1:
+            raise ValueError(f"Batch size should be positive, got {batch_size}")
+        if n_iter_no_change < 1:
+            raise ValueError(
+                f"Number of epochs without improvement should be positive, got "
+                f"{n_iter_no_change}"
+            )
+        if workers is None or workers == -1:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(
+                f"Number of workers should be positive or -1, got {workers}"
+            )
+        if workers > 1 and objective == "softmax":
+            raise ValueError(
+                "Parallel training supports only sparse updates (negative sampling "
+                "or hierarchical softmax objectives)"
+            )
+        # Kernels are used whenever they are built, so the kind of updates (pair by
+        # pair) doesn't depend on the number of workers
+        kernels: bool = objective != "softmax" and sgns_update is not None
+        if workers > 1 and not kernels:
+            warnings.warn(
+                "Compiled module isn't built, training runs in a single thread",
+                RuntimeWarning,
+            )
+
+        # Corpus is walked through twice: to create vocabulary and to encode it
+        input = self._reiterable(input)
         self.embed_size_ = embedding_size
+        self.window_size_ = window_size
+        self.objective_ = objective
 
         self._cvocab(
-            input=input, ignore_stopwords=ignore_stopwords, tokenizer=tokenizer
+            input=self._check_input(input),
+            ignore_stopwords=ignore_stopwords,
+            tokenizer=tokenizer,
         )
-
-        self.__gtrain(wsize=window_size)
+        ids, offsets = self.encode(input, oov_id=None)
+        ids, offsets = np.frombuffer(ids, dtype=np.int32), np.frombuffer(
+            offsets, dtype=np.int64
+        )
+        self.counts_ = np.bincount(ids, minlength=len(self.vocab_))
+        if objective == "negative":
+            self.__build_table()
+        elif objective == "hierarchical":
+            self.__build_tree()
 
         self.model_ = self.__init_model()
         self.history_ = []
-        for _ in range(n_iter):
-            self.history_.append(self.__backward(learning_rate=learning_rate))
+        self.throughput_ = []
+        best: float = np.inf
+        stale: int = 0
+        for epoch in range(n_iter):
+            started: float = time.perf_counter()
+
+            def rate(words: int) -> float:
+                return self.__decay(
+                    learning_rate,
+                    min_learning_rate,
+                    (epoch + words / max(len(ids), 1)) / n_iter,
+                )
 
-    def transform(self, input: str) -> dtypes.List[np.float64]:
+            batches = self._ipairs(
+                self.__isentences(ids, offsets, shuffle),
+                batch_size,
+                sample=sample,
+                shrink_window=shrink_window,
+            )
+            if kernels:
+                loss: float = self.__hogwild_epoch(batches, rate, negative, workers)
+            else:
+                loss = 0.0
+                for centers, contexts, words in batches:
+                    loss += self.__backward(
+                        centers, contexts, learning_rate=rate(words), negative=negative
+                    )
+            self.history_.append(loss)
+            self.throughput_.append(len(ids) / max(time.perf_counter() - started, 1e-9))
+
+            if tol is None:
+                continue
+            if loss < best * (1 - tol):
+                best, stale = loss, 0
+            else:
+                stale += 1
+                if stale >= n_iter_no_change:
+                    break
+
+    def transform(self, input: CorpusInput) -> dtypes.List[np.ndarray]:
         """
         You can find more complete docs at ./base.py
 
@@ -65,30 +270,54 @@ class Word2Vec(BaseVectorizer):
             input (CorpusInput) : Corpus to be vectorized
 
         Returns:
-            Vectorized corpus
+            Vectorized corpus (embeddings of in-vocabulary tokens of each string)
         """
 
         input = self._check_input(input)
 
-        return [self.__trsent(sent) for sent in input]
+        return [self.__trsent(ids) for ids in self._iencode(input)]
 
     def fit_transform(
         self,
+        input: CorpusInput,
         ignore_stopwords: bool = True,
         tokenizer: dtypes.Any = PunctTokenizer,
-        n_iter: int = 50,
-        learning_rate: float = 1e-4,
-        embedding_size: int = 10,
-        window_size: int = 2,
-    ) -> dtypes.List[np.float64]:
-        pass
+        **kwargs: dtypes.Any,
+    ) -> dtypes.List[np.ndarray]:
+        """
+        You can find more complete docs at ./base.py
+
+        Fitting and tranforming corpus wrapper method
+
+        Args:
+            input (CorpusInput)     : Corpus to fit with and which to transform after
+            ignore_stopwords (bool) : If ignore corpus stopwords or not flag
+            kwargs (dtypes.Any)     : Other fit(...) arguments (i.e. n_iter,
+                                      embedding_size)
+
+        Returns:
+            Vectorized corpus
+        """
+
+        input = self._reiterable(input)
+
+        self.fit(
+            input=input,
+            ignore_stopwords=ignore_stopwords,
+            tokenizer=tokenizer,
+            **kwargs,
+        )
+
+        return self.transform(input)
 
     def sample(self, instance) -> dtypes.List[str]:
         assert (
             instance in self.indices_
         ), f"Word '{instance}' is not in vocabulary, add it to your corpus first"
-        oh_instance = self.__onehot(self.indices_[instance], len(self.vocab_))
-        return self.__forward([oh_instance], self.model_, return_cache=False)[0]
+        center = np.array([self.indices_[instance]], dtype=np.int32)
+        if self.objective_ == "hierarchical":
+            return self.__tree_probs(self.model_["w1"][center[0]])
+        return self.__forward(center, self.model_, return_cache=False)[0]
 
     def __init_model(self) -> dtypes.Dict[str, np.random.randn]:
         vocab_size: int = len(self.vocab_)
@@ -100,29 +329,274 @@ class Word2Vec(BaseVectorizer):
 
     def __backward(
         self,
+        centers: np.ndarray,
+        contexts: np.ndarray,
         learning_rate: float = 1e-4,
+        negative: int = 5,
     ) -> np.float64:
+        if self.objective_ == "negative":
+            return self.__negative_step(centers, contexts, learning_rate, negative)
+        if self.objective_ == "hierarchical":
+            return self.__hierarchical_step(centers, contexts, learning_rate)
+
         cache: dtypes.Dict[str, np.ndarray] = self.__forward(
-            X=self.train_[0], model=self.model_
+            X=centers, model=self.model_
         )
         assert isinstance(cache, dict), "Forward pass should return all layers states"
 
-        da2: np.ndarray = cache["ans"] - self.train_[1]
+        loss: np.float64 = self.__cross_entropy(cache["ans"], contexts)
+
+        # Gradient of softmax + cross entropy is (probabilities - one-hot context)
+        da2: np.ndarray = cache["ans"]
+        da2[np.arange(len(contexts)), contexts] -= 1
         dw2: np.ndarray = cache["t1"].T @ da2
         da1: np.ndarray = da2 @ self.model_["w2"].T
-        dw1: np.ndarray = self.train_[0].T @ da1
 
         assert (
             dw2.shape == self.model_["w2"].shape
         ), "Weigth matrices dimensions are not equal"
-        assert (
-            dw1.shape == self.model_["w1"].shape
-        ), "Weigth matrices dimensions are not equal"
 
-        self.model_["w1"] -= learning_rate * dw1
         self.model_["w2"] -= learning_rate * dw2
+        # Only embeddings of center words get gradients, repeated centers are
+        # accumulated
+        np.add.at(self.model_["w1"], centers, -learning_rate * da1)
+
+        return loss
+
+    def __negative_step(
+        self,
+        centers: np.ndarray,
+        contexts: np.ndarray,
+        learning_rate: float,
+        negative: int,
+    ) -> np.float64:
+        """
+        Negative sampling gradient step method. Every (center, context) pair is
+        scored against the context and negative random elements drawn from
+        table_, so only these columns of w2 are read and updated.
+
+        Args:
+            centers (np.ndarray)  : Center words of training pairs
+            contexts (np.ndarray) : Context words of training pairs
+            learning_rate (float) : Gradient descent step size
+            negative (int)        : Number of negative samples per training pair
+
+        Returns:
+            Loss value (negative log-likelihood of pairs labels)
+        """
+
+        w1, w2t = self.model_["w1"], self.model_["w2"].T
+        negatives: np.ndarray = self.__negatives(len(contexts), negative)
+        targets: np.ndarray = np.column_stack((contexts, negatives))
+        labels: np.ndarray = np.zeros(targets.shape)
+        labels[:, 0] = 1
+        # Negatives equal to the context are skipped
+        mask: np.ndarray = np.ones(targets.shape)
+        mask[:, 1:] = negatives != contexts[:, None]
+
+        hidden: np.ndarray = w1[centers]
+        outputs: np.ndarray = w2t[targets]
+        scores: np.ndarray = np.einsum("pe,pke->pk", hidden, outputs)
+        signs: np.ndarray = 2 * labels - 1
+        loss: np.float64 = -np.sum(mask * self.__log_sigmoid(signs * scores))
 
-        return self.__cross_entropy(cache["ans"], self.train_[1])
+        grad: np.ndarray = mask * (self.__sigmoid(scores) - labels)
+        np.add.at(w2t, targets, -learning_rate * grad[..., None] * hidden[:, None])
+        np.add.at(w1, centers, -learning_rate * np.einsum("pk,pke->pe", grad, outputs))
+
+        return loss
+
+    def __hogwild_epoch(
+        self,
+        batches: dtypes.Iterator[dtypes.Tuple[np.ndarray, np.ndarray, int]],
+        rate: dtypes.Callable[[int], float],
+        negative: int,
+        workers: int,
+    ) -> float:
+        """
+        Compiled kernels training epoch method. Worker threads take batches from
+        the shared pairs generator one at a time and train on them with compiled
+        kernels (sgns_update(...) or hs_update(...)) with the GIL released, so
+        threads run on all cores. Weights are updated in place without locks. A
+        single worker trains in the calling thread.
+
+        Args:
+            batches (dtypes.Iterator)            : Training pairs generator (see
+                                                   _ipairs(...))
+            rate (dtypes.Callable[[int], float]) : Learning rate by number of
+                                                   corpus words read
+            negative (int)                       : Number of negative samples per
+                                                   training pair
+            workers (int)                        : Number of worker threads
+
+        Returns:
+            Epoch loss value (sum of pairs losses)
+        """
+
+        # Kernels need rows of output vectors to be contiguous
+        w1: np.ndarray = self.model_["w1"]
+        w2t: np.ndarray = np.ascontiguousarray(self.model_["w2"].T)
+        self.model_["w2"] = w2t.T
+        lock = threading.Lock()
+
+        def work() -> float:
+            loss: float = 0.0
+            while True:
+                with lock:
+                    batch = next(batches, None)
+                if batch is None:
+                    return loss
+                centers, contexts, words = batch
+                if self.objective_ == "negative":
+                    negatives = self.__negatives(len(contexts), negative)
+                    loss += sgns_update(
+                        w1, w2t, centers, contexts, negatives, rate(words)
+                    )
+                else:
+                    loss += hs_update(
+                        w1, w2t, centers, contexts, *self.tree_, rate(words)
+                    )
+
+        if workers == 1:
+            return work()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(work) for _ in range(workers)]
+            return sum(future.result() for future in futures)
+
+    def __negatives(self, size: int, negative: int) -> np.ndarray:
+        """
+        Drawing negative samples method (see __build_table()).
+
+        Args:
+            size (int)     : Number of training pairs
+            negative (int) : Number of negative samples per training pair
+
+        Returns:
+            Negative vocabulary elements (int32 array of size x negative)
+        """
+
+        negatives: np.ndarray = np.searchsorted(
+            self.table_, np.random.random((size, negative)), side="right"
+        )
+
+        return np.minimum(negatives, len(self.vocab_) - 1).astype(np.int32)
+
+    def __hierarchical_step(
+        self, centers: np.ndarray, contexts: np.ndarray, learning_rate: float
+    ) -> np.float64:
+        """
+        Hierarchical softmax gradient step method. Probability of context is a
+        product of binary decisions along its Huffman tree path (see
+        __build_tree()), so only vectors of path inner nodes are read and updated.
+
+        Args:
+            centers (np.ndarray)  : Center words of training pairs
+            contexts (np.ndarray) : Context words of training pairs
+            learning_rate (float) : Gradient descent step size
+
+        Returns:
+            Loss value (negative log-likelihood of contexts)
+        """
+
+        w1, w2t = self.model_["w1"], self.model_["w2"].T
+        points, codes, offsets = self.tree_
+        # Paths of all contexts flattened, pairs[i] is the pair of i-th path node
+        lengths: np.ndarray = offsets[contexts + 1] - offsets[contexts]
+        pairs: np.ndarray = np.repeat(np.arange(len(contexts)), lengths)
+        positions: np.ndarray = (
+            np.arange(lengths.sum())
+            - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            + np.repeat(offsets[contexts], lengths)
+        )
+        nodes: np.ndarray = points[positions]
+        signs: np.ndarray = 1 - 2 * codes[positions]
+
+        hidden: np.ndarray = w1[centers]
+        outputs: np.ndarray = w2t[nodes]
+        scores: np.ndarray = np.einsum("pe,pe->p", hidden[pairs], outputs)
+        loss: np.float64 = -np.sum(self.__log_sigmoid(signs * scores))
+
+        grad: np.ndarray = self.__sigmoid(scores) - (signs > 0)
+        dhidden: np.ndarray = np.zeros(hidden.shape)
+        np.add.at(dhidden, pairs, grad[:, None] * outputs)
+        np.add.at(w2t, nodes, -learning_rate * grad[:, None] * hidden[pairs])
+        np.add.at(w1, centers, -learning_rate * dhidden)
+
+        return loss
+
+    def __tree_probs(self, hidden: np.ndarray) -> np.ndarray:
+        """
+        Hierarchical softmax probabilities of all vocabulary elements method.
+
+        Args:
+            hidden (np.ndarray) : Embedding of the center word
+
+        Returns:
+            Probabilities of vocabulary elements (sum up to 1)
+        """
+
+        points, codes, offsets = self.tree_
+        scores: np.ndarray = hidden @ self.model_["w2"]
+        words: np.ndarray = np.repeat(np.arange(len(self.vocab_)), np.diff(offsets))
+        logprobs: np.ndarray = self.__log_sigmoid((1 - 2 * codes) * scores[points])
+
+        return np.exp(np.bincount(words, weights=logprobs, minlength=len(self.vocab_)))
+
+    def __build_table(self) -> None:
+        """
+        Creating negative sampling distribution method. Negatives are drawn by
+        binary search of uniform random values in the cumulative distribution.
+
+        Returns:
+            None (only stores distribution in table_ attribute)
+        """
+
+        table: np.ndarray = np.cumsum(self.counts_**UNIGRAM_POWER)
+        self.table_ = table / table[-1] if len(table) else table
+
+    def __build_tree(self) -> None:
+        """
+        Creating Huffman tree of vocabulary elements by their counts method, so
+        frequent elements have short paths. Leaves are 0...(vocab. size - 1) and
+        inner nodes are numbered from 0 in order of creation (root is the last).
+
+        Returns:
+            None (only stores tree paths in tree_ attribute)
+        """
+
+        size: int = len(self.vocab_)
+        parents: np.ndarray = np.zeros(2 * size, dtype=np.int64)
+        branches: np.ndarray = np.zeros(2 * size, dtype=np.int8)
+        heap: dtypes.List[dtypes.Tuple[int, int]] = [
+            (cnt, idx) for idx, cnt in enumerate(self.counts_.tolist())
+        ]
+        heapq.heapify(heap)
+
+        for node in range(size, 2 * size - 1):
+            (cnt0, left), (cnt1, right) = heapq.heappop(heap), heapq.heappop(heap)
+            parents[left], parents[right] = node, node
+            branches[right] = 1
+            heapq.heappush(heap, (cnt0 + cnt1, node))
+
+        points: dtypes.List[int] = []
+        codes: dtypes.List[int] = []
+        offsets: dtypes.List[int] = [0]
+        root: int = 2 * size - 2
+        for leaf in range(size):
+            path: dtypes.List[int] = []
+            node = leaf
+            while node != root:
+                path.append(node)
+                node = parents[node]
+            points.extend(parents[node] - size for node in reversed(path))
+            codes.extend(branches[node] for node in reversed(path))
+            offsets.append(len(points))
+
+        self.tree_ = (
+            np.array(points, dtype=np.int32),
+            np.array(codes, dtype=np.int8),
+            np.array(offsets, dtype=np.int64),
+        )
 
     def __forward(
         self,
@@ -130,50 +604,169 @@ class Word2Vec(BaseVectorizer):
         model: dtypes.Dict[str, np.ndarray],
         return_cache: bool = True,
     ) -> dtypes.Union[dtypes.Dict[str, np.ndarray], np.ndarray]:
-        cache: dtypes.Dict[str, np.ndarray] = {"t1": None, "t2": None, "prob": None}
+        cache: dtypes.Dict[str, np.ndarray] = {"t1": None, "t2": None, "ans": None}
 
-        cache["t1"] = X @ model["w1"]
+        # Embeddings lookup (the same as one-hot rows @ w1)
+        cache["t1"] = model["w1"][X]
         cache["t2"] = cache["t1"] @ model["w2"]
         cache["ans"] = self.__softmax(cache["t2"])
 
         return cache["ans"] if not return_cache else cache
 
-    def __gtrain(self, wsize: int) -> None:
-        X: dtypes.List[int] = []
-        Y: dtypes.List[int] = []
-        vocab_size: int = len(self.vocab_)
-        vocab_list: dtypes.List[str] = list(self.vocab_)
+    def _ipairs(
+        self,
+        sentences: dtypes.Iterable[np.ndarray],
+        batch_size: int = BATCH_SIZE,
+        sample: dtypes.Optional[float] = None,
+        shrink_window: bool = False,
+    ) -> dtypes.Iterator[dtypes.Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Generating training pairs by batches method. Every word of a string is
+        paired with words up to window_size_ positions before and after it in
+        the same string. Frequent words are dropped from strings (before
+        windows are found, so windows get wider) with probability growing with
+        their frequency (see fit(...)), and window size of every word could be
+        shrunk randomly, which cuts the number of pairs. Strings are processed
+        a few at a time, just enough to fill the next batch, so all of the
+        pairs are never stored at once.
+
+        Args:
+            sentences (dtypes.Iterable[np.ndarray]) : Strings (sentences/contexts)
+                                                      as int32 arrays of vocabulary
+                                                      indices
+            batch_size (int)                        : Number of pairs per batch
+            sample (dtypes.Optional[float])         : Frequent words subsampling
+                                                      threshold (None to keep all
+                                                      of the words)
+            shrink_window (bool)                    : If window size of every word
+                                                      should be random flag
+
+        Returns:
+            Generator of (centers, contexts, words) batches: int32 arrays of
+            vocabulary indices and number of words read before the batch is full
+        """
+
+        wsize: int = self.window_size_
+        if sample is not None:
+            freqs: np.ndarray = self.counts_ / max(self.counts_.sum(), 1)
+            with np.errstate(divide="ignore"):
+                keep: np.ndarray = (np.sqrt(freqs / sample) + 1) * sample / freqs
+        # Number of words to read for a batch (every word is a center of up to
+        # 2 * wsize pairs, about a half of them with shrunk windows)
+        chunksize: int = -(-batch_size // wsize)
+
+        centers: dtypes.List[np.ndarray] = []
+        contexts: dtypes.List[np.ndarray] = []
+        buffered: int = 0
+        chunk: dtypes.List[np.ndarray] = []
+        chunkwords: int = 0
+        words: int = 0
+        for sentence in itertools.chain(sentences, [None]):
+            if sentence is not None:
+                chunk.append(sentence)
+                chunkwords += len(sentence)
+                if chunkwords < chunksize:
+                    continue
+            if not chunk:
+                break
 
-        for i in range(vocab_size):
-            nbr_inds = list(range(max(0, i - wsize), i)) + list(
-                range(i, min(vocab_size, i + wsize + 1))
+            tokens: np.ndarray = np.concatenate(chunk)
+            strings: np.ndarray = np.repeat(
+                np.arange(len(chunk)), [len(row) for row in chunk]
+            )
+            words += chunkwords
+            chunk, chunkwords = [], 0
+            if sample is not None:
+                kept: np.ndarray = np.random.random(len(tokens)) < keep[tokens]
+                tokens, strings = tokens[kept], strings[kept]
+            windows: np.ndarray = (
+                np.random.randint(1, wsize + 1, len(tokens))
+                if shrink_window
+                else np.full(len(tokens), wsize)
             )
-            for j in nbr_inds:
-                print(
-                    [vocab_list[i]]
-                    + vocab_list[max(0, i - wsize) : min(vocab_size, i + wsize + 1)]
+
+            for shift in range(1, wsize + 1):
+                same: np.ndarray = strings[shift:] == strings[:-shift]
+                left: np.ndarray = same & (windows[:-shift] >= shift)
+                right: np.ndarray = same & (windows[shift:] >= shift)
+                centers.extend((tokens[:-shift][left], tokens[shift:][right]))
+                contexts.extend((tokens[shift:][left], tokens[:-shift][right]))
+                buffered += int(left.sum() + right.sum())
+
+            if buffered < batch_size:
+                continue
+            pending: np.ndarray = np.concatenate(centers)
+            others: np.ndarray = np.concatenate(contexts)
+            full: int = len(pending) - len(pending) % batch_size
+            for start in range(0, full, batch_size):
+                yield (
+                    pending[start : start + batch_size],
+                    others[start : start + batch_size],
+                    words,
                 )
-                if i == j:
-                    continue
-                X.append(self.__onehot(self.indices_[vocab_list[i]], vocab_size))
-                Y.append(self.__onehot(self.indices_[vocab_list[j]], vocab_size))
+            centers, contexts = [pending[full:]], [others[full:]]
+            buffered = len(pending) - full
 
-        self.train_ = (np.asarray(X), np.asarray(Y))
+        if buffered:
+            yield np.concatenate(centers), np.concatenate(contexts), words
 
-    def __softmax(self, X: np.ndarray) -> np.ndarray:
-        ans: dtypes.List = []
+    def __isentences(
+        self, ids: np.ndarray, offsets: np.ndarray, shuffle: bool
+    ) -> dtypes.Iterator[np.ndarray]:
+        """
+        Encoded corpus strings generator method.
 
-        for vec in X:
-            exp: np.array = np.exp(vec)
-            ans.append(exp / exp.sum())
+        Args:
+            ids (np.ndarray)     : Vocabulary indices of all corpus tokens (int32)
+            offsets (np.ndarray) : Strings offsets (see encode(...))
+            shuffle (bool)       : If strings order should be shuffled flag
 
-        return np.array(ans)
+        Returns:
+            Generator of strings (sentences/contexts) vocabulary indices
+        """
 
-    def __cross_entropy(self, logit: np.ndarray, gt: np.ndarray) -> np.float64:
-        return -np.sum(np.log(logit) * gt)
+        order = range(len(offsets) - 1)
+        if shuffle:
+            order = np.random.permutation(len(offsets) - 1)
+        for idx in order:
+            yield ids[offsets[idx] : offsets[idx + 1]]
 
-    def __onehot(self, word_id: int, vocab_len: int) -> dtypes.List[int]:
-        ans: dtypes.List[int] = [0] * vocab_len
-        ans[word_id] = 1
+    def __trsent(self, input_ids: dtypes.List[int]) -> np.ndarray:
+        """
+        Transforming single given string (sentence/context) method. Calls by tranform(...)
+        to vectorize full corpus.
 
-        return ans
+        Args:
+            input_ids (dtypes.List[int]) : Vocabulary indices of string (sentence/context)
+                                           tokens to be vectorized (see _iencode(...))
+
+        Returns:
+            Embeddings of string (sentence/context) tokens (one row per token)
+        """
+
+        return self.model_["w1"][np.asarray(input_ids, dtype=np.int32)]
+
+    def __decay(
+        self,
+        learning_rate: float,
+        min_learning_rate: dtypes.Optional[float],
+        done: float,
+    ) -> float:
+        if min_learning_rate is None:
+            return learning_rate
+
+        return learning_rate - (learning_rate - min_learning_rate) * done
+
+    def __softmax(self, X: np.ndarray) -> np.ndarray:
+        exp: np.ndarray = np.exp(X - X.max(axis=1, keepdims=True))
+
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def __sigmoid(self, X: np.ndarray) -> np.ndarray:
+        return 0.5 * (1 + np.tanh(0.5 * X))
+
+    def __log_sigmoid(self, X: np.ndarray) -> np.ndarray:
+        return -np.logaddexp(0, -X)
+
+    def __cross_entropy(self, logit: np.ndarray, gt: np.ndarray) -> np.float64:
+        return -np.sum(np.log(logit[np.arange(len(gt)), gt]))
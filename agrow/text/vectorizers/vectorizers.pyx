@@ -0,0 +1,178 @@
+from libc.stdint cimport int8_t, int32_t, int64_t
+
+import numpy as np
+
+
+cdef extern from "core/vectorizers.h" namespace "agrow" nogil:
+    double ag_sgns_update(
+        double* w1, double* w2t, size_t dim, const int32_t* centers,
+        const int32_t* contexts, size_t size, const int32_t* negatives,
+        size_t negative, double alpha, double* work
+    )
+    double ag_hs_update(
+        double* w1, double* w2t, size_t dim, const int32_t* centers,
+        const int32_t* contexts, size_t size, const int32_t* points,
+        const int8_t* codes, const int64_t* offsets, double alpha, double* work
+    )
+
+
+# Word2Vec training kernels. Pairs are processed one by one with the GIL
+# released and weights are updated in place without locks, so several threads
+# could train the same model at once (Hogwild): updates of different pairs
+# rarely touch the same rows, and lost ones don't hurt convergence. Indices are
+# checked before training, so invalid ones raise instead of corrupting memory.
+
+
+cdef bint _in_range(const int32_t* ids, Py_ssize_t count, Py_ssize_t size) noexcept nogil:
+    cdef Py_ssize_t i
+
+    for i in range(count):
+        if ids[i] < 0 or ids[i] >= size:
+            return False
+    return True
+
+
+cdef bint _check_pairs(
+    double[:, ::1] w1, double[:, ::1] w2t, const int32_t[::1] centers,
+    const int32_t[::1] contexts, Py_ssize_t outputs
+) except -1:
+    # returns False if there are no pairs to train on
+    cdef bint valid
+
+    if not w1.shape[1] or w1.shape[1] != w2t.shape[1]:
+        raise ValueError(
+            f"Embedding sizes should be positive and equal, got {w1.shape[1]} and "
+            f"{w2t.shape[1]}"
+        )
+    if centers.shape[0] != contexts.shape[0]:
+        raise ValueError(
+            f"Numbers of centers and contexts mismatch: {centers.shape[0]} and "
+            f"{contexts.shape[0]}"
+        )
+    if not centers.shape[0]:
+        return False
+
+    with nogil:
+        valid = (
+            _in_range(&centers[0], centers.shape[0], w1.shape[0])
+            and _in_range(&contexts[0], contexts.shape[0], outputs)
+        )
+    if not valid:
+        raise IndexError("Training pairs indices are out of range")
+
+    return True
+
+
+def sgns_update(
+    double[:, ::1] w1,
+    double[:, ::1] w2t,
+    const int32_t[::1] centers,
+    const int32_t[::1] contexts,
+    const int32_t[:, ::1] negatives,
+    double learning_rate,
+):
+    """
+    Negative sampling SGD step over training pairs (see Word2Vec).
+
+    Args:
+        w1 (np.ndarray)        : Embeddings (vocab. size x embedding size, updated
+                                 in place)
+        w2t (np.ndarray)       : Output vectors (vocab. size x embedding size,
+                                 updated in place)
+        centers (np.ndarray)   : Center words of training pairs (int32)
+        contexts (np.ndarray)  : Context words of training pairs (int32)
+        negatives (np.ndarray) : Negative words (int32, pairs x negative)
+        learning_rate (float)  : Gradient descent step size
+
+    Returns:
+        Sum of pairs losses
+    """
+
+    cdef double loss
+    cdef bint valid = True
+    cdef double[::1] work = np.empty(w1.shape[1])
+
+    if negatives.shape[0] != centers.shape[0]:
+        raise ValueError(
+            f"Numbers of pairs and negatives rows mismatch: {centers.shape[0]} and "
+            f"{negatives.shape[0]}"
+        )
+    if not _check_pairs(w1, w2t, centers, contexts, w2t.shape[0]):
+        return 0.0
+    if negatives.shape[1]:
+        with nogil:
+            valid = _in_range(
+                &negatives[0, 0], negatives.shape[0] * negatives.shape[1], w2t.shape[0]
+            )
+    if not valid:
+        raise IndexError("Negative words indices are out of range")
+
+    with nogil:
+        loss = ag_sgns_update(
+            &w1[0, 0], &w2t[0, 0], w1.shape[1], &centers[0], &contexts[0],
+            centers.shape[0], &negatives[0, 0] if negatives.shape[1] else NULL,
+            negatives.shape[1], learning_rate, &work[0],
+        )
+
+    return loss
+
+
+def hs_update(
+    double[:, ::1] w1,
+    double[:, ::1] w2t,
+    const int32_t[::1] centers,
+    const int32_t[::1] contexts,
+    const int32_t[::1] points,
+    const int8_t[::1] codes,
+    const int64_t[::1] offsets,
+    double learning_rate,
+):
+    """
+    Hierarchical softmax SGD step over training pairs (see Word2Vec).
+
+    Args:
+        w1 (np.ndarray)       : Embeddings (vocab. size x embedding size, updated
+                                in place)
+        w2t (np.ndarray)      : Inner nodes vectors (at least vocab. size - 1 rows
+                                of embedding size, updated in place)
+        centers (np.ndarray)  : Center words of training pairs (int32)
+        contexts (np.ndarray) : Context words of training pairs (int32)
+        points (np.ndarray)   : Inner nodes of Huffman tree paths (int32)
+        codes (np.ndarray)    : Branches of Huffman tree paths (int8)
+        offsets (np.ndarray)  : Paths offsets (int64, vocab. size + 1)
+        learning_rate (float) : Gradient descent step size
+
+    Returns:
+        Sum of pairs losses
+    """
+
+    cdef double loss
+    cdef bint valid = True
+    cdef Py_ssize_t i
+    cdef double[::1] work = np.empty(w1.shape[1])
+
+    if not offsets.shape[0] or points.shape[0] != codes.shape[0]:
+        raise ValueError("Huffman tree paths arrays sizes mismatch")
+    with nogil:
+        valid = offsets[0] == 0 and offsets[offsets.shape[0] - 1] == points.shape[0]
+        for i in range(1, offsets.shape[0]):
+            valid = valid and offsets[i - 1] <= offsets[i]
+    if not valid:
+        raise ValueError("Huffman tree paths offsets should be sorted from 0 to size")
+    if not _check_pairs(w1, w2t, centers, contexts, offsets.shape[0] - 1):
+        return 0.0
+    if points.shape[0]:
+        with nogil:
+            valid = _in_range(&points[0], points.shape[0], w2t.shape[0])
+    if not valid:
+        raise IndexError("Huffman tree inner nodes are out of range")
+
+    with nogil:
+        loss = ag_hs_update(
+            &w1[0, 0], &w2t[0, 0], w1.shape[1], &centers[0], &contexts[0],
+            centers.shape[0], &points[0] if points.shape[0] else NULL,
+            &codes[0] if codes.shape[0] else NULL, &offsets[0], learning_rate,
+            &work[0],
+        )
+
+    return loss
@@ -1,9 +1,724 @@
+import math
+import os
+import pickle
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+from typing import List
 
+import numpy as np
 
-class TestVectorizers(unittest.TestCase):
-    def test_test(self):
-        pass
+from agrow.text.tokenizers import PunctTokenizer, WhitespaceTokenizer
+from agrow.text.vectorizers import (
+    CountVectorizer,
+    TfidfVectorizer,
+    HashingVectorizer,
+    Word2Vec,
+)
+from agrow.text.vectorizers.src import word2vec
+
+try:
+    from agrow.text.vectorizers.vectorizers import hs_update, sgns_update
+except ImportError:
+    hs_update = sgns_update = None
+
+CORPUS = [
+    "The cat sat on the mat.",
+    "The dog sat on the log.",
+    "A cat and a dog are friends!",
+]
+
+
+class TestBase(unittest.TestCase):
+    def _assert_rows(self, output: List[List[float]], expected: List[List[float]]):
+        self.assertEqual(len(output), len(expected))
+        for row, expected_row in zip(output, expected):
+            self.assertEqual(len(row), len(expected_row))
+            for value, expected_value in zip(row, expected_row):
+                self.assertAlmostEqual(value, expected_value, places=6)
+
+
+class TestCountVectorizer(TestBase):
+    def test_fit_transform(self) -> None:
+        vectorizer = CountVectorizer()
+        output = vectorizer.fit_transform(CORPUS)
+        self.assertEqual(len(output), len(CORPUS))
+        self.assertEqual(output[0][vectorizer.indices_["the"]], 2)
+        self.assertEqual(output[1][vectorizer.indices_["log"]], 1)
+        self.assertEqual(output[2][vectorizer.indices_["mat"]], 0)
+
+    def test_instances_state(self) -> None:
+        first, second = CountVectorizer(), CountVectorizer()
+        first.fit(CORPUS[:1])
+        second.fit(CORPUS[1:])
+        self.assertNotIn("dog", first.vocab_)
+        self.assertNotIn("mat", second.vocab_)
+
+    def test_tokenizers(self) -> None:
+        expected = CountVectorizer().fit_transform(CORPUS, tokenizer=PunctTokenizer)
+        self.assertEqual(
+            CountVectorizer().fit_transform(CORPUS, tokenizer=PunctTokenizer()),
+            expected,
+        )
+        self.assertEqual(
+            CountVectorizer().fit_transform(
+                CORPUS, tokenizer=PunctTokenizer().tokenize
+            ),
+            expected,
+        )
+
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS, tokenizer=str.split)
+        self.assertIn("mat", vectorizer.vocab_)
+        self.assertIn("friends!", vectorizer.vocab_)
+        self.assertEqual(
+            vectorizer.transform(CORPUS),
+            CountVectorizer().fit_transform(CORPUS, tokenizer=WhitespaceTokenizer()),
+        )
+        with self.assertRaises(TypeError):
+            CountVectorizer().fit(CORPUS, tokenizer=1)
+
+    def test_sparse(self) -> None:
+        vectorizer = CountVectorizer()
+        dense = vectorizer.fit_transform(CORPUS)
+        sparse = vectorizer.transform(CORPUS, sparse=True)
+        self.assertEqual(sparse.shape, (len(CORPUS), len(vectorizer.vocab_)))
+        self.assertEqual(sparse.dtype, "i")
+        self.assertEqual(sparse.nnz, sum(value != 0 for row in dense for value in row))
+        self._assert_rows(sparse.toarray().tolist(), dense)
+
+    def test_sparse_options(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS)
+        sparse = vectorizer.transform(CORPUS, sparse=True, dtype="f", norm="l1")
+        self.assertEqual(sparse.dtype, "f")
+        for row in sparse.toarray().tolist():
+            self.assertAlmostEqual(sum(row), 1.0, places=6)
+        with self.assertRaises(ValueError):
+            vectorizer.transform(CORPUS, sparse=True, norm="l2")
+        with self.assertRaises(ValueError):
+            vectorizer.transform(CORPUS, sparse=True, dtype="q")
+
+
+class TestStreaming(TestBase):
+    def setUp(self) -> None:
+        file, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(file, "w", encoding="utf-8") as file:
+            file.write("\n".join(CORPUS) + "\n")
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_fit_iterable(self) -> None:
+        expected = TfidfVectorizer()
+        expected.fit(CORPUS)
+        vectorizer = TfidfVectorizer()
+        vectorizer.fit(sent for sent in CORPUS)
+        self.assertEqual(vectorizer.indices_, expected.indices_)
+        self.assertEqual(list(vectorizer.vidf_), list(expected.vidf_))
+
+    def test_fit_path(self) -> None:
+        expected = CountVectorizer().fit_transform(CORPUS)
+        self.assertEqual(CountVectorizer().fit_transform(Path(self.path)), expected)
+        self.assertEqual(
+            CountVectorizer().fit_transform(sent for sent in CORPUS), expected
+        )
+
+    def test_itransform(self) -> None:
+        vectorizer = CountVectorizer()
+        expected = vectorizer.fit_transform(CORPUS)
+        self.assertEqual(list(vectorizer.itransform(iter(CORPUS))), expected)
+
+        batches = list(vectorizer.itransform(CORPUS, sparse=True, chunksize=2))
+        self.assertEqual([batch.shape[0] for batch in batches], [2, 1])
+        rows = [row for batch in batches for row in batch.toarray().tolist()]
+        self._assert_rows(rows, expected)
+
+    def test_invalid_input(self) -> None:
+        with self.assertRaises(TypeError):
+            CountVectorizer().fit(iter(["string", 1]))
+        with self.assertRaises(ValueError):
+            next(CountVectorizer().itransform(CORPUS, chunksize=0))
+
+
+class TestPartialFit(TestBase):
+    def test_stable_indices(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.partial_fit(CORPUS[:2])
+        indices = dict(vectorizer.indices_)
+        vectorizer.partial_fit(CORPUS[2:])
+        self.assertEqual({word: vectorizer.indices_[word] for word in indices}, indices)
+        self.assertEqual(
+            sorted(vectorizer.indices_.values()), list(range(len(vectorizer.vocab_)))
+        )
+        self.assertGreater(vectorizer.indices_["friends"], max(indices.values()))
+        self.assertEqual(
+            vectorizer.transform(CORPUS[2:])[0][vectorizer.indices_["friends"]], 1
+        )
+
+    def test_idf(self) -> None:
+        expected = TfidfVectorizer()
+        expected.fit(CORPUS)
+        vectorizer = TfidfVectorizer()
+        for sent in CORPUS:
+            vectorizer.partial_fit(sent)
+        self.assertEqual(vectorizer.ndocs_, expected.ndocs_)
+        for word, idx in expected.indices_.items():
+            self.assertAlmostEqual(
+                vectorizer.vidf_[vectorizer.indices_[word]], expected.vidf_[idx]
+            )
+
+    def test_refit(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.partial_fit(CORPUS)
+        vectorizer.fit(CORPUS[:1])
+        self.assertEqual(vectorizer.ndocs_, 1)
+        self.assertNotIn("dog", vectorizer.indices_)
+
+
+class TestEncode(TestBase):
+    def test_encode(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS[:2])
+        ids, offsets = vectorizer.encode(CORPUS)
+        self.assertEqual((ids.typecode, offsets.typecode), ("i", "q"))
+        self.assertEqual(len(offsets), len(CORPUS) + 1)
+        first = [vectorizer.invindices_.get(idx) for idx in ids[: offsets[1]]]
+        self.assertEqual(first, ["the", "cat", "sat", "on", "the", "mat"])
+        self.assertEqual(ids[offsets[2] :].count(-1), 6)
+
+    def test_oov(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS[:2])
+        ids, offsets = vectorizer.encode(CORPUS[2], oov_id=None)
+        self.assertEqual([vectorizer.invindices_[idx] for idx in ids], ["cat", "dog"])
+        self.assertEqual(list(offsets), [0, 2])
+        ids, _ = vectorizer.encode(CORPUS[2], oov_id=len(vectorizer.vocab_))
+        self.assertEqual(ids.count(len(vectorizer.vocab_)), 6)
+
+
+class TestCache(TestBase):
+    def test_cache_info(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS)
+        info = vectorizer.cache_info()
+        self.assertEqual(info.hits + info.misses, 20)
+        self.assertEqual(info.misses, info.currsize)
+        # transform reuses tokens normalized while fitting
+        vectorizer.transform(CORPUS)
+        self.assertEqual(vectorizer.cache_info().misses, info.misses)
+        self.assertEqual(vectorizer.cache_info().hits, info.hits + 20)
+
+    def test_cache_size(self) -> None:
+        expected = CountVectorizer().fit_transform(CORPUS)
+        for size in (0, 3):
+            vectorizer = CountVectorizer(cache_size=size)
+            self.assertEqual(vectorizer.fit_transform(CORPUS), expected)
+            self.assertEqual(vectorizer.cache_info().currsize, size)
+        with self.assertRaises(ValueError):
+            CountVectorizer(cache_size=-1)
+
+    def test_cache_lru(self) -> None:
+        cache = CountVectorizer(cache_size=3).cache_
+        cache.normalize(["a", "b", "c"])
+        cache.normalize(["a"])
+        cache.normalize(["d"])
+        self.assertEqual(list(cache.data), ["c", "a", "d"])
+
+    def test_empty_token(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(["The cat sat .", "The dog ran."], tokenizer=WhitespaceTokenizer)
+        self.assertNotIn("", vectorizer.vocab_)
+
+
+class TestTfidfVectorizer(TestBase):
+    def test_idf(self) -> None:
+        vectorizer = TfidfVectorizer()
+        vectorizer.fit(CORPUS)
+        self.assertEqual(len(vectorizer.vidf_), len(vectorizer.vocab_))
+        self.assertEqual(vectorizer.ndocs_, len(CORPUS))
+        for word, docs in (("the", 2), ("cat", 2), ("mat", 1), ("a", 1)):
+            idx = vectorizer.indices_[word]
+            self.assertEqual(vectorizer.docfreq_[idx], docs)
+            self.assertAlmostEqual(
+                vectorizer.vidf_[idx], 1 + math.log((1 + len(CORPUS)) / (1 + docs))
+            )
+
+    def test_sparse(self) -> None:
+        vectorizer = TfidfVectorizer()
+        dense = vectorizer.fit_transform(CORPUS)
+        sparse = vectorizer.transform(CORPUS, sparse=True)
+        self.assertEqual(sparse.dtype, "d")
+        self._assert_rows(sparse.toarray().tolist(), dense)
+
+    def test_sparse_norm(self) -> None:
+        vectorizer = TfidfVectorizer()
+        sparse = vectorizer.fit_transform(CORPUS, sparse=True, dtype="f", norm="l2")
+        self.assertEqual(sparse.dtype, "f")
+        for row in sparse.toarray().tolist():
+            self.assertAlmostEqual(sum(value * value for value in row), 1.0, places=6)
+
+
+class TestNgrams(TestBase):
+    def test_word_ngrams(self) -> None:
+        vectorizer = CountVectorizer()
+        output = vectorizer.fit_transform(CORPUS, ngram_range=(1, 2))
+        unigrams = CountVectorizer()
+        unigrams.fit(CORPUS)
+        self.assertTrue(set(unigrams.vocab_) < set(vectorizer.vocab_))
+        for bigram in ("the cat", "cat sat", "the mat", "are friends"):
+            self.assertIn(bigram, vectorizer.vocab_)
+        # punctuation is removed before building n-grams
+        self.assertNotIn("mat .", vectorizer.vocab_)
+        self.assertEqual(output[0][vectorizer.indices_["the"]], 2)
+        self.assertEqual(output[0][vectorizer.indices_["sat on"]], 1)
+        self.assertEqual(output[2][vectorizer.indices_["sat on"]], 0)
+        self.assertEqual(vectorizer.docfreq_[vectorizer.indices_["sat on"]], 2)
+
+        bigrams = CountVectorizer()
+        bigrams.fit(CORPUS, ngram_range=(2, 2))
+        self.assertNotIn("cat", bigrams.vocab_)
+        self.assertEqual(
+            bigrams.transform(["the cat sat on the log"])[0][
+                bigrams.indices_["cat sat"]
+            ],
+            1,
+        )
+
+    def test_ngram_name_collision(self) -> None:
+        vectorizer = CountVectorizer()
+        output = vectorizer.fit_transform(
+            ["a b|c", "a|b c"], tokenizer=lambda s: s.split("|"), ngram_range=(1, 2)
+        )
+        self.assertEqual(len(vectorizer.invindices_), len(vectorizer.vocab_))
+        # "a b" + "c" and "a" + "b c" bigrams are the same "a b c" feature
+        self.assertEqual(output[0][vectorizer.indices_["a b c"]], 1)
+        self.assertEqual(output[1][vectorizer.indices_["a b c"]], 1)
+
+    def test_char_ngrams(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(["Cat catalog"], ngram_range=(2, 3), analyzer="char_wb")
+        self.assertEqual(
+            set(vectorizer.vocab_),
+            {" c", "ca", "at", "t ", " ca", "cat", "at "}
+            | {"ta", "al", "lo", "og", "g ", "ata", "tal", "alo", "log", "og "},
+        )
+        output = vectorizer.transform(["cat"])[0]
+        self.assertEqual(output[vectorizer.indices_["at "]], 1)
+        self.assertEqual(sum(output), 7)
+
+    def test_pruning(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS, ngram_range=(1, 2), min_df=2)
+        self.assertEqual(
+            set(vectorizer.vocab_),
+            {"the", "cat", "dog", "sat", "on", "sat on", "on the"},
+        )
+        self.assertEqual(
+            sorted(vectorizer.indices_.values()), list(range(len(vectorizer.vocab_)))
+        )
+        # tokens of pruned n-grams only are forgotten
+        self.assertNotIn("mat", vectorizer.tokids_)
+
+        vectorizer.fit(CORPUS, max_df=0.5)
+        self.assertNotIn("the", vectorizer.vocab_)
+        self.assertIn("mat", vectorizer.vocab_)
+
+        vectorizer.fit(CORPUS, ngram_range=(1, 2), max_features=1)
+        self.assertEqual(set(vectorizer.vocab_), {"the"})
+        with self.assertRaises(ValueError):
+            vectorizer.fit(CORPUS, min_df=1.5)
+
+    def test_partial_fit(self) -> None:
+        expected = TfidfVectorizer()
+        expected.fit(CORPUS, ngram_range=(1, 3))
+        vectorizer = TfidfVectorizer()
+        for sent in CORPUS:
+            vectorizer.partial_fit(sent, ngram_range=(1, 3))
+        self.assertEqual(set(vectorizer.vocab_), set(expected.vocab_))
+        for word, idx in expected.indices_.items():
+            self.assertAlmostEqual(
+                vectorizer.vidf_[vectorizer.indices_[word]], expected.vidf_[idx]
+            )
+        with self.assertRaises(ValueError):
+            vectorizer.partial_fit(CORPUS, ngram_range=(1, 2))
+
+    def test_sparse(self) -> None:
+        vectorizer = TfidfVectorizer()
+        dense = vectorizer.fit_transform(CORPUS, ngram_range=(1, 2), analyzer="word")
+        self._assert_rows(
+            vectorizer.transform(CORPUS, sparse=True).toarray().tolist(), dense
+        )
+        ids, offsets = vectorizer.encode("the cat sat", oov_id=None)
+        self.assertEqual(len(ids), 5)
+
+
+class TestPruning(TestBase):
+    @property
+    def corpus(self) -> List[str]:
+        noise = [f"noise{idx} word{idx % 7}" for idx in range(500)]
+        return [sent for pair in zip(CORPUS * 20, noise) for sent in pair] + noise[60:]
+
+    def test_stopwords(self) -> None:
+        vectorizer = CountVectorizer()
+        vectorizer.fit(CORPUS * 10, ignore_stopwords=False)
+        self.assertEqual(vectorizer.stopwords_, {"the", "on", "a", "and", "are"})
+        self.assertFalse(vectorizer.stopwords_ & vectorizer.vocab_)
+
+    def test_approx(self) -> None:
+        expected = CountVectorizer()
+        expected.fit(self.corpus, min_df=10)
+        vectorizer = CountVectorizer()
+        vectorizer.fit(self.corpus, min_df=10, approx=200)
+        self.assertEqual(vectorizer.vocab_, expected.vocab_)
+        for word, idx in expected.indices_.items():
+            # counts could only be overestimated
+            self.assertGreaterEqual(
+                vectorizer.docfreq_[vectorizer.indices_[word]], expected.docfreq_[idx]
+            )
+
+    def test_approx_top(self) -> None:
+        expected = CountVectorizer()
+        expected.fit(self.corpus, ngram_range=(1, 2), max_features=10)
+        vectorizer = CountVectorizer()
+        vectorizer.fit(self.corpus, ngram_range=(1, 2), max_features=10, approx=100)
+        self.assertEqual(vectorizer.vocab_, expected.vocab_)
+        with self.assertRaises(ValueError):
+            vectorizer.fit(self.corpus, approx=0)
+
+    def test_approx_size(self) -> None:
+        expected = CountVectorizer()
+        expected.fit(self.corpus)
+        vectorizer = CountVectorizer()
+        vectorizer.fit(self.corpus, approx=20)
+        self.assertEqual(len(vectorizer.vocab_), 20)
+        self.assertEqual(len(vectorizer.docfreq_), 20)
+        for word, idx in vectorizer.indices_.items():
+            self.assertGreaterEqual(
+                vectorizer.docfreq_[idx], expected.docfreq_[expected.indices_[word]]
+            )
+
+
+class TestHashingVectorizer(TestBase):
+    def test_counts(self) -> None:
+        # no collisions for such a small corpus, so values are token counts
+        expected = CountVectorizer().fit_transform(CORPUS)
+        sparse = HashingVectorizer(alternate_sign=False).transform(CORPUS)
+        self.assertEqual(sparse.shape, (len(CORPUS), 1 << 20))
+        for row, expected_row in zip(range(len(CORPUS)), expected):
+            self.assertEqual(
+                sorted(sparse[row].data), sorted(cnt for cnt in expected_row if cnt)
+            )
+
+    def test_stateless(self) -> None:
+        vectorizer = HashingVectorizer(n_features=16)
+        sparse = vectorizer.transform(CORPUS)
+        self.assertFalse(vectorizer.vocab_)
+        copy = pickle.loads(pickle.dumps(vectorizer))
+        for other in (copy, HashingVectorizer(n_features=16)):
+            batch = other.transform(CORPUS[1:])
+            self.assertEqual(list(batch.data), list(sparse[1:].data))
+            self.assertEqual(list(batch.indices), list(sparse[1:].indices))
+
+    def test_sign(self) -> None:
+        sparse = HashingVectorizer(n_features=1).transform(CORPUS, dtype="i")
+        signed = HashingVectorizer(n_features=1 << 20).transform(CORPUS, dtype="i")
+        self.assertEqual(
+            sparse.toarray().tolist(),
+            [[sum(signed[row].data)] for row in range(len(CORPUS))],
+        )
+        self.assertTrue(any(value < 0 for value in signed.data))
+
+    def test_options(self) -> None:
+        vectorizer = HashingVectorizer(n_features=64)
+        sparse = vectorizer.fit_transform(CORPUS, ignore_stopwords=False, norm="l2")
+        for row in sparse.toarray().tolist():
+            self.assertAlmostEqual(sum(value * value for value in row), 1.0)
+        self.assertLess(sparse.nnz, vectorizer.fit_transform(CORPUS).nnz)
+        with self.assertRaises(ValueError):
+            vectorizer.transform(CORPUS, sparse=False)
+        with self.assertRaises(ValueError):
+            HashingVectorizer(n_features=0)
+
+
+class TestWord2Vec(TestBase):
+    # all of the pairs every epoch, so epochs losses are comparable
+    exact = {"sample": None, "shrink_window": False}
+
+    def _sentences(self, model: Word2Vec, corpus: List[str]) -> List[np.ndarray]:
+        ids, offsets = model.encode(corpus, oov_id=None)
+        ids = np.asarray(ids, dtype=np.int32)
+        return [ids[offsets[idx] : offsets[idx + 1]] for idx in range(len(corpus))]
+
+    def _pairs(self, sentences: List[np.ndarray], wsize: int) -> List[tuple]:
+        return sorted(
+            (row[i], row[j])
+            for row in sentences
+            for i in range(len(row))
+            for j in range(max(0, i - wsize), min(len(row), i + wsize + 1))
+            if i != j
+        )
+
+    def test_pairs(self) -> None:
+        model = Word2Vec()
+        model.fit(CORPUS, n_iter=0, window_size=2)
+        sentences = self._sentences(model, CORPUS)
+        (centers, contexts, words), *rest = model._ipairs(sentences)
+        self.assertFalse(rest)
+        self.assertEqual((centers.dtype, contexts.dtype), (np.int32, np.int32))
+        self.assertEqual(words, 19)
+        # sentences of 6, 6 and 7 words
+        self.assertEqual(len(centers), 18 + 18 + 22)
+        self.assertEqual(sorted(zip(centers, contexts)), self._pairs(sentences, 2))
+        with self.assertRaises(ValueError):
+            model.fit(CORPUS, window_size=0)
+
+    def test_subsampling(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(CORPUS * 50, n_iter=0, window_size=3)
+        sentences = self._sentences(model, CORPUS * 50)
+        expected = self._pairs(sentences, 3)
+        pairs = [
+            pair
+            for batch in model._ipairs(sentences, batch_size=64, sample=1e-2)
+            for pair in zip(*batch[:2])
+        ]
+        self.assertLess(len(pairs), len(expected) / 2)
+        # "the" (4 of 19 words) is dropped more often than "mat" (1 of 19)
+        the, mat = model.indices_["the"], model.indices_["mat"]
+        centers = [center for center, _ in pairs]
+        self.assertLess(
+            centers.count(the) / model.counts_[the],
+            centers.count(mat) / model.counts_[mat],
+        )
+        with self.assertRaises(ValueError):
+            model.fit(CORPUS, sample=0)
+
+    def test_shrink_window(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(CORPUS * 20, n_iter=0, window_size=3)
+        sentences = self._sentences(model, CORPUS * 20)
+        expected = self._pairs(sentences, 3)
+        centers, contexts, _ = next(model._ipairs(sentences, shrink_window=True))
+        self.assertLess(len(centers), 0.8 * len(expected))
+        self.assertTrue(set(zip(centers, contexts)) <= set(expected))
+
+    def test_step(self) -> None:
+        # one step is the same as the dense one-hot formulation
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(CORPUS, n_iter=0)
+        w1, w2 = model.model_["w1"].copy(), model.model_["w2"].copy()
+        np.random.seed(0)
+        model.fit(CORPUS, n_iter=1, learning_rate=0.1, sample=None, shrink_window=False)
+
+        eye = np.eye(len(model.vocab_))
+        centers, contexts, _ = next(model._ipairs(self._sentences(model, CORPUS)))
+        x, y = eye[centers], eye[contexts]
+        t1 = x @ w1
+        exp = np.exp(t1 @ w2)
+        probs = exp / exp.sum(axis=1, keepdims=True)
+        self.assertAlmostEqual(model.history_[0], -np.sum(np.log(probs) * y))
+        da2 = probs - y
+        np.testing.assert_allclose(model.model_["w2"], w2 - 0.1 * t1.T @ da2)
+        np.testing.assert_allclose(model.model_["w1"], w1 - 0.1 * x.T @ (da2 @ w2.T))
+
+    def test_train(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        output = model.fit_transform(
+            CORPUS, n_iter=20, learning_rate=0.05, **self.exact
+        )
+        self.assertLess(model.history_[-1], model.history_[0])
+        self.assertEqual([row.shape for row in output], [(6, 10), (6, 10), (7, 10)])
+        self.assertAlmostEqual(model.sample("cat").sum(), 1.0)
+
+    def test_batches(self) -> None:
+        model = Word2Vec()
+        model.fit(CORPUS * 3, n_iter=0)
+        sentences = self._sentences(model, CORPUS * 3)
+        batches = list(model._ipairs(iter(sentences), batch_size=7))
+        self.assertTrue(all(len(batch[0]) == 7 for batch in batches[:-1]))
+        self.assertEqual(
+            sorted(pair for batch in batches for pair in zip(*batch[:2])),
+            self._pairs(sentences, 2),
+        )
+        words = [batch[2] for batch in batches]
+        self.assertEqual(words, sorted(words))
+        self.assertEqual(words[-1], 3 * 19)
+        # all pairs of a corpus are never stored at once by default
+        batches = list(model._ipairs(iter(sentences * 200)))
+        self.assertGreater(len(batches), 1)
+        self.assertTrue(
+            all(len(batch[0]) == word2vec.BATCH_SIZE for batch in batches[:-1])
+        )
+        with self.assertRaises(ValueError):
+            model.fit(CORPUS, batch_size=0)
+
+    def test_minibatch(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(
+            CORPUS * 5,
+            n_iter=20,
+            learning_rate=0.05,
+            min_learning_rate=0.001,
+            batch_size=16,
+            **self.exact,
+            objective="negative",
+        )
+        self.assertEqual(len(model.history_), 20)
+        self.assertLess(model.history_[-1], model.history_[0])
+
+    def test_early_stopping(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(CORPUS, n_iter=1000, batch_size=8, tol=0.5, n_iter_no_change=3)
+        self.assertLess(len(model.history_), 1000)
+        self.assertGreaterEqual(len(model.history_), 4)
+        # the last epochs didn't improve the best loss enough
+        best = min(model.history_[:-3])
+        self.assertTrue(all(loss >= best * 0.5 for loss in model.history_[-3:]))
+
+    def test_negative(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(
+            CORPUS * 5,
+            n_iter=30,
+            learning_rate=0.01,
+            objective="negative",
+            **self.exact,
+        )
+        self.assertEqual(model.model_["w2"].shape, (10, len(model.vocab_)))
+        self.assertLess(model.history_[-1], model.history_[0])
+        self.assertAlmostEqual(model.table_[-1], 1.0)
+        # "the" occurs 4 times per corpus copy, "mat" - once
+        the, mat = model.indices_["the"], model.indices_["mat"]
+        self.assertEqual((model.counts_[the], model.counts_[mat]), (20, 5))
+        self.assertAlmostEqual(
+            model.table_[the] - model.table_[the - 1],
+            4**0.75 * (model.table_[mat] - model.table_[mat - 1]),
+        )
+        self.assertAlmostEqual(model.sample("cat").sum(), 1.0)
+
+    def test_hierarchical(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(
+            CORPUS,
+            n_iter=30,
+            learning_rate=0.05,
+            objective="hierarchical",
+            **self.exact,
+        )
+        self.assertLess(model.history_[-1], model.history_[0])
+        points, codes, offsets = model.tree_
+        lengths = np.diff(offsets)
+        self.assertLessEqual(
+            lengths[model.indices_["the"]], lengths[model.indices_["mat"]]
+        )
+        self.assertTrue(np.all(points < len(model.vocab_) - 1))
+        # paths are distinct, so probabilities of all words sum up to 1
+        paths = {
+            tuple(codes[offsets[idx] : offsets[idx + 1]]) for idx in range(len(lengths))
+        }
+        self.assertEqual(len(paths), len(model.vocab_))
+        probs = model.sample("cat")
+        self.assertEqual(probs.shape, (len(model.vocab_),))
+        self.assertAlmostEqual(probs.sum(), 1.0)
+
+    @unittest.skipIf(sgns_update is None, "compiled module is not built")
+    def test_kernels(self) -> None:
+        # pair by pair SGD, the same as the reference implementation
+        def step(w1, w2t, center, targets, labels):
+            loss, hidden, grad = 0.0, w1[center], np.zeros(w1.shape[1])
+            for target, label in zip(targets, labels):
+                score = hidden @ w2t[target]
+                loss += np.logaddexp(0, -score if label else score)
+                g = 0.1 * (label - 1 / (1 + np.exp(-score)))
+                grad += g * w2t[target]
+                w2t[target] += g * hidden
+            w1[center] += grad
+            return loss
+
+        rng = np.random.default_rng(0)
+        w1, w2t = rng.standard_normal((6, 4)), rng.standard_normal((6, 4))
+        centers = np.array([0, 1, 0, 5], dtype=np.int32)
+        contexts = np.array([1, 2, 3, 0], dtype=np.int32)
+        negatives = np.array([[2, 3], [2, 4], [3, 5], [1, 0]], dtype=np.int32)
+
+        e1, e2t, loss = w1.copy(), w2t.copy(), 0.0
+        for center, context, sampled in zip(centers, contexts, negatives):
+            targets = [context] + [idx for idx in sampled if idx != context]
+            loss += step(e1, e2t, center, targets, [1] + [0] * (len(targets) - 1))
+        self.assertAlmostEqual(
+            sgns_update(w1, w2t, centers, contexts, negatives, 0.1), loss
+        )
+        np.testing.assert_allclose(w1, e1)
+        np.testing.assert_allclose(w2t, e2t)
+
+        points = np.array([0, 1, 0, 2], dtype=np.int32)
+        codes = np.array([0, 1, 1, 0], dtype=np.int8)
+        offsets = np.array([0, 1, 2, 3, 4, 4, 4], dtype=np.int64)
+        e1, e2t, loss = w1.copy(), w2t.copy(), 0.0
+        for center, context in zip(centers, contexts):
+            path = slice(offsets[context], offsets[context + 1])
+            loss += step(e1, e2t, center, points[path], 1 - codes[path])
+        self.assertAlmostEqual(
+            hs_update(w1, w2t, centers, contexts, points, codes, offsets, 0.1), loss
+        )
+        np.testing.assert_allclose(w1, e1)
+        np.testing.assert_allclose(w2t, e2t)
+
+        with self.assertRaises(IndexError):
+            sgns_update(w1, w2t, centers, contexts + 3, negatives, 0.1)
+        with self.assertRaises(ValueError):
+            hs_update(w1, w2t, centers, contexts, points, codes, offsets + 1, 0.1)
+
+    @unittest.skipIf(sgns_update is None, "compiled module is not built")
+    def test_single_worker(self) -> None:
+        np.random.seed(0)
+        model = Word2Vec()
+        model.fit(CORPUS * 5, n_iter=20, learning_rate=0.05, objective="negative")
+        self.assertLess(model.history_[-1], model.history_[0])
+        # kernels keep rows of output vectors contiguous
+        self.assertTrue(model.model_["w2"].T.flags.c_contiguous)
+
+    def test_hogwild(self) -> None:
+        for objective in ("negative", "hierarchical"):
+            np.random.seed(0)
+            model = Word2Vec()
+            model.fit(
+                CORPUS * 5,
+                n_iter=20,
+                learning_rate=0.05,
+                objective=objective,
+                batch_size=4,
+                workers=3,
+                **self.exact,
+            )
+            self.assertLess(model.history_[-1], model.history_[0])
+            self.assertEqual(len(model.throughput_), 20)
+            self.assertTrue(all(speed > 0 for speed in model.throughput_))
+            self.assertEqual(model.model_["w2"].shape, (10, len(model.vocab_)))
+            self.assertAlmostEqual(model.sample("cat").sum(), 1.0)
+        with self.assertRaises(ValueError):
+            Word2Vec().fit(CORPUS, workers=2)
+        with mock.patch.object(word2vec, "sgns_update", None):
+            with self.assertWarns(RuntimeWarning):
+                Word2Vec().fit(CORPUS, n_iter=1, objective="negative", workers=2)
+        with self.assertRaises(ValueError):
+            Word2Vec().fit(CORPUS, objective="negative", workers=0)
+
+    def test_objective(self) -> None:
+        with self.assertRaises(ValueError):
+            Word2Vec().fit(CORPUS, objective="nce")
+        with self.assertRaises(ValueError):
+            Word2Vec().fit(CORPUS, objective="negative", negative=0)
 
 
 if __name__ == "__main__":
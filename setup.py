@@ -37,7 +37,9 @@ def generate_extension(path: Path, package: str) -> Exception:
         [
             os.path.join(path, f"core/{module_name}{SOURCE_EXTENSION}"),
             os.path.join(path, f"{module_name}{WRAPPER_EXTENSION}")
-        ]
+        ],
+        # core sources are C++ (.cc), so wrappers have to be compiled as C++ too
+        language="c++"
     )
 
 
@@ -47,6 +49,9 @@ def get_module_name(package: str) -> str:
 
 class BuildPackages(Enum):
     MATH_FUNC = ("agrow.math.func", Path("agrow/math/func"))  # agrow.math.func
+    MATH_LINALG = ("agrow.math.linalg", Path("agrow/math/linalg"))  # agrow.math.linalg
+    TEXT_TOKENIZERS = ("agrow.text.tokenizers", Path("agrow/text/tokenizers"))  # agrow.text.tokenizers
+    TEXT_VECTORIZERS = ("agrow.text.vectorizers", Path("agrow/text/vectorizers"))  # agrow.text.vectorizers
 
     @classmethod
     def values(cls):